@@ -1,9 +1,14 @@
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.db.models import Count
 from django.utils.html import format_html
+from . import exports, search
 from .models import (
-    PersonalInfo, Education, Experience, Skill, Project, 
+    PersonalInfo, Education, Experience, Skill, Technology, Project, 
     Certificate, ContactMessage, SiteSettings
 )
+from .pagination import ESTIMATE, MORE, InvalidCursor, Keyset, estimate_count, supports_ordering
 
 @admin.register(PersonalInfo)
 class PersonalInfoAdmin(admin.ModelAdmin):
@@ -100,10 +105,23 @@ class SkillAdmin(admin.ModelAdmin):
         }),
     )
 
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'slug', 'project_count']
+    search_fields = ['name', 'slug']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(project_total=Count('projects'))
+    
+    def project_count(self, obj):
+        return obj.project_total
+    project_count.short_description = 'Proje Sayısı'
+    project_count.admin_order_field = 'project_total'
+
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ['title', 'category', 'status', 'is_featured', 'created_date', 'order']
-    list_filter = ['category', 'status', 'is_featured', 'created_date']
+    list_filter = ['category', 'status', 'is_featured', 'tech_tags', 'created_date']
     list_editable = ['status', 'is_featured', 'order']
     search_fields = ['title', 'short_description', 'technologies']
     ordering = ['-created_date', '-order']
@@ -155,20 +173,113 @@ class CertificateAdmin(admin.ModelAdmin):
         }),
     )
 
+class KeysetChangeList(ChangeList):
+    """
+    Sayfa numarası yerine ?p=<cursor> ile ilerleyen liste (bkz. core/pagination.py).
+    Derin sayfalar da tek sorguyla okunur; COUNT(*) yerine tahmini sayı
+    gösterilir. NULL olabilen veya hesaplanan bir sütuna göre sıralanınca
+    Django'nun numaralı sayfalamasına dönülür.
+    """
+    keyset = False
+    cursor = next_cursor = None
+
+    def get_results(self, request):
+        ordering = self.queryset.query.order_by or self.model._meta.ordering
+        if not supports_ordering(self.model, ordering):
+            return super().get_results(request)
+        self.keyset = True
+        cursor = request.GET.get(PAGE_VAR) or None
+        keyset = Keyset(self.model, ordering)
+        try:
+            rows, self.next_cursor = keyset.page(self.queryset, self.list_per_page, cursor)
+        except InvalidCursor:
+            raise IncorrectLookupParameters
+        self.cursor = cursor
+        self.result_list = rows
+        self.result_count, self.count_kind = estimate_count(self.queryset)
+        # ChangeList ile aynı kural; toplam sayı da tahminidir
+        self.show_full_result_count = self.model_admin.show_full_result_count
+        self.full_result_count = (
+            estimate_count(self.root_queryset)[0] if self.show_full_result_count else None
+        )
+        self.show_admin_actions = not self.show_full_result_count or bool(self.full_result_count)
+        self.can_show_all = False
+        # Django'nun numaralı sayfa bağlantıları yerine pagination.html cursor bağlantıları gösterir
+        self.multi_page = False
+        self.paginator = None
+
+    @property
+    def first_page_url(self):
+        return self.get_query_string()
+
+    @property
+    def next_page_url(self):
+        return self.get_query_string({PAGE_VAR: self.next_cursor}) if self.next_cursor else None
+
+    @property
+    def count_display(self):
+        if self.count_kind == ESTIMATE:
+            return f'yaklaşık {self.result_count}'
+        if self.count_kind == MORE:
+            return f'{self.result_count}+'
+        return str(self.result_count)
+
+
 @admin.register(ContactMessage)
 class ContactMessageAdmin(admin.ModelAdmin):
-    list_display = ['name', 'email', 'subject', 'is_read', 'created_at']
-    list_filter = ['is_read', 'created_at']
-    list_editable = ['is_read']
+    """
+    Milyonlarca mesajda da hızlı kalacak şekilde: keyset sayfalama, tahmini
+    sayım, FTS araması; tarih hiyerarşisi, filtre sayıları (facets) ve satır
+    içi düzenleme yok (her biri ayrı tam tarama veya satır satır kayıt demek).
+    """
+    list_display = ['name', 'email', 'subject', 'is_read', 'delivery_status', 'created_at']
+    list_filter = ['is_read', 'delivery_status', 'created_at']
+    # Yalnızca FTS5 olmayan veritabanlarında (icontains) kullanılır
     search_fields = ['name', 'email', 'subject', 'message']
+    search_help_text = 'Ad, e-posta, konu ve mesaj içinde kelime (önek) araması'
     ordering = ['-created_at']
-    readonly_fields = ['name', 'email', 'subject', 'message', 'created_at']
-    date_hierarchy = 'created_at'
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+    actions = ['mark_read', 'mark_unread', 'export_csv', 'export_jsonl']
+    readonly_fields = [
+        'name', 'email', 'subject', 'message', 'created_at',
+        'delivery_status', 'delivery_attempts', 'next_attempt_at', 'sent_at', 'last_error',
+    ]
     
     def has_add_permission(self, request):
         # Mesajlar sadece siteden gönderilsin
         return False
     
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+    
+    def get_search_results(self, request, queryset, search_term):
+        if search.is_available():
+            ids = search.message_ids(search_term)
+            if ids is not None:
+                return queryset.filter(pk__in=ids), False
+        return super().get_search_results(request, queryset, search_term)
+    
+    @admin.action(description='Seçili mesajları okundu işaretle')
+    def mark_read(self, request, queryset):
+        # Tek UPDATE; tüm sayfalar seçildiyse filtrelenmiş sorgunun tamamı
+        updated = queryset.filter(is_read=False).update(is_read=True)
+        self.message_user(request, f'{updated} mesaj okundu olarak işaretlendi.')
+    
+    @admin.action(description='Seçili mesajları okunmadı işaretle')
+    def mark_unread(self, request, queryset):
+        updated = queryset.filter(is_read=True).update(is_read=False)
+        self.message_user(request, f'{updated} mesaj okunmadı olarak işaretlendi.')
+    
+    # Tüm sayfalar seçildiğinde filtrelenmiş sorgunun tamamı akış halinde indirilir
+    @admin.action(description='Seçili mesajları CSV olarak indir')
+    def export_csv(self, request, queryset):
+        return exports.streaming_response(queryset, 'csv')
+    
+    @admin.action(description='Seçili mesajları JSONL olarak indir')
+    def export_jsonl(self, request, queryset):
+        return exports.streaming_response(queryset, 'jsonl')
+    
     fieldsets = (
         ('Gönderen Bilgileri', {
             'fields': ('name', 'email', 'created_at')
@@ -179,6 +290,9 @@ class ContactMessageAdmin(admin.ModelAdmin):
         ('Durum', {
             'fields': ('is_read',)
         }),
+        ('E-posta Gönderimi', {
+            'fields': ('delivery_status', 'delivery_attempts', 'next_attempt_at', 'sent_at', 'last_error')
+        }),
     )
 
 @admin.register(SiteSettings)
@@ -0,0 +1,196 @@
+"""
+Salt okunur JSON API.
+
+    /api/                       kaynakların listesi
+    /api/<kaynak>/              kayıtlar
+
+Sorgu parametreleri:
+
+    ?fields=title,slug          yalnızca istenen alanlar
+    ?limit=20                   sayfa boyu (en fazla API_MAX_PAGE_SIZE)
+    ?cursor=...                 önceki yanıttaki "next" adresinden gelir
+
+Sayfalama OFFSET yerine modelin Meta.ordering alanları (ve pk) üzerinde
+anahtar kümesi (keyset) ile yapılır; derin sayfalar da indeksten okunur.
+Yanıtlar modelin (son updated_at, kayıt sayısı) damgasına bağlı ETag taşır
+ve aynı damga için önbellekten sunulur. orjson kuruluysa serileştirme onunla
+yapılır.
+"""
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # isteğe bağlı bağımlılık
+    orjson = None
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.urls import reverse
+from django.views.decorators.http import require_safe
+
+from .caching import conditional_on, get_content_stamps
+from .models import Certificate, Education, Experience, PersonalInfo, Project, Skill
+from .pagination import InvalidCursor, Keyset
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class ApiError(Exception):
+    pass
+
+
+class Resource:
+    """
+    Bir modelin API'de görünen alanları. `fields` API adı -> model alanı
+    eşlemesidir; dosya alanları depolama adresine çevrilir.
+    """
+
+    def __init__(self, name, model, fields):
+        self.name = name
+        self.model = model
+        self.fields = fields
+        self.keyset = Keyset(model)
+        self.file_fields = {
+            api_name for api_name, column in fields.items()
+            if model._meta.get_field(column).get_internal_type() in ('FileField', 'ImageField')
+        }
+
+    def selected_fields(self, param):
+        if not param:
+            return list(self.fields)
+        names = [name.strip() for name in param.split(',') if name.strip()]
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise ApiError(f'Bilinmeyen alan: {", ".join(unknown)}')
+        return names
+
+    def page(self, fields, limit, cursor=None):
+        """(satırlar, sonraki cursor) döndürür; tek sorgu çalışır"""
+        try:
+            rows, next_cursor = self.keyset.page(
+                self.model.objects.all(), limit, cursor,
+                values=[self.fields[name] for name in fields],
+            )
+        except InvalidCursor:
+            raise ApiError('Geçersiz cursor')
+        results = []
+        for row in rows:
+            item = {name: row[self.fields[name]] for name in fields}
+            for name in self.file_fields.intersection(fields):
+                item[name] = default_storage.url(item[name]) if item[name] else None
+            results.append(item)
+        return results, next_cursor
+
+
+RESOURCES = {resource.name: resource for resource in (
+    Resource('personal-info', PersonalInfo, {
+        'id': 'id', 'name': 'name', 'title': 'title', 'bio': 'bio', 'about_text': 'about_text',
+        'birth_year': 'birth_year', 'location': 'location', 'email': 'email', 'phone': 'phone',
+        'linkedin_url': 'linkedin_url', 'github_url': 'github_url',
+        'profile_image': 'profile_image', 'cv_file': 'cv_file', 'updated_at': 'updated_at',
+    }),
+    Resource('education', Education, {
+        'id': 'id', 'degree': 'degree', 'school': 'school', 'department': 'department',
+        'start_year': 'start_year', 'end_year': 'end_year', 'location': 'location',
+        'description': 'description', 'is_current': 'is_current', 'order': 'order',
+        'updated_at': 'updated_at',
+    }),
+    Resource('experience', Experience, {
+        'id': 'id', 'company': 'company', 'position': 'position', 'location': 'location',
+        'start_date': 'start_date', 'end_date': 'end_date', 'is_current': 'is_current',
+        'description': 'description', 'order': 'order', 'updated_at': 'updated_at',
+    }),
+    Resource('skills', Skill, {
+        'id': 'id', 'name': 'name', 'category': 'category', 'level': 'level',
+        'icon_class': 'icon_class', 'description': 'description', 'is_featured': 'is_featured',
+        'order': 'order', 'updated_at': 'updated_at',
+    }),
+    Resource('projects', Project, {
+        'id': 'id', 'title': 'title', 'slug': 'slug', 'category': 'category', 'status': 'status',
+        'short_description': 'short_description', 'description': 'description',
+        'technologies': 'tech_items', 'features': 'feature_items', 'image': 'image',
+        'demo_url': 'demo_url', 'github_url': 'github_url', 'is_featured': 'is_featured',
+        'order': 'order', 'created_date': 'created_date', 'updated_at': 'updated_at',
+    }),
+    Resource('certificates', Certificate, {
+        'id': 'id', 'name': 'name', 'organization': 'organization',
+        'date_received': 'date_received', 'description': 'description',
+        'credential_id': 'credential_id', 'credential_url': 'credential_url',
+        'image': 'image', 'order': 'order', 'updated_at': 'updated_at',
+    }),
+)}
+
+
+def json_response(data, status=200):
+    return HttpResponse(dumps(data), status=status, content_type='application/json')
+
+
+@require_safe
+def index(request):
+    return json_response({
+        name: request.build_absolute_uri(reverse('core:api_list', kwargs={'resource': name}))
+        for name in RESOURCES
+    })
+
+
+def _limit(request):
+    default = _setting('API_PAGE_SIZE', 20)
+    try:
+        limit = int(request.GET.get('limit', default))
+    except ValueError:
+        raise ApiError('limit bir sayı olmalı')
+    return max(1, min(limit, _setting('API_MAX_PAGE_SIZE', 100)))
+
+
+def _cached_body(resource, request):
+    """
+    Yanıt gövdesi modelin damgası ve tam sorgu ile önbelleğe alınır; model
+    değişince damga, dolayısıyla anahtar değişir.
+    """
+    stamp = get_content_stamps()[resource.model._meta.label]
+    raw = f'{resource.name}:{stamp[0]}:{stamp[1]}:{request.GET.urlencode()}'
+    key = f'core:api:{hashlib.md5(raw.encode()).hexdigest()}'
+    body = cache.get(key)
+    if body is None:
+        fields = resource.selected_fields(request.GET.get('fields'))
+        results, cursor = resource.page(fields, _limit(request), request.GET.get('cursor'))
+        next_url = None
+        if cursor:
+            query = request.GET.copy()
+            query['cursor'] = cursor
+            next_url = request.build_absolute_uri(f'{request.path}?{query.urlencode()}')
+        body = dumps({'results': results, 'next': next_url})
+        cache.set(key, body, timeout=_setting('API_CACHE_TIMEOUT', 3600))
+    return body
+
+
+@require_safe
+def resource_list(request, resource):
+    resource = RESOURCES.get(resource)
+    if resource is None:
+        return json_response({'message': 'Kaynak bulunamadı.'}, status=404)
+
+    def view(request):
+        try:
+            body = _cached_body(resource, request)
+        except ApiError as error:
+            return json_response({'message': str(error)}, status=400)
+        return HttpResponse(body, content_type='application/json')
+
+    return conditional_on((resource.model,))(view)(request)
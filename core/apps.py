@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .caching import check_shared_cache
+        from .vendor import check_vendored
+
+        checks.register(check_shared_cache, checks.Tags.caches)
+        checks.register(check_vendored, checks.Tags.staticfiles, deploy=True)
@@ -0,0 +1,357 @@
+"""
+CSS/JS paketleme.
+
+STATIC_BUNDLES ayarındaki her paket, kaynak dosyalarının küçültülüp
+birleştirilmesiyle STATIC_BUNDLE_ROOT altına yazılır ve yanına bir
+kaynak haritası (source map v3) eklenir. BundleFinder paketleri
+staticfiles bulucusu olarak sunar; böylece:
+
+* geliştirmede (DEBUG) `{% static 'bundles/base.css' %}` kaynaklar
+  değiştikçe yeniden üretilen paketi döndürür,
+* `collectstatic` paketleri toplar ve ManifestStaticFilesStorage dosya
+  adına içerik özeti ekler (base.3f2a9c1b7d4e.css). Özetli dosyalar
+  sunucuda bir yıllık önbellekle yayınlanabilir:
+
+      location /static/ {
+          add_header Cache-Control "public, max-age=31536000, immutable";
+      }
+
+Küçültme satır bazlıdır: yorumlar, girinti ve boş satırlar atılır, CSS
+satırlarında noktalama çevresindeki boşluklar silinir. Her çıktı satırı tek
+bir kaynak satırından geldiği için kaynak haritası satır düzeyinde kesindir.
+
+Şablonlardaki sayfaya özel <style>/<script> blokları `{% asset %}`
+etiketiyle işaretlenir (core/templatetags/assets.py). Bloklar aynı bulucu
+tarafından ayrı dosyalar olarak üretilir ve HTML'de yalnızca bağlantıları
+kalır; istenirse ekranın üst kısmına ait kurallar (kritik CSS) satır içinde
+bırakılır.
+"""
+import json
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.template import Template, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.base import Origin
+from django.contrib.staticfiles import finders
+from django.core.files.storage import FileSystemStorage
+from django.utils.functional import cached_property
+
+B64_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+CSS_COLON = re.compile(r':\s+')
+
+
+def encode_vlq(value):
+    """Kaynak haritası için base64 VLQ kodlaması"""
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    encoded = ''
+    while True:
+        digit = value & 0b11111
+        value >>= 5
+        if value:
+            digit |= 0b100000
+        encoded += B64_CHARS[digit]
+        if not value:
+            return encoded
+
+
+def _strip_block_comments(line, in_comment):
+    """Satırdaki /* ... */ yorumlarını siler; yorumun satır sonunda açık kalıp kalmadığını döndürür"""
+    result = ''
+    position = 0
+    while position < len(line):
+        if in_comment:
+            end = line.find('*/', position)
+            if end == -1:
+                return result, True
+            position = end + 2
+            in_comment = False
+        else:
+            start = line.find('/*', position)
+            if start == -1:
+                result += line[position:]
+                break
+            result += line[position:start]
+            position = start + 2
+            in_comment = True
+    return result, in_comment
+
+
+def minify_css_lines(lines):
+    """(kaynak satır no, küçültülmüş satır) çiftleri üretir"""
+    in_comment = False
+    for number, line in enumerate(lines):
+        line, in_comment = _strip_block_comments(line, in_comment)
+        line = CSS_PUNCTUATION.sub(r'\1', line.strip())
+        # "a :hover" seçicisinin anlamı değişmesin diye yalnızca iki noktanın sağı sıkıştırılır
+        line = CSS_COLON.sub(':', line)
+        line = line.replace(';}', '}')
+        if line:
+            yield number, line
+
+
+def minify_js_lines(lines):
+    """
+    (kaynak satır no, küçültülmüş satır) çiftleri üretir. Yalnızca tüm satırı
+    kaplayan yorumlar silinir; çok satırlı şablon dizgilerinin (`...`)
+    içindeki satırlara dokunulmaz.
+    """
+    in_template = False
+    in_comment = False
+    for number, raw in enumerate(lines):
+        if in_template:
+            yield number, raw.rstrip('\n')
+            in_template = raw.count('`') % 2 == 0
+            continue
+
+        line = raw.strip()
+        if in_comment:
+            if '*/' in line:
+                in_comment = False
+                line = line.split('*/', 1)[1].strip()
+            else:
+                continue
+        if line.startswith('/*') and '`' not in line:
+            if '*/' not in line:
+                in_comment = True
+                continue
+            line = line.split('*/', 1)[1].strip()
+        if not line or line.startswith('//'):
+            continue
+        yield number, line
+        in_template = line.count('`') % 2 == 1
+
+
+MINIFIERS = {'.css': minify_css_lines, '.js': minify_js_lines}
+
+
+def bundle_root():
+    return Path(getattr(settings, 'STATIC_BUNDLE_ROOT', Path(settings.BASE_DIR) / 'build' / 'static'))
+
+
+def get_bundles():
+    return getattr(settings, 'STATIC_BUNDLES', {})
+
+
+def source_paths(name):
+    """Paketteki kaynak dosyaların mutlak yolları"""
+    paths = []
+    for source in get_bundles()[name]:
+        path = finders.find(source)
+        if path is None:
+            raise FileNotFoundError(f'{name} paketinin kaynağı bulunamadı: {source}')
+        paths.append(Path(path))
+    return paths
+
+
+def write_bundle(target, sources, embed_sources=False):
+    """
+    (kaynak adı, satırlar) listesini küçültüp target'a yazar ve yanına kaynak
+    haritasını ekler. embed_sources ile kaynak metni haritaya gömülür;
+    STATIC_URL altında sunulmayan kaynaklar (şablonlar) için kullanılır.
+    """
+    extension = target.suffix
+    minify = MINIFIERS[extension]
+    output = []
+    mappings = []
+    previous = [0, 0, 0]  # kaynak indeksi, satır, sütun
+    for index, (_, lines) in enumerate(sources):
+        for number, line in minify(lines):
+            column = len(lines[number]) - len(lines[number].lstrip())
+            segment = [index - previous[0], number - previous[1], column - previous[2]]
+            mappings.append(encode_vlq(0) + ''.join(encode_vlq(value) for value in segment))
+            previous = [index, number, column]
+            output.append(line)
+        if extension == '.js':
+            # Noktalı virgülsüz biten dosyalar bir sonrakiyle birleşmesin
+            output.append(';')
+            mappings.append('')
+
+    map_name = target.name + '.map'
+    if extension == '.css':
+        output.append(f'/*# sourceMappingURL={map_name} */')
+    else:
+        output.append(f'//# sourceMappingURL={map_name}')
+
+    source_map = {
+        'version': 3,
+        'file': target.name,
+        'sources': [name for name, _ in sources],
+        'names': [],
+        'mappings': ';'.join(mappings),
+    }
+    if embed_sources:
+        source_map['sourcesContent'] = ['\n'.join(lines) for _, lines in sources]
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text('\n'.join(output) + '\n', encoding='utf-8')
+    target.with_name(map_name).write_text(json.dumps(source_map), encoding='utf-8')
+    return target
+
+
+def is_stale(target, sources):
+    return not target.exists() or any(
+        source.stat().st_mtime > target.stat().st_mtime for source in sources
+    )
+
+
+def build_bundle(name, force=False):
+    """
+    Paketi ve kaynak haritasını yazar; kaynaklar değişmediyse ve force
+    verilmediyse mevcut dosyaya dokunmaz. Paketin yolunu döndürür.
+    """
+    target = bundle_root() / name
+    paths = source_paths(name)
+    if not force and not is_stale(target, paths):
+        return target
+
+    # Kaynaklar STATIC_URL altında sunulduğu için paketin dizinine göre göreli yazılır
+    up = '../' * name.count('/')
+    sources = [
+        (up + source, path.read_text(encoding='utf-8').splitlines())
+        for source, path in zip(get_bundles()[name], paths)
+    ]
+    return write_bundle(target, sources)
+
+
+class TemplateAsset:
+    """Bir şablondaki {% asset %} bloğunun içeriği"""
+
+    def __init__(self, name, text, critical=(), template_name=None, path=None, lineno=1):
+        self.name = name
+        self.critical = tuple(critical)
+        self.template_name = template_name
+        self.path = Path(path) if path else None
+        lines = text.split('\n')
+        # <style>/<script> sarmalayıcısı atılır; satır numaraları korunur
+        content = [index for index, line in enumerate(lines) if line.strip()]
+        if content:
+            lines[content[0]] = re.sub(r'^\s*<(style|script)[^>]*>', '', lines[content[0]])
+            lines[content[-1]] = re.sub(r'</(style|script)>\s*$', '', lines[content[-1]])
+        # Kaynak haritası şablondaki satırları göstersin diye baştaki satırlar boş bırakılır
+        self.lines = [''] * (lineno - 1) + lines
+
+    @property
+    def size(self):
+        return len('\n'.join(self.lines).strip().encode('utf-8'))
+
+    @cached_property
+    def critical_css(self):
+        if not self.critical:
+            return ''
+        return critical_css('\n'.join(self.lines), self.critical)
+
+    def build(self, force=False):
+        target = bundle_root() / self.name
+        if not force and self.path and not is_stale(target, [self.path]):
+            return target
+        return write_bundle(target, [(self.template_name or self.name, self.lines)], embed_sources=True)
+
+
+def _css_blocks(css):
+    """Yorumları atılmış CSS'in üst düzey (başlık, gövde) bloklarını üretir"""
+    position = 0
+    while True:
+        start = css.find('{', position)
+        if start == -1:
+            return
+        depth = 1
+        end = start + 1
+        while depth and end < len(css):
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        # Başlıktan önceki noktalı virgülle biten deyimler (@import vb.) atlanır
+        prelude = css[position:start].rsplit(';', 1)[-1].strip()
+        yield prelude, css[start + 1:end - 1]
+        position = end
+
+
+def critical_css(css, classes):
+    """
+    Seçicisinde verilen sınıflardan biri geçen kuralları döndürür. @media ve
+    @supports blokları içindeki kurallar aynı koşulla sarılarak korunur.
+    """
+    css, _ = _strip_block_comments(css, False)
+    names = '|'.join(re.escape(name.lstrip('.')) for name in classes)
+    pattern = re.compile(rf'\.(?:{names})(?![\w-])')
+    rules = []
+    for prelude, body in _css_blocks(css):
+        if prelude.startswith(('@media', '@supports')):
+            inner = critical_css(body, classes)
+            if inner:
+                rules.append(f'{prelude}{{\n{inner}\n}}')
+        elif not prelude.startswith('@') and pattern.search(prelude):
+            rules.append(f'{prelude}{{{body}}}')
+    return '\n'.join(line for _, line in minify_css_lines('\n'.join(rules).split('\n')))
+
+
+def template_dirs():
+    dirs = []
+    for engine in engines.all():
+        if isinstance(engine, DjangoTemplates):
+            # Uygulama dizinleri (APP_DIRS) dahil
+            dirs.extend(engine.template_dirs)
+    return list(dict.fromkeys(Path(directory) for directory in dirs))
+
+
+def template_assets():
+    """Şablonlardaki {% asset %} bloklarını {dosya adı: TemplateAsset} olarak döndürür"""
+    from core.templatetags.assets import AssetNode
+
+    engine = next(
+        engine.engine for engine in engines.all() if isinstance(engine, DjangoTemplates)
+    )
+    found = {}
+    for directory in template_dirs():
+        for path in sorted(directory.rglob('*.html')):
+            text = path.read_text(encoding='utf-8')
+            if '{% asset ' not in text:
+                continue
+            name = path.relative_to(directory).as_posix()
+            template = Template(text, origin=Origin(str(path), name), engine=engine)
+            for node in template.nodelist.get_nodes_by_type(AssetNode):
+                node.asset.path = path
+                found.setdefault(node.asset.name, node.asset)
+    return found
+
+
+def build_asset(name, force=False):
+    """Paketi veya şablon varlığını üretir; bilinmeyen adlarda None döner"""
+    if name in get_bundles():
+        return build_bundle(name, force=force)
+    asset = template_assets().get(name)
+    if asset is not None:
+        return asset.build(force=force)
+    return None
+
+
+def build_all(force=False):
+    targets = [build_bundle(name, force=force) for name in get_bundles()]
+    targets += [asset.build(force=force) for asset in template_assets().values()]
+    return targets
+
+
+class BundleFinder(finders.BaseFinder):
+    """Paketleri ve şablonlardan çıkarılan varlıkları staticfiles bulucusu olarak sunar"""
+
+    @cached_property
+    def storage(self):
+        return FileSystemStorage(location=bundle_root())
+
+    def find(self, path, find_all=False, **kwargs):
+        name = path[:-4] if path.endswith('.map') else path
+        if not name.endswith(tuple(MINIFIERS)) or build_asset(name) is None:
+            # Django'nun kendi bulucuları gibi eşleşme yoksa boş liste döner
+            return []
+        match = str(bundle_root() / path)
+        return [match] if find_all else match
+
+    def list(self, ignore_patterns):
+        for target in build_all():
+            name = target.relative_to(bundle_root()).as_posix()
+            yield name, self.storage
+            yield name + '.map', self.storage
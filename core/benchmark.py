@@ -0,0 +1,465 @@
+"""
+Yük ve performans ölçümü (bkz. `manage.py benchmark`).
+
+Her ölçek (10, 1k, 100k ...) için ayrı bir SQLite dosyasına sentetik veri
+yazılır: ölçek kadar Project, Skill ve ContactMessage ile birkaç eğitim,
+deneyim ve sertifika. core/urls.py'deki her adres önce test istemcisiyle
+(süreç içi, tek iş parçacığı), sonra gerçek bir WSGI sunucusuna eşzamanlı
+HTTP istekleriyle çağrılır. Sorgu sayısı ve süreleri yanıtlardaki
+Server-Timing başlığından (core/instrumentation.py) okunur.
+
+İlk istek soğuk önbellekle yapılır ve ayrıca raporlanır; yüzdelikler geri
+kalan isteklerden hesaplanır. Ölçümler paylaşılan bir önbellek (Redis vb.)
+yerine süreç içi önbellekle çalıştırılmalıdır.
+
+'contention' kipinde okuma adresleri, iletişim formuna arka planda sürekli
+yazılırken ölçülür; sayfa önbellekleri kapalıdır, her okuma veritabanına
+gider. Ölçüm iki kez yapılır: Django'nun varsayılan SQLite ayarlarıyla
+('default') ve settings.DATABASES'teki üretim profiliyle ('tuned').
+"""
+import itertools
+import json
+import random
+import re
+import socketserver
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, timedelta
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection, connections, transaction
+from django.test import Client
+from django.urls import URLPattern, reverse
+
+from . import search
+from .caching import get_project_page
+from .models import (
+    Certificate, ContactMessage, Education, Experience, PersonalInfo, Project,
+    Skill, SiteSettings, Technology, split_features, technology_slug,
+)
+
+TECHNOLOGIES = (
+    'Python', 'Django', 'C#', 'ASP.NET Core', 'JavaScript', 'TypeScript', 'React',
+    'Vue.js', 'Node.js', 'PostgreSQL', 'MSSQL', 'SQLite', 'Redis', 'Docker',
+    'Celery', 'REST API', 'GraphQL', 'Entity Framework', 'WPF', 'Flutter',
+)
+STAFF_USERNAME = 'benchmark'
+# Yönetici oturumuyla çağrılan adresler
+STAFF_ONLY = {'contact_stats', 'metrics'}
+SERVER_TIMING = re.compile(r'(\w+)((?:;[^,]*)*)')
+QUERY_COUNT = re.compile(r'desc="(\d+) sorgu"')
+
+
+def parse_scale(value):
+    """'10' -> 10, '1k' -> 1000, '100k' -> 100000, '1m' -> 1000000"""
+    match = re.fullmatch(r'(\d+)([km]?)', value.strip().lower())
+    if not match:
+        raise ValueError(f'Geçersiz ölçek: {value}')
+    return int(match.group(1)) * {'': 1, 'k': 1000, 'm': 1000000}[match.group(2)]
+
+
+# Sentetik veri
+
+def seed(size, batch_size=1000, rng=None):
+    """
+    Boş bir veritabanına sentetik veri yazar ve model başına kayıt sayısını
+    döndürür. Toplu eklemeler sinyal çalıştırmadığından teknoloji etiketleri
+    ve arama indeksi ayrıca doldurulur.
+    """
+    rng = rng or random.Random(size)
+    today = date.today()
+
+    with transaction.atomic():
+        PersonalInfo.objects.create(
+            name='Okan Kantar', title='Yazılım Takım Lideri', bio='Sentetik veri',
+            about_text='Sentetik veri', email='okan@example.com', location='Ankara',
+        )
+        SiteSettings.objects.create(site_description='Sentetik veri', hero_description='Sentetik veri')
+        Education.objects.bulk_create(
+            Education(
+                degree='lisans', school=f'Üniversite {i}', department=f'Bölüm {i}',
+                start_year=2000 + i % 20, end_year=2004 + i % 20, location='Ankara', order=i,
+            )
+            for i in range(min(size, 10))
+        )
+        Experience.objects.bulk_create(
+            Experience(
+                company=f'Şirket {i}', position='Geliştirici', location='Ankara',
+                start_date=today - timedelta(days=365 * (i + 1)), description='Sentetik veri', order=i,
+            )
+            for i in range(min(size, 20))
+        )
+        Certificate.objects.bulk_create(
+            Certificate(
+                name=f'Sertifika {i}', organization=f'Kurum {i % 5}',
+                date_received=today - timedelta(days=30 * i), order=i,
+            )
+            for i in range(min(size, 20))
+        )
+
+        categories = [code for code, name in Skill.CATEGORY_CHOICES]
+        Skill.objects.bulk_create((
+            Skill(
+                name=f'Yetenek {i}', category=categories[i % len(categories)],
+                level=rng.randint(10, 100), icon_class='fas fa-code', is_featured=i < 6, order=i,
+            )
+            for i in range(size)
+        ), batch_size=batch_size)
+
+        Technology.objects.bulk_create(
+            [Technology(name=name, slug=technology_slug(name)) for name in TECHNOLOGIES],
+            ignore_conflicts=True,
+        )
+        tech_ids = dict(Technology.objects.values_list('name', 'id'))
+        project_categories = [code for code, name in Project.CATEGORY_CHOICES]
+        project_techs = {}
+        projects = []
+        for i in range(size):
+            techs = rng.sample(TECHNOLOGIES, 4)
+            features = '\n'.join(f'Özellik {n}' for n in range(rng.randint(2, 6)))
+            project_techs[f'proje-{i}'] = techs
+            projects.append(Project(
+                title=f'Proje {i}', slug=f'proje-{i}',
+                category=project_categories[i % len(project_categories)],
+                short_description='Sentetik proje', description='Sentetik proje açıklaması ' * 10,
+                technologies=', '.join(techs), tech_items=techs,
+                features=features, feature_items=split_features(features),
+                is_featured=i < 3, order=i % 50,
+            ))
+        Project.objects.bulk_create(projects, batch_size=batch_size)
+        Through = Project.tech_tags.through
+        Through.objects.bulk_create((
+            Through(project_id=project_id, technology_id=tech_ids[name])
+            for project_id, slug in Project.objects.values_list('id', 'slug').iterator()
+            for name in project_techs[slug]
+        ), batch_size=batch_size)
+
+        ContactMessage.objects.bulk_create((
+            ContactMessage(
+                name=f'Ziyaretçi {i}', email=f'ziyaretci{i}@example.com', subject=f'Konu {i}',
+                message='Sentetik mesaj ' * 5, is_read=i % 3 == 0,
+                delivery_status=ContactMessage.DELIVERY_SENT,
+            )
+            for i in range(size)
+        ), batch_size=batch_size)
+
+    if search.is_available():
+        search.create_table()
+        search.rebuild()
+        search.create_table(table=search.MESSAGE_TABLE)
+        search.rebuild_messages()
+    return counts()
+
+
+def counts():
+    return {
+        model._meta.label: model.objects.count()
+        for model in (Project, Skill, ContactMessage, Technology, Education, Experience, Certificate)
+    }
+
+
+# Ölçülecek adresler
+
+class Target:
+    def __init__(self, name, path, method='GET', data=None, staff=False):
+        self.name = name
+        self.path = path
+        self.method = method
+        self.data = data
+        self.staff = staff
+
+
+def targets():
+    """core/urls.py'deki her adres için bir istek; parametreler veriden seçilir"""
+    from . import api, urls
+
+    project = Project.objects.order_by().values_list('slug', flat=True).first()
+    result = []
+    for pattern in urls.urlpatterns:
+        if not isinstance(pattern, URLPattern):
+            continue
+        name = pattern.name
+        view = f'{urls.app_name}:{name}'
+        if name == 'project_detail':
+            if project:
+                result.append(Target(name, reverse(view, kwargs={'slug': project})))
+        elif name == 'projects_more':
+            cursor = get_project_page(limit=getattr(settings, 'PROJECTS_PAGE_SIZE', 12))[1]
+            if cursor:
+                result.append(Target(name, reverse(view, kwargs={'cursor': cursor})))
+        elif name == 'api_list':
+            for resource in api.RESOURCES:
+                result.append(Target(f'{name}:{resource}', reverse(view, kwargs={'resource': resource})))
+        elif name == 'search':
+            result.append(Target(name, f'{reverse(view)}?q=django'))
+        elif name == 'contact_submit':
+            result.append(Target(name, reverse(view), method='POST', data={
+                'name': 'Ölçüm', 'email': 'olcum@example.com', 'subject': 'Ölçüm', 'message': 'Mesaj',
+            }))
+        else:
+            result.append(Target(name, reverse(view), staff=name in STAFF_ONLY))
+    return result
+
+
+def _payload(target, counter):
+    # Tekrar engellemesine takılmamak için her gönderim farklıdır
+    data = dict(target.data, message=f"{target.data['message']} {next(counter)}")
+    return json.dumps(data).encode()
+
+
+def _server_timing(header):
+    timing = {}
+    for name, params in SERVER_TIMING.findall(header or ''):
+        duration = re.search(r'dur=([\d.]+)', params)
+        timing[name] = float(duration.group(1)) if duration else None
+        count = QUERY_COUNT.search(params)
+        if count:
+            timing['queries'] = int(count.group(1))
+    return timing
+
+
+# İstemciler
+
+def client_sender(staff_user=None):
+    """Süreç içi test istemcisi; (durum, Server-Timing) döndüren fonksiyon"""
+    anonymous = Client()
+    staff = Client()
+    if staff_user is not None:
+        staff.force_login(staff_user)
+    counter = itertools.count()
+
+    def send(target):
+        client = staff if target.staff else anonymous
+        if target.method == 'POST':
+            response = client.post(target.path, _payload(target, counter), content_type='application/json')
+        else:
+            response = client.get(target.path)
+        return response.status_code, response.get('Server-Timing')
+    return send
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class _PooledWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    """
+    İstekler sabit sayıda iş parçacığında işlenir (gunicorn gthread gibi);
+    böylece CONN_MAX_AGE ile açık kalan bağlantılar yeniden kullanılır.
+    Kapanışta her iş parçacığı kendi bağlantılarını kapatır; açık kalan bir
+    bağlantı sonraki profilin PRAGMA'larını (journal_mode) kilitler.
+    """
+    pool = None
+    workers = 0
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        # Engel, görevlerin her birinin ayrı bir iş parçacığında çalışmasını sağlar
+        barrier = threading.Barrier(self.workers)
+
+        def close_connections():
+            try:
+                barrier.wait(timeout=10)
+            except threading.BrokenBarrierError:
+                pass
+            finally:
+                connections.close_all()
+
+        for _ in range(self.workers):
+            self.pool.submit(close_connections)
+        self.pool.shutdown()
+
+
+@contextmanager
+def wsgi_server(workers=8):
+    """Projenin WSGI uygulamasını rastgele bir portta çalıştırır; taban adresi verir"""
+    server = make_server(
+        '127.0.0.1', 0, WSGIHandler(),
+        server_class=_PooledWSGIServer, handler_class=_QuietHandler,
+    )
+    server.pool = ThreadPoolExecutor(max_workers=workers)
+    server.workers = workers
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def http_sender(base_url, staff_user=None):
+    """Gerçek HTTP istekleri; yönetici adresleri için oturum çerezi kullanılır"""
+    cookie = None
+    if staff_user is not None:
+        client = Client()
+        client.force_login(staff_user)
+        cookie = f'sessionid={client.cookies["sessionid"].value}'
+    counter = itertools.count()
+
+    def send(target):
+        request = urllib.request.Request(base_url + target.path, method=target.method)
+        if target.method == 'POST':
+            request.data = _payload(target, counter)
+            request.add_header('Content-Type', 'application/json')
+        if target.staff and cookie:
+            request.add_header('Cookie', cookie)
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+                return response.status, response.headers.get('Server-Timing')
+        except urllib.error.HTTPError as error:
+            error.read()
+            return error.code, error.headers.get('Server-Timing')
+    return send
+
+
+# Ölçüm
+
+def _percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def measure(send, target, requests, concurrency=1):
+    """
+    Hedefe `requests` istek gönderir. İlki soğuk önbellekle tek başına
+    gönderilir; kalanlar `concurrency` iş parçacığıyla.
+    """
+    def timed(_):
+        start = time.perf_counter()
+        status, header = send(target)
+        return (time.perf_counter() - start) * 1000, status, _server_timing(header)
+
+    first = timed(None)
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(timed, range(requests - 1)))
+    else:
+        samples = [timed(None) for _ in range(requests - 1)]
+    elapsed = time.perf_counter() - started
+
+    latencies = [latency for latency, status, timing in samples]
+    queries = [timing['queries'] for latency, status, timing in samples if 'queries' in timing]
+    db = [timing['db'] for latency, status, timing in samples if timing.get('db') is not None]
+    template = [timing['tpl'] for latency, status, timing in samples if timing.get('tpl') is not None]
+    return {
+        'path': target.path,
+        'method': target.method,
+        'statuses': sorted({status for latency, status, timing in [first, *samples]}),
+        'requests': requests,
+        'first_ms': round(first[0], 2),
+        'first_queries': first[2].get('queries'),
+        'throughput_rps': round(len(samples) / elapsed, 1) if samples and elapsed else None,
+        'p50_ms': _round(_percentile(latencies, 0.5)),
+        'p99_ms': _round(_percentile(latencies, 0.99)),
+        'queries_per_request': _round(statistics.mean(queries)) if queries else None,
+        'db_ms': _round(statistics.mean(db)) if db else None,
+        'template_ms': _round(statistics.mean(template)) if template else None,
+    }
+
+
+def _round(value):
+    return round(value, 2) if value is not None else None
+
+
+# Yazma yükü altında okuma
+
+# Karşılaştırma için Django'nun varsayılan SQLite ayarları: geri alma
+# günlüğü, istek başına yeni bağlantı, 5 sn meşgul bekleme
+SQLITE_DEFAULT_PROFILE = {
+    'CONN_MAX_AGE': 0,
+    'CONN_HEALTH_CHECKS': False,
+    'OPTIONS': {'init_command': 'PRAGMA journal_mode=DELETE'},
+}
+
+
+@contextmanager
+def database_profile(profile):
+    """
+    Varsayılan bağlantı ayarlarını geçici olarak değiştirir. settings_dict
+    paylaşıldığından sunucu iş parçacıklarının açacağı bağlantılar da etkilenir.
+    """
+    connections.close_all()
+    saved = {key: connection.settings_dict[key] for key in profile}
+    connection.settings_dict.update(profile)
+    try:
+        yield
+    finally:
+        connections.close_all()
+        connection.settings_dict.update(saved)
+
+
+@contextmanager
+def write_load(base_url, target, writers):
+    """
+    İletişim formuna `writers` iş parçacığıyla durmadan gönderim yapar. Görünüm
+    hataları yakalayıp success=false döndürdüğünden sonuç gövdeden okunur.
+    Verilen sözlük çıkışta doldurulur.
+    """
+    stop = threading.Event()
+    lock = threading.Lock()
+    counter = itertools.count()
+    latencies = []
+    failed = 0
+
+    def run():
+        nonlocal failed
+        while not stop.is_set():
+            request = urllib.request.Request(base_url + target.path, data=_payload(target, counter), method='POST')
+            request.add_header('Content-Type', 'application/json')
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    ok = json.load(response).get('success') is True
+            except (OSError, ValueError):
+                ok = False
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+                failed += not ok
+
+    result = {}
+    threads = [threading.Thread(target=run, daemon=True) for _ in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    try:
+        yield result
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        result.update({
+            'writers': writers,
+            'writes': len(latencies),
+            'failed': failed,
+            'writes_rps': round(len(latencies) / elapsed, 1) if elapsed else None,
+            'p50_ms': _round(_percentile(latencies, 0.5)),
+            'p99_ms': _round(_percentile(latencies, 0.99)),
+        })
+
+
+def compare(previous, current):
+    """İki sonuç dosyası arasındaki p50 ve sorgu farkları; (mod, ad, önceki, şimdiki) satırları"""
+    rows = []
+    for mode, results in current.get('results', {}).items():
+        for name, result in results.items():
+            before = previous.get('results', {}).get(mode, {}).get(name)
+            if before:
+                rows.append((mode, name, before, result))
+    return rows
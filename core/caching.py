@@ -0,0 +1,441 @@
+"""
+Site geneli önbellek katmanı.
+
+Veriler paylaşılan Django önbelleğinde sürüm numarasıyla anahtarlanarak
+tutulur. Bir model kaydedildiğinde ilgili sürüm sayacı artırılır; eski
+anahtarlar bir daha okunmaz ve önbelleğin LRU temizliğiyle silinir.
+Tekil kayıtlar (PersonalInfo, SiteSettings) ayrıca süreç içinde de
+saklanır, böylece sıcak yolda veritabanına hiç gidilmez.
+
+Veriler süreç içi önbellekte durabilir, ama sürüm sayaçları ve kategori
+sayıları tüm süreçlerin ortak gördüğü bir önbellekte (SHARED_CACHE_ALIAS,
+varsayılan dosya tabanlı 'shared') tutulmalıdır. Aksi halde başka bir
+sunucu sürecinde veya yönetim komutunda (import_cv,
+generate_image_derivatives) yapılan değişiklik bu süreçteki sayfaları
+geçersiz kılmaz. Bu önbelleğin incr işlemi atomik olmalıdır; aynı anda
+yapılan iki artırım aynı sürümü yazarsa eski veri yeni sürümde kalır.
+Django'nun FileBasedCache'i bunu sağlamadığından tek sunucuda kilitli
+SharedFileBasedCache, birden fazla sunucuda Redis veya Memcached
+kullanılır (sistem denetimi core.E001).
+
+Yetenekler tek sorguyla çekilip kategorilere Python tarafında ayrılır.
+Proje listesi anahtar kümesi ile sayfalanır ve her sayfa ayrı önbelleğe
+alınır. Kategori sayıları da önbellekte tutulur ve Project
+kaydedildiğinde baştan hesaplanmak yerine artırılıp azaltılır. Sayılar
+PROJECT_CATEGORY_COUNT_TIMEOUT sonunda yeniden hesaplanır; sinyal
+çalıştırmayan yazımların (QuerySet.update) bıraktığı hata kalıcı olmaz.
+
+Herkese açık sayfaların HTML çıktısı ayrı bir önbellek takma adında
+(varsayılan 'pages') tutulur ve içerik sürümü değiştiğinde geçersiz olur.
+Aynı sayfalar, bağlı oldukları modellerin son güncellenme zamanından
+üretilen ETag/Last-Modified ile koşullu GET isteklerine 304 döner. Sayfa
+anahtarı ve ETag derleme kimliğini (SITE_BUILD_ID ya da staticfiles
+manifest'inin özeti) de içerir; yeni sürüm yayınlanınca eski kopyalar
+kullanılmaz.
+"""
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files import locks
+from django.db import DatabaseError, transaction
+from django.db.models import Count, Max, Value
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .instrumentation import CacheMetricsMixin
+from .pagination import Keyset
+
+SITE_CONTEXT = 'site_context'
+SKILLS = 'skills'
+PROJECTS = 'projects'
+CONTENT = 'content'
+
+# Sayfa önbelleği anahtarına dahil edilen sorgu parametreleri
+PAGE_CACHE_QUERY_PARAMS = ('category', 'tech', 'cursor')
+
+# Proje ızgarası sayfalaması; id sıralamayı tekil yapar
+PROJECT_ORDERING = ('-created_date', '-order', 'id')
+
+_site_context_lock = threading.Lock()
+_site_context = {'version': None, 'value': None}
+
+
+class SharedFileBasedCache(CacheMetricsMixin, FileBasedCache):
+    """
+    incr ve add işlemleri dizindeki kilit dosyasıyla (django.core.files.locks)
+    süreçler ve iş parçacıkları arasında atomik olan dosya tabanlı önbellek
+    """
+    lock_name = 'shared.lock'
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(self._dir, exist_ok=True)
+        with open(os.path.join(self._dir, self.lock_name), 'ab') as lock_file:
+            locks.lock(lock_file, locks.LOCK_EX)
+            try:
+                yield
+            finally:
+                locks.unlock(lock_file)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        with self._locked():
+            return super().add(key, value, timeout, version)
+
+    def incr(self, key, delta=1, version=None):
+        with self._locked():
+            return super().incr(key, delta, version)
+
+
+# incr işlemi süreçler arasında atomik olan arka uçlar
+ATOMIC_SHARED_BACKENDS = (SharedFileBasedCache, RedisCache, BaseMemcachedCache)
+
+
+def shared_cache():
+    """Süreçler arasında paylaşılan sürüm sayaçları ve kategori sayıları"""
+    return caches[getattr(settings, 'SHARED_CACHE_ALIAS', 'default')]
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    alias = getattr(settings, 'SHARED_CACHE_ALIAS', 'default')
+    backend = type(caches[alias])
+    if issubclass(backend, ATOMIC_SHARED_BACKENDS):
+        return []
+    return [checks.Error(
+        f"SHARED_CACHE_ALIAS ('{alias}') için {backend.__module__}.{backend.__name__} "
+        f"süreçler arasında paylaşılmıyor veya incr işlemi atomik değil",
+        hint='core.caching.SharedFileBasedCache, Redis veya Memcached kullanın.',
+        id='core.E001',
+    )]
+
+
+def _version_key(name):
+    return f'core:version:{name}'
+
+
+def _initial_version():
+    # Sayaç önbellekten düşerse eski anahtarlarla çakışmaması için
+    # başlangıç değeri zamana bağlı seçilir.
+    return int(time.time() * 1000)
+
+
+def get_version(name):
+    """Verilen isim alanının güncel sürüm numarası"""
+    store = shared_cache()
+    key = _version_key(name)
+    version = store.get(key)
+    if version is None:
+        # Önbellek değeri tutmazsa (DummyCache, araya giren silme) yeni sürüm
+        # kullanılır; bu durumda her çağrı önbelleği ıskalar
+        version = _initial_version()
+        if not store.add(key, version, timeout=None):
+            version = store.get(key, version)
+    return version
+
+
+def bump_version(name):
+    """Sürüm numarasını artırarak isim alanındaki tüm kayıtları geçersiz kılar"""
+    store = shared_cache()
+    key = _version_key(name)
+    try:
+        return store.incr(key)
+    except ValueError:
+        version = _initial_version()
+        store.set(key, version, timeout=None)
+        return version
+
+
+def invalidate(name):
+    """
+    Sürümü hemen ve işlem (transaction) tamamlandığında tekrar artırır.
+    İkinci artırım, işlem sürerken eski veriyi yeni sürüm altında
+    önbelleğe alan istekleri de temizler.
+    """
+    bump_version(name)
+    transaction.on_commit(lambda: bump_version(name))
+
+
+def _load_site_context():
+    from .models import PersonalInfo, SiteSettings
+
+    return {
+        'personal_info': PersonalInfo.objects.first(),
+        'site_settings': SiteSettings.objects.first(),
+    }
+
+
+def get_site_context():
+    """Tüm sayfalarda kullanılacak ortak context"""
+    version = get_version(SITE_CONTEXT)
+    with _site_context_lock:
+        if _site_context['version'] == version:
+            return dict(_site_context['value'])
+
+    key = f'core:{SITE_CONTEXT}:v{version}'
+    value = cache.get(key)
+    if value is None:
+        try:
+            value = _load_site_context()
+        except DatabaseError:
+            # Tablolar henüz oluşturulmadıysa (migrate öncesi) önbelleğe alma
+            return {'personal_info': None, 'site_settings': None}
+        cache.set(key, value, timeout=None)
+
+    with _site_context_lock:
+        _site_context['version'] = version
+        _site_context['value'] = value
+    return dict(value)
+
+
+def invalidate_site_context():
+    """PersonalInfo veya SiteSettings değiştiğinde çağrılır"""
+    with _site_context_lock:
+        _site_context['version'] = None
+        _site_context['value'] = None
+    invalidate(SITE_CONTEXT)
+
+
+def get_skill_groups():
+    """
+    Yetenekleri CATEGORY_CHOICES sırasıyla gruplar. Her grup
+    {'code', 'name', 'skills'} sözlüğüdür; boş kategoriler de listede yer alır.
+    """
+    from .models import Skill
+
+    key = f'core:{SKILLS}:v{get_version(SKILLS)}'
+    groups = cache.get(key)
+    if groups is None:
+        buckets = {code: [] for code, name in Skill.CATEGORY_CHOICES}
+        for skill in Skill.objects.all():
+            buckets.setdefault(skill.category, []).append(skill)
+        groups = [
+            {'code': code, 'name': name, 'skills': buckets[code]}
+            for code, name in Skill.CATEGORY_CHOICES
+        ]
+        cache.set(key, groups, timeout=None)
+    return groups
+
+
+def get_project_page(category='all', tech='', cursor=None, limit=12):
+    """
+    Kategoriye ve teknoloji slug'ına göre filtrelenmiş projelerden bir sayfa;
+    (projeler, sonraki cursor) döndürür. Teknoloji filtresi Technology tablosu
+    üzerinden (ters indeks) çözülür. Geçersiz cursor InvalidCursor fırlatır.
+    """
+    from .models import Project
+
+    if category != 'all' and category not in dict(Project.CATEGORY_CHOICES):
+        return [], None
+    keyset = Keyset(Project, PROJECT_ORDERING)
+    if cursor:
+        keyset.decode(cursor)
+
+    digest = hashlib.md5(f'{tech}:{cursor or ""}:{limit}'.encode()).hexdigest()
+    key = f'core:{PROJECTS}:v{get_version(PROJECTS)}:{category}:{digest}'
+    page = cache.get(key)
+    if page is None:
+        queryset = Project.objects.all()
+        if category != 'all':
+            queryset = queryset.filter(category=category)
+        if tech:
+            queryset = queryset.filter(tech_tags__slug=tech)
+        page = keyset.page(queryset, limit, cursor)
+        cache.set(key, page, timeout=None)
+    return page
+
+
+def _category_count_key(category):
+    return f'core:{PROJECTS}:count:{category}'
+
+
+def _category_count_timeout():
+    return getattr(settings, 'PROJECT_CATEGORY_COUNT_TIMEOUT', 60 * 60)
+
+
+def get_project_category_counts():
+    """Her kategorideki proje sayısı; önbellekte yoksa tek GROUP BY sorgusuyla"""
+    from .models import Project
+
+    categories = [code for code, name in Project.CATEGORY_CHOICES]
+    keys = {_category_count_key(code): code for code in categories}
+    store = shared_cache()
+    cached = store.get_many(keys)
+    if len(cached) == len(keys):
+        return {keys[key]: cached[key] for key in keys}
+
+    counts = dict.fromkeys(categories, 0)
+    rows = (
+        Project.objects.order_by()
+        .values_list('category')
+        .annotate(total=Count('pk'))
+    )
+    for category, total in rows:
+        if category in counts:
+            counts[category] = total
+    store.set_many(
+        {_category_count_key(code): total for code, total in counts.items()},
+        timeout=_category_count_timeout(),
+    )
+    return counts
+
+
+def adjust_project_category_count(category, delta):
+    """Önbellekteki kategori sayısını değiştirir"""
+    store = shared_cache()
+    key = _category_count_key(category)
+    try:
+        store.incr(key, delta)
+    except ValueError:
+        # Anahtar yoksa sayılar bir sonraki okumada baştan hesaplanır
+        return
+    # incr bazı arka uçlarda süreyi varsayılana (süresiz) çevirir
+    store.touch(key, _category_count_timeout())
+
+
+def reset_project_category_counts():
+    """Toplu yazımlardan sonra sayılar bir sonraki okumada baştan hesaplanır"""
+    from .models import Project
+
+    shared_cache().delete_many([_category_count_key(code) for code, name in Project.CATEGORY_CHOICES])
+
+
+def static_manifest_hash():
+    """staticfiles manifest'inin özeti; manifest yoksa None"""
+    manifest_name = getattr(staticfiles_storage, 'manifest_name', None)
+    if not manifest_name or not staticfiles_storage.exists(manifest_name):
+        return None
+    with staticfiles_storage.open(manifest_name) as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _deployed_manifest_hash():
+    # Manifest yalnızca dağıtımda (collectstatic) değişir; süreç başına bir kez okunur
+    return static_manifest_hash() or ''
+
+
+def build_id():
+    """Şablon ve statik dosyaların sürümü: SITE_BUILD_ID ya da manifest özeti"""
+    return getattr(settings, 'SITE_BUILD_ID', '') or _deployed_manifest_hash()
+
+
+def page_cache_key(request):
+    """
+    İstek yolu, ilgili sorgu parametreleri, derleme kimliği ve içerik
+    sürümünden anahtar üretir.
+    export_site'ın ürettiği sayfalar ayrı anahtarda tutulur.
+    """
+    params = '&'.join(
+        f'{name}={request.GET.get(name, "")}' for name in PAGE_CACHE_QUERY_PARAMS
+    )
+    export = ':export' if getattr(request, 'static_export', False) else ''
+    digest = hashlib.md5(f'{build_id()}:{request.path}?{params}{export}'.encode()).hexdigest()
+    return f'core:page:v{get_version(CONTENT)}:{digest}'
+
+
+def cache_page_by_version(view):
+    """
+    Başarılı GET/HEAD yanıtlarını içerik sürümüne bağlı olarak önbelleğe alır.
+    Herhangi bir içerik modeli kaydedildiğinde veya silindiğinde sürüm
+    artırıldığı için eski sayfalar bir daha sunulmaz.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        page_cache = caches[settings.PAGE_CACHE_ALIAS]
+        key = page_cache_key(request)
+        response = page_cache.get(key)
+        if response is not None:
+            return response
+
+        response = view(request, *args, **kwargs)
+        if (response.status_code == 200 and not response.streaming
+                and not response.cookies):
+            page_cache.set(key, response, timeout=None)
+        return response
+    return wrapper
+
+
+def get_content_stamps():
+    """
+    Her içerik modeli için (son updated_at, kayıt sayısı) çifti. Sayı,
+    silinen kayıtların da doğrulayıcıyı değiştirmesini sağlar. Sonuç içerik
+    sürümüne bağlı olarak önbelleğe alınır; sıcak yolda sorgu yapılmaz.
+    """
+    from .signals import CONTENT_MODELS
+
+    key = f'core:stamps:v{get_version(CONTENT)}'
+    stamps = cache.get(key)
+    if stamps is None:
+        # Tüm modeller için tek sorgu: her modelin toplamı UNION ALL ile birleşir
+        querysets = [
+            model.objects.order_by()
+            .annotate(label=Value(model._meta.label))
+            .values('label')
+            .annotate(last=Max('updated_at'), total=Count('pk'))
+            for model in CONTENT_MODELS
+            if any(field.name == 'updated_at' for field in model._meta.fields)
+        ]
+        stamps = {model._meta.label: (None, 0) for model in CONTENT_MODELS}
+        rows = querysets[0].union(*querysets[1:], all=True)
+        for row in rows:
+            stamps[row['label']] = (row['last'], row['total'])
+        cache.set(key, stamps, timeout=None)
+    return stamps
+
+
+def conditional_page(*models):
+    """
+    Sayfayı verilen modellere (ve tüm sayfalarda kullanılan PersonalInfo ile
+    SiteSettings'e) bağlı ETag/Last-Modified ile korur. İstemcinin kopyası
+    güncelse şablon işlenmeden 304 döner.
+    """
+    from .models import PersonalInfo, SiteSettings
+
+    return conditional_on((PersonalInfo, SiteSettings) + models)
+
+
+def conditional_on(models):
+    """
+    Yanıtı verilen modellerin damgalarına bağlı ETag/Last-Modified ile korur.
+    ETag derleme kimliğini de içerir; şablon veya statik dosyalar değişince
+    eski kopyalar için 304 dönülmez.
+    """
+    labels = [model._meta.label for model in models]
+
+    def last_modified(request, *args, **kwargs):
+        stamps = get_content_stamps()
+        dates = [stamps[label][0] for label in labels if stamps[label][0]]
+        return max(dates) if dates else None
+
+    def etag(request, *args, **kwargs):
+        stamps = get_content_stamps()
+        raw = build_id() + '|' + '|'.join(
+            f'{label}:{stamps[label][0]}:{stamps[label][1]}' for label in labels
+        )
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def decorator(view):
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            # Tarayıcı ve CDN kopyayı kullanmadan önce her seferinde doğrulasın
+            patch_cache_control(response, public=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
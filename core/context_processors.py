@@ -0,0 +1,11 @@
+from .caching import get_site_context
+
+
+def site_context(request):
+    """
+    Kişisel bilgileri ve site ayarlarını tüm şablonlara ekler. static_export,
+    export_site ile üretilen sayfalarda sunucu gerektiren bağlantıları gizler.
+    """
+    context = get_site_context()
+    context['static_export'] = getattr(request, 'static_export', False)
+    return context
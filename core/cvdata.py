@@ -0,0 +1,408 @@
+"""
+CV verilerinin toplu içe ve dışa aktarımı (bkz. import_cv, export_cv).
+
+İki biçim desteklenir:
+
+    jsonl   Her satır bir kayıt: {"type": "project", "slug": ..., ...}.
+            Satır satır okunur ve yazılır; büyük dosyalar belleğe alınmaz.
+    resume  JSON Resume (https://jsonresume.org/schema) belgesi. Şemada
+            karşılığı olmayan alanlar ek anahtarlar olarak taşınır.
+
+Kayıtlar doğal anahtarlarıyla eşleştirilir (proje slug'ı, okul + bölüm,
+şirket + pozisyon + başlangıç tarihi, yetenek adı + kategori, sertifika adı
++ kurum). Tüm içe aktarma tek işlemde yapılır. Her tür toplu olarak yazılır:
+anahtarı tekil kısıtla korunan türlerde batch başına tek bir INSERT ... ON
+CONFLICT DO UPDATE (bulk_create(update_conflicts=True)) hem yeni kayıtları
+ekler hem var olanları günceller. Yeteneklerin anahtarında kısıt yoktur;
+var olanlar bulk_update, yeniler bulk_create ile yazılır. Zorunlu alanları
+taşımayan kısmi kayıtlar yalnızca var olan satırları bulk_update ile
+günceller. Toplu yazımlar sinyal çalıştırmadığından teknoloji etiketleri, arama indeksi ve önbellekler
+sonunda ayrıca güncellenir.
+"""
+import json
+from collections import Counter, defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from . import caching, search
+from .models import (
+    TURKISH_ASCII, Certificate, Education, Experience, PersonalInfo, Project, Skill,
+    SiteSettings, Technology, split_features, split_technologies, technology_slug,
+)
+
+FORMATS = ('jsonl', 'resume')
+# Project.save() içinde kaynak alandan üretilen alanlar
+PROJECT_DERIVED = {'technologies': 'tech_items', 'features': 'feature_items'}
+
+
+class CvDataError(Exception):
+    pass
+
+
+class RecordType:
+    """Bir modelin içe/dışa aktarılan alanları ve doğal anahtarı"""
+
+    def __init__(self, name, model, key=()):
+        self.name = name
+        self.model = model
+        self.key = key
+        # ON CONFLICT yalnızca anahtar bir tekil kısıtla korunuyorsa kullanılabilir
+        self.upsert = bool(key) and (
+            (len(key) == 1 and model._meta.get_field(key[0]).unique)
+            or any(
+                isinstance(constraint, models.UniqueConstraint) and set(constraint.fields) == set(key)
+                for constraint in model._meta.constraints
+            )
+        )
+        # auto_now alanları ve türetilen alanlar (editable=False) dışarıda kalır
+        self.fields = [
+            field.attname for field in model._meta.concrete_fields
+            if field.editable and not field.primary_key
+        ]
+        # Varsayılanı olmayan NOT NULL alanlar; bunlar olmadan satır eklenemez
+        self.required = [
+            field.attname for field in model._meta.concrete_fields
+            if field.attname in self.fields and not field.null
+            and not field.has_default() and not field.empty_strings_allowed
+        ]
+
+    @property
+    def is_singleton(self):
+        return not self.key
+
+    def validate(self, data, line=None):
+        unknown = set(data) - set(self.fields)
+        if unknown:
+            raise CvDataError(_where(line) + f'{self.name} için bilinmeyen alan: {", ".join(sorted(unknown))}')
+        missing = [name for name in self.key if data.get(name) in (None, '')]
+        if missing:
+            raise CvDataError(_where(line) + f'{self.name} için anahtar alan eksik: {", ".join(missing)}')
+
+    def build(self, data):
+        instance = self.model(**data)
+        if self.model is Project:
+            instance.tech_items = split_technologies(instance.technologies)
+            instance.feature_items = split_features(instance.features)
+        return instance
+
+    def natural_key(self, instance):
+        # JSON'dan gelen tarih gibi değerler veritabanındakilerle karşılaştırılabilsin
+        return tuple(
+            self.model._meta.get_field(name).to_python(getattr(instance, name)) for name in self.key
+        )
+
+    def update_fields(self, names):
+        """Kayıtta bulunan alanlar güncellenir; eksik alanlar olduğu gibi kalır"""
+        fields = [name for name in self.fields if name in names and name not in self.key]
+        if self.model is Project:
+            fields += [derived for source, derived in PROJECT_DERIVED.items() if source in names]
+        return fields + ['updated_at']
+
+
+TYPES = {record_type.name: record_type for record_type in (
+    RecordType('personal_info', PersonalInfo),
+    RecordType('site_settings', SiteSettings),
+    RecordType('education', Education, ('school', 'department')),
+    RecordType('experience', Experience, ('company', 'position', 'start_date')),
+    RecordType('skill', Skill, ('name', 'category')),
+    RecordType('project', Project, ('slug',)),
+    RecordType('certificate', Certificate, ('name', 'organization')),
+)}
+
+
+def _where(line):
+    return f'{line}. satır: ' if line else ''
+
+
+# İçe aktarma
+
+def import_records(records, batch_size=1000):
+    """
+    (satır no, kayıt) çiftlerini tek işlemde yazar; tür başına kayıt sayısını
+    döndürür. Hata olursa hiçbir değişiklik kalmaz.
+    """
+    counts = Counter()
+    pending = defaultdict(list)
+    with transaction.atomic():
+        for line, record in records:
+            if not isinstance(record, dict):
+                raise CvDataError(_where(line) + 'kayıt bir JSON nesnesi olmalı')
+            record = dict(record)
+            record_type = TYPES.get(record.pop('type', None))
+            if record_type is None:
+                raise CvDataError(_where(line) + f'bilinmeyen kayıt türü; geçerli türler: {", ".join(TYPES)}')
+            record_type.validate(record, line)
+            counts[record_type.name] += 1
+            if record_type.is_singleton:
+                _save_singleton(record_type, record)
+                continue
+            # Aynı alanları taşıyan kayıtlar aynı UPDATE listesiyle birlikte yazılır
+            batch = (record_type.name, frozenset(record))
+            pending[batch].append(record_type.build(record))
+            if len(pending[batch]) >= batch_size:
+                _write(record_type, batch[1], pending.pop(batch))
+        for (name, names), instances in pending.items():
+            _write(TYPES[name], names, instances)
+
+        if counts.keys() - {'personal_info', 'site_settings'}:
+            if search.is_available():
+                search.rebuild()
+            _invalidate_caches()
+    return counts
+
+
+def _save_singleton(record_type, data):
+    # Tekil kayıtlar: ilk satır güncellenir; save() sinyalleri önbelleği temizler
+    instance = record_type.model.objects.order_by('pk').first() or record_type.model()
+    for name, value in data.items():
+        setattr(instance, name, value)
+    instance.save()
+
+
+def _write(record_type, names, instances):
+    # Aynı batch'te tekrar eden anahtarlar ON CONFLICT'te hata verir; sonuncusu kalır
+    unique = {record_type.natural_key(instance): instance for instance in instances}
+    fields = record_type.update_fields(names)
+    missing = [name for name in record_type.required if name not in names]
+    if record_type.upsert and not missing:
+        record_type.model.objects.bulk_create(
+            unique.values(),
+            update_conflicts=True,
+            unique_fields=record_type.key,
+            update_fields=fields,
+        )
+    else:
+        # NOT NULL kısıtı çakışmadan önce denetlenir; eksik alanlı kayıtlar
+        # yalnızca var olan satırları güncelleyebilir (bulk_update)
+        existing = _existing_pks(record_type, unique)
+        new = [key for key in unique if key not in existing]
+        if new and missing:
+            raise CvDataError(
+                f'{record_type.name} {" / ".join(map(str, new[0]))} yeni kayıt; '
+                f'eksik alan: {", ".join(missing)}'
+            )
+        now = timezone.now()
+        for key, instance in unique.items():
+            if key in existing:
+                instance.pk = existing[key]
+                instance.updated_at = now
+        if len(new) < len(unique):
+            record_type.model.objects.bulk_update(
+                [instance for key, instance in unique.items() if key in existing], fields,
+            )
+        record_type.model.objects.bulk_create([unique[key] for key in new])
+    if record_type.model is Project and 'technologies' in names:
+        _sync_technologies(unique.values())
+
+
+def _existing_pks(record_type, keys):
+    """Doğal anahtar -> pk; ilk anahtar alanıyla daraltılıp Python'da eşleştirilir"""
+    first = record_type.key[0]
+    rows = record_type.model.objects.filter(
+        **{f'{first}__in': {key[0] for key in keys}}
+    ).values_list('pk', *record_type.key)
+    return {tuple(row[1:]): row[0] for row in rows if tuple(row[1:]) in keys}
+
+
+def _sync_technologies(projects):
+    """Projelerin teknoloji etiketlerini Project.sync_technologies gibi, toplu eşitler"""
+    wanted = {}
+    names = {}
+    slug_of = {}
+    for project in projects:
+        slugs = []
+        for name in project.tech_items:
+            slug = slug_of.get(name)
+            if slug is None:
+                slug = slug_of[name] = technology_slug(name)
+            if slug:
+                names.setdefault(slug, name)
+                slugs.append(slug)
+        wanted[project.slug] = dict.fromkeys(slugs)
+
+    Technology.objects.bulk_create(
+        [Technology(name=name, slug=slug) for slug, name in names.items()],
+        ignore_conflicts=True,
+    )
+    technology_ids = dict(Technology.objects.filter(slug__in=names).values_list('slug', 'id'))
+    project_ids = dict(Project.objects.filter(slug__in=wanted).values_list('slug', 'id'))
+
+    Through = Project.tech_tags.through
+    # Genel post_delete alıcıları .delete() ile hızlı silmeyi kapatır ve her
+    # satırı belleğe yükler; ara tablo doğrudan SQL ile silinip yazılır,
+    # önbellekler içe aktarmanın sonunda zaten topluca temizleniyor. İki
+    # sütunlu tablo için model örneği kurmak SQL'in kendisinden pahalı.
+    quote = connection.ops.quote_name
+    table = quote(Through._meta.db_table)
+    columns = (Through._meta.get_field('project').column, Through._meta.get_field('technology').column)
+    ids = list(project_ids.values())
+    batch_size = max(connection.ops.bulk_batch_size(['project'], ids), 1)
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            cursor.execute(
+                f'DELETE FROM {table} WHERE {quote(columns[0])} IN ({", ".join(["%s"] * len(batch))})',
+                batch,
+            )
+        cursor.executemany(
+            f'INSERT INTO {table} ({quote(columns[0])}, {quote(columns[1])}) '
+            f'VALUES (%s, %s)',
+            [
+                (project_ids[slug], technology_ids[tech])
+                for slug, techs in wanted.items()
+                for tech in techs
+            ],
+        )
+
+
+def _invalidate_caches():
+    for name in (caching.CONTENT, caching.SKILLS, caching.PROJECTS):
+        caching.invalidate(name)
+    transaction.on_commit(caching.reset_project_category_counts)
+
+
+def read_jsonl(stream):
+    """(satır no, kayıt) çiftleri; boş satırlar atlanır"""
+    for line, text in enumerate(stream, 1):
+        if not text.strip():
+            continue
+        try:
+            yield line, json.loads(text)
+        except ValueError as error:
+            raise CvDataError(f'{line}. satır: geçersiz JSON ({error})')
+
+
+# Dışa aktarma
+
+def export_records(chunk_size=2000):
+    """Tüm kayıtlar, tür ve doğal anahtar sırasıyla; sunucu tarafı imleçle okunur"""
+    for record_type in TYPES.values():
+        queryset = record_type.model.objects.order_by(*(record_type.key or ('pk',)))
+        if record_type.is_singleton:
+            queryset = queryset[:1]
+        for row in queryset.values(*record_type.fields).iterator(chunk_size=chunk_size):
+            yield {'type': record_type.name, **row}
+
+
+def write_jsonl(records, stream):
+    for record in records:
+        stream.write(json.dumps(record, cls=DjangoJSONEncoder, ensure_ascii=False))
+        stream.write('\n')
+
+
+# JSON Resume
+
+def _year(value):
+    return str(value) if value is not None else None
+
+
+def _from_year(value):
+    return int(str(value)[:4]) if value else None
+
+
+def _date(value):
+    return value.isoformat() if value else None
+
+
+# kayıt türü -> (bölüm, [(Resume anahtarı, alan, dışa dönüştür, içe dönüştür)])
+RESUME_SECTIONS = {
+    'experience': ('work', [
+        ('name', 'company'), ('position', 'position'), ('location', 'location'),
+        ('startDate', 'start_date', _date), ('endDate', 'end_date', _date),
+        ('summary', 'description'), ('isCurrent', 'is_current'), ('order', 'order'),
+    ]),
+    'education': ('education', [
+        ('institution', 'school'), ('area', 'department'), ('studyType', 'degree'),
+        ('startDate', 'start_year', _year, _from_year), ('endDate', 'end_year', _year, _from_year),
+        ('location', 'location'), ('summary', 'description'), ('isCurrent', 'is_current'),
+        ('order', 'order'),
+    ]),
+    'skill': ('skills', [
+        ('name', 'name'), ('level', 'level', str, int), ('category', 'category'),
+        ('icon', 'icon_class'), ('summary', 'description'), ('featured', 'is_featured'),
+        ('order', 'order'),
+    ]),
+    'project': ('projects', [
+        ('name', 'title'), ('slug', 'slug'), ('description', 'short_description'),
+        ('details', 'description'),
+        ('highlights', 'features', split_features, '\n'.join),
+        ('keywords', 'technologies', split_technologies, ', '.join),
+        ('url', 'demo_url'), ('github', 'github_url'), ('category', 'category'),
+        ('status', 'status'), ('image', 'image'), ('featured', 'is_featured'), ('order', 'order'),
+    ]),
+    'certificate': ('certificates', [
+        ('name', 'name'), ('issuer', 'organization'), ('date', 'date_received', _date),
+        ('url', 'credential_url'), ('credentialId', 'credential_id'),
+        ('summary', 'description'), ('image', 'image'), ('order', 'order'),
+    ]),
+}
+PROFILE_FIELDS = {'LinkedIn': 'linkedin_url', 'GitHub': 'github_url'}
+BASICS = [
+    ('name', 'name'), ('label', 'title'), ('email', 'email'), ('phone', 'phone'),
+    ('summary', 'bio'), ('about', 'about_text'), ('birthYear', 'birth_year'),
+    ('image', 'profile_image'), ('cv', 'cv_file'),
+]
+
+
+def _mapping(spec):
+    key, field, *converters = spec
+    to_resume, from_resume = (converters + [None, None])[:2]
+    return key, field, to_resume, from_resume
+
+
+def to_resume(records):
+    document = {'basics': {}, 'meta': {}}
+    for record in records:
+        kind = record.pop('type')
+        if kind == 'personal_info':
+            basics = {key: record[field] for key, field in BASICS}
+            basics['location'] = {'city': record['location']}
+            basics['profiles'] = [
+                {'network': network, 'url': record[field]}
+                for network, field in PROFILE_FIELDS.items() if record[field]
+            ]
+            document['basics'] = basics
+        elif kind == 'site_settings':
+            document['meta']['site'] = record
+        else:
+            section, specs = RESUME_SECTIONS[kind]
+            item = {}
+            for key, field, convert, _ in map(_mapping, specs):
+                value = record[field]
+                item[key] = convert(value) if convert and value is not None else value
+            document.setdefault(section, []).append(item)
+    return document
+
+
+def from_resume(document):
+    """JSON Resume belgesini (satır no yerine None ile) kayıtlara çevirir"""
+    if not isinstance(document, dict):
+        raise CvDataError('JSON Resume belgesi bir nesne olmalı')
+    basics = document.get('basics')
+    if basics:
+        record = {'type': 'personal_info'}
+        record.update({field: basics[key] for key, field in BASICS if key in basics})
+        if isinstance(basics.get('location'), dict) and basics['location'].get('city'):
+            record['location'] = basics['location']['city']
+        for profile in basics.get('profiles', []):
+            field = PROFILE_FIELDS.get(profile.get('network'))
+            if field:
+                record[field] = profile.get('url', '')
+        yield None, record
+    site = (document.get('meta') or {}).get('site')
+    if site:
+        yield None, {'type': 'site_settings', **site}
+
+    for kind, (section, specs) in RESUME_SECTIONS.items():
+        for item in document.get(section) or []:
+            record = {'type': kind}
+            for key, field, _, convert in map(_mapping, specs):
+                if key in item:
+                    value = item[key]
+                    record[field] = convert(value) if convert and value is not None else value
+            if kind == 'project' and 'slug' not in record and record.get('title'):
+                record['slug'] = slugify(record['title'].translate(TURKISH_ASCII))
+            yield None, record
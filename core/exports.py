@@ -0,0 +1,99 @@
+"""
+İletişim mesajlarının CSV veya JSON Lines olarak akış halinde dışa aktarımı
+(bkz. ContactMessageAdmin dışa aktarma eylemleri ve export_messages).
+
+Satırlar .iterator(chunk_size) ile parça parça okunur ve yazılır; sorgu
+sonucu belleğe alınmaz, ilk baytlar sorgu biter bitmez gönderilir. Kayıtlar
+pk sırasıyla okunur (birincil anahtar indeksi, ek sıralama yok).
+
+Mesajlar ziyaretçilerden geldiği için =, +, -, @ ile başlayan CSV hücrelerinin
+başına ' eklenir; tablo programları bunları formül olarak çalıştırmaz.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+FORMATS = ('csv', 'jsonl')
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+FIELDS = (
+    'id', 'name', 'email', 'subject', 'message', 'is_read',
+    'delivery_status', 'created_at', 'sent_at',
+)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+# Yanıt bu büyüklükte parçalar halinde yazılır (satır başına bir yazma yerine)
+BUFFER_SIZE = 64 * 1024
+
+
+class _Line:
+    """csv.writer için yazılan satırı döndüren dosya benzeri nesne"""
+
+    def write(self, value):
+        return value
+
+
+def _safe_cell(value):
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def rows(queryset, chunk_size=2000):
+    """FIELDS sırasıyla değer demetleri"""
+    return queryset.order_by('pk').values_list(*FIELDS).iterator(chunk_size=chunk_size)
+
+
+def lines(queryset, format='csv', chunk_size=2000):
+    """Her kayıt için bir satır; CSV'de önce başlık satırı"""
+    if format == 'csv':
+        writer = csv.writer(_Line())
+        yield writer.writerow(FIELDS)
+        for row in rows(queryset, chunk_size):
+            yield writer.writerow([_safe_cell(value) for value in row])
+    elif format == 'jsonl':
+        for row in rows(queryset, chunk_size):
+            yield json.dumps(dict(zip(FIELDS, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+    else:
+        raise ValueError(f'Bilinmeyen biçim: {format}')
+
+
+def chunks(queryset, format='csv', chunk_size=2000, buffer_size=BUFFER_SIZE):
+    """
+    Satırları yaklaşık buffer_size karakterlik parçalarda birleştirir; ilk
+    satır beklemeden gönderilir.
+    """
+    source = lines(queryset, format, chunk_size)
+    first = next(source, None)
+    if first is None:
+        return
+    yield first
+    buffer, size = [], 0
+    for line in source:
+        buffer.append(line)
+        size += len(line)
+        if size >= buffer_size:
+            yield ''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer)
+
+
+def filename(format):
+    return f'mesajlar-{timezone.now():%Y%m%d-%H%M%S}.{format}'
+
+
+def streaming_response(queryset, format='csv', chunk_size=2000):
+    """Dosya olarak indirilen akış yanıtı"""
+    if format not in FORMATS:
+        raise ValueError(f'Bilinmeyen biçim: {format}')
+    response = StreamingHttpResponse(
+        chunks(queryset, format, chunk_size), content_type=CONTENT_TYPES[format],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename(format)}"'
+    return response
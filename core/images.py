@@ -0,0 +1,225 @@
+"""
+Yüklenen görseller için duyarlı (responsive) türevler.
+
+Her görsel için sabit genişliklerde AVIF, WebP ve JPEG kopyaları üretilir
+ve orijinalin yanına kaydedilir:
+
+    projects/ekran.png -> projects/ekran.640w.webp, projects/ekran.640w.jpg, ...
+
+Türevler kayıt tamamlandıktan sonra arka plandaki tek iş parçacıklı havuzda
+üretilir. Hangi genişliklerin mevcut olduğu (manifest) süreçler arasında
+paylaşılan önbellekte tutulur; türevi henüz olmayan görseller yalnızca
+IMAGE_MANIFEST_MISS_TIMEOUT saniye boyunca "türev yok" olarak hatırlanır.
+Şablonlar `{% responsive_image %}` etiketiyle srcset/sizes içeren <picture>
+öğesi basar. Görsel silindiğinde veya değiştirildiğinde eski türevler de
+silinir.
+"""
+import io
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, features
+
+from . import caching
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='image-derivatives')
+
+# Türev üretilen model alanları
+IMAGE_FIELDS = {
+    'Project': ('image',),
+    'Certificate': ('image',),
+    'PersonalInfo': ('profile_image',),
+}
+
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'jpeg': 'image/jpeg'}
+EXTENSIONS = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg'}
+QUALITY = {'avif': 55, 'webp': 78, 'jpeg': 82}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def derivative_widths():
+    return tuple(_setting('IMAGE_DERIVATIVE_WIDTHS', (320, 640, 960, 1280, 1920)))
+
+
+def derivative_formats():
+    """Kurulu Pillow'un yazabildiği biçimler; JPEG her zaman en sondadır"""
+    formats = _setting('IMAGE_DERIVATIVE_FORMATS', ('avif', 'webp', 'jpeg'))
+    return tuple(fmt for fmt in formats if fmt == 'jpeg' or features.check(fmt))
+
+
+def derivative_name(name, width, fmt):
+    base, _ = os.path.splitext(name)
+    return f'{base}.{width}w.{EXTENSIONS[fmt]}'
+
+
+def _derivative_pattern(name):
+    base = re.escape(os.path.splitext(os.path.basename(name))[0])
+    extensions = '|'.join(re.escape(ext) for ext in EXTENSIONS.values())
+    return re.compile(rf'^{base}\.\d+w\.({extensions})$')
+
+
+def _manifest_key(name):
+    return f'core:image:{name}'
+
+
+def _target_widths(original_width):
+    widths = [width for width in derivative_widths() if width < original_width]
+    if original_width < max(derivative_widths()):
+        widths.append(original_width)
+    return sorted(set(widths)) or [min(derivative_widths())]
+
+
+def _encode(image, fmt):
+    if fmt == 'jpeg' and image.mode not in ('RGB', 'L'):
+        # JPEG saydamlık desteklemez; beyaz zemin üzerine birleştir
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        rgba = image.convert('RGBA')
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        image = background
+    elif fmt != 'jpeg' and image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+    buffer = io.BytesIO()
+    options = {'quality': QUALITY[fmt]}
+    if fmt == 'jpeg':
+        options.update(optimize=True, progressive=True)
+    image.save(buffer, format=fmt.upper(), **options)
+    return buffer.getvalue()
+
+
+def generate_derivatives(name, storage=default_storage, force=False):
+    """
+    Bir görselin tüm türevlerini üretir ve türev bilgisini (manifest)
+    döndürür. force=False iken mevcut türevler yeniden üretilmez.
+    """
+    with storage.open(name, 'rb') as fh:
+        original = Image.open(fh)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+    width, height = original.size
+
+    widths = _target_widths(width)
+    formats = derivative_formats()
+    for target in widths:
+        resized = None
+        for fmt in formats:
+            path = derivative_name(name, target, fmt)
+            if storage.exists(path):
+                if not force:
+                    continue
+                storage.delete(path)
+            if resized is None:
+                target_height = max(1, round(height * target / width))
+                resized = original.resize((target, target_height), Image.LANCZOS)
+            storage.save(path, ContentFile(_encode(resized, fmt)))
+
+    manifest = {'width': width, 'height': height, 'widths': widths, 'formats': list(formats)}
+    caching.shared_cache().set(_manifest_key(name), manifest, timeout=None)
+    return manifest
+
+
+def get_manifest(name, storage=default_storage):
+    """
+    Görselin mevcut türevleri. Önbellekte yoksa depolamadaki JPEG
+    türevlerine bakılır; hiç türev yoksa None döner. Bu sonuç kısa süre
+    saklanır, böylece başka bir süreçte üretilen türevler de görülür.
+    """
+    store = caching.shared_cache()
+    manifest = store.get(_manifest_key(name))
+    if manifest is not None:
+        return manifest or None
+
+    widths = [
+        width for width in derivative_widths()
+        if storage.exists(derivative_name(name, width, 'jpeg'))
+    ]
+    if widths:
+        formats = [
+            fmt for fmt in derivative_formats()
+            if storage.exists(derivative_name(name, widths[0], fmt))
+        ]
+        manifest = {'width': None, 'height': None, 'widths': widths, 'formats': formats}
+        store.set(_manifest_key(name), manifest, timeout=None)
+        return manifest
+    store.set(_manifest_key(name), {}, timeout=_setting('IMAGE_MANIFEST_MISS_TIMEOUT', 60))
+    return None
+
+
+def remove_derivatives(name, storage=default_storage):
+    """Görselin tüm türevlerini ve manifestini siler; silinen dosya sayısı"""
+    directory = os.path.dirname(name)
+    pattern = _derivative_pattern(name)
+    removed = 0
+    try:
+        files = storage.listdir(directory)[1]
+    except FileNotFoundError:
+        files = []
+    for filename in files:
+        if pattern.match(filename):
+            storage.delete(os.path.join(directory, filename) if directory else filename)
+            removed += 1
+    caching.shared_cache().delete(_manifest_key(name))
+    return removed
+
+
+def image_names(instance):
+    """Modeldeki dolu görsel alanlarının depolama yolları"""
+    return [
+        getattr(instance, field).name
+        for field in IMAGE_FIELDS.get(type(instance).__name__, ())
+        if getattr(instance, field)
+    ]
+
+
+def stored_image_names(instance):
+    """Kaydın veritabanındaki (değişiklik öncesi) görsel yolları"""
+    fields = IMAGE_FIELDS.get(type(instance).__name__, ())
+    if not instance.pk or not fields:
+        return []
+    row = type(instance)._default_manager.filter(pk=instance.pk).values_list(*fields).first()
+    return [name for name in row or () if name]
+
+
+def schedule_cleanup(names):
+    """Kayıt tamamlandıktan sonra verilen görsellerin türevlerini siler"""
+    def cleanup():
+        for name in names:
+            remove_derivatives(name)
+
+    if names:
+        transaction.on_commit(cleanup)
+
+
+def _generate_in_background(names):
+    generated = False
+    try:
+        for name in names:
+            if get_manifest(name) is None:
+                generate_derivatives(name)
+                generated = True
+    except Exception:
+        logger.exception('Görsel türevleri üretilemedi: %s', names)
+    finally:
+        close_old_connections()
+    if generated:
+        # Önbellekteki sayfalar yeni srcset ile yeniden işlensin
+        caching.bump_version(caching.CONTENT)
+
+
+def schedule_derivatives(instance):
+    """Kayıt tamamlandıktan sonra eksik türevleri arka planda üretir"""
+    names = image_names(instance)
+    if not names or not _setting('IMAGE_DERIVATIVES_ENABLED', True):
+        return
+    transaction.on_commit(lambda: _executor.submit(_generate_in_background, names))
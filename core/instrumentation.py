@@ -0,0 +1,289 @@
+"""
+İstek başına ölçüm.
+
+InstrumentationMiddleware her istekte şunları toplar:
+
+    db        sorgu sayısı ve süresi (connection.execute_wrapper)
+    tpl       şablon işleme süresi (DjangoTemplates şablon motoru)
+    cache     önbellek isabet / ıskalama sayıları (LocMemCache, FileBasedCache)
+    total     middleware'den sonraki tüm zincirin süresi
+
+Şablon ve önbellek ölçümü Django sınıflarını değiştirmez; ayarlarda bu
+modüldeki alt sınıflar seçilir (TEMPLATES ve CACHES BACKEND değerleri).
+Başka bir önbellek arka ucu CacheMetricsMixin ile aynı şekilde sarılabilir.
+
+Değerler görünüm adına göre bellekteki histogramlara işlenir;
+INSTRUMENTATION_SERVER_TIMING açıksa yanıta Server-Timing başlığı olarak da
+eklenir (tarayıcının ağ panelinde görünür). Başlık sorgu sayısı ve
+süreleri ziyaretçilere gösterdiği için varsayılan olarak kapalıdır.
+Histogramlar yöneticilere /metrics/ adresinden JSON olarak sunulur; ayrıca
+INSTRUMENTATION_LOG_SAMPLE_RATE oranında istek 'core.instrumentation'
+günlüğüne tek satır olarak yazılır. Histogramlar süreç içindedir; birden
+fazla sunucu süreci varsa her biri kendi dağılımını tutar.
+"""
+import bisect
+import contextvars
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache.backends import filebased, locmem
+from django.core.cache.backends.base import BaseCache
+from django.db import connections
+from django.http import JsonResponse
+from django.template.backends import django as django_backend
+
+logger = logging.getLogger(__name__)
+
+# Üst sınırlar; son kova sınırsızdır
+DURATION_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BOUNDS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+_current = contextvars.ContextVar('core_instrumentation', default=None)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.template_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_time = 0.0
+
+    def server_timing(self):
+        return ', '.join((
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} sorgu"',
+            f'tpl;dur={self.template_time * 1000:.1f}',
+            f'cache;desc="hit={self.cache_hits} miss={self.cache_misses}"',
+            f'total;dur={self.total_time * 1000:.1f}',
+        ))
+
+    def as_dict(self):
+        return {
+            'queries': self.queries,
+            'db_ms': round(self.db_time * 1000, 2),
+            'template_ms': round(self.template_time * 1000, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'total_ms': round(self.total_time * 1000, 2),
+        }
+
+
+class Histogram:
+    """Sabit kovalı histogram; yüzdelikler kova üst sınırıyla tahmin edilir"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self):
+        labels = [str(bound) for bound in self.bounds] + ['+Inf']
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 2),
+            'max': round(self.max, 2),
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class ViewStats:
+    def __init__(self):
+        self.total_ms = Histogram(DURATION_BOUNDS)
+        self.db_ms = Histogram(DURATION_BOUNDS)
+        self.template_ms = Histogram(DURATION_BOUNDS)
+        self.queries = Histogram(QUERY_BOUNDS)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def observe(self, metrics):
+        self.total_ms.observe(metrics.total_time * 1000)
+        self.db_ms.observe(metrics.db_time * 1000)
+        self.template_ms.observe(metrics.template_time * 1000)
+        self.queries.observe(metrics.queries)
+        self.cache_hits += metrics.cache_hits
+        self.cache_misses += metrics.cache_misses
+
+    def as_dict(self):
+        return {
+            'total_ms': self.total_ms.as_dict(),
+            'db_ms': self.db_ms.as_dict(),
+            'template_ms': self.template_ms.as_dict(),
+            'queries': self.queries.as_dict(),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def record(view_name, metrics):
+    with _stats_lock:
+        stats = _stats.get(view_name)
+        if stats is None:
+            stats = _stats[view_name] = ViewStats()
+        stats.observe(metrics)
+
+
+def snapshot():
+    with _stats_lock:
+        return {name: stats.as_dict() for name, stats in sorted(_stats.items())}
+
+
+def reset():
+    with _stats_lock:
+        _stats.clear()
+
+
+# Kancalar
+
+def _query_wrapper(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_time += time.perf_counter() - start
+        metrics.queries += 1
+
+
+class Template(django_backend.Template):
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().render(context, request)
+        # Şablon etiketlerinden işlenen şablonlar dıştakinin süresine dahildir
+        metrics.template_depth += 1
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_depth -= 1
+            if not metrics.template_depth:
+                metrics.template_time += time.perf_counter() - start
+
+
+class DjangoTemplates(django_backend.DjangoTemplates):
+    """İşleme süresini ölçen şablon motoru"""
+
+    def from_string(self, template_code):
+        return Template(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
+
+
+_MISSING = object()
+
+
+class CacheMetricsMixin:
+    """get ve get_many çağrılarını isabet / ıskalama olarak sayar"""
+
+    def get(self, key, default=None, version=None):
+        metrics = _current.get()
+        if metrics is None:
+            return super().get(key, default, version)
+        value = super().get(key, _MISSING, version)
+        if value is _MISSING:
+            metrics.cache_misses += 1
+            return default
+        metrics.cache_hits += 1
+        return value
+
+    def get_many(self, keys, version=None):
+        metrics = _current.get()
+        # BaseCache.get_many her anahtar için get çağırır; iki kez sayılmasın
+        if metrics is None or super(CacheMetricsMixin, type(self)).get_many is BaseCache.get_many:
+            return super().get_many(keys, version=version)
+        keys = list(keys)
+        found = super().get_many(keys, version=version)
+        metrics.cache_hits += len(found)
+        metrics.cache_misses += len(keys) - len(found)
+        return found
+
+
+class LocMemCache(CacheMetricsMixin, locmem.LocMemCache):
+    pass
+
+
+class FileBasedCache(CacheMetricsMixin, filebased.FileBasedCache):
+    pass
+
+
+class InstrumentationMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _setting('INSTRUMENTATION_ENABLED', True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(_query_wrapper))
+                response = self.get_response(request)
+        finally:
+            metrics.total_time = time.perf_counter() - start
+            _current.reset(token)
+
+        match = request.resolver_match
+        view_name = match.view_name if match else 'unresolved'
+        record(view_name, metrics)
+        if _setting('INSTRUMENTATION_SERVER_TIMING', False):
+            response['Server-Timing'] = metrics.server_timing()
+        rate = _setting('INSTRUMENTATION_LOG_SAMPLE_RATE', 0.0)
+        if rate and random.random() < rate:
+            logger.info(
+                '%s %s %s %s', request.method, request.path, response.status_code,
+                ' '.join(f'{key}={value}' for key, value in metrics.as_dict().items()),
+                extra={'view': view_name, 'metrics': metrics.as_dict()},
+            )
+        return response
+
+
+@staff_member_required
+def metrics_view(request):
+    """Görünüm başına histogramlar (yalnızca yöneticiler); POST sıfırlar"""
+    data = snapshot()
+    if request.method == 'POST':
+        reset()
+    return JsonResponse(data)
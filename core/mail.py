@@ -0,0 +1,164 @@
+"""
+İletişim mesajları için e-posta giden kutusu.
+
+contact_submit mesajı veritabanına yazıp hemen yanıt döner; e-posta
+gönderimi ya süreç içindeki tek iş parçacıklı havuzda ya da
+`manage.py send_contact_mail` işçisinde yapılır. Bekleyen mesajlar
+toplu olarak, tek bir SMTP bağlantısı üzerinden gönderilir. Başarısız
+gönderimler üstel bekleme süresiyle yeniden denenir.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .caching import get_site_context
+from .models import ContactMessage
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='contact-mail')
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def retry_delay(attempts):
+    """n. başarısız denemeden sonra beklenecek süre"""
+    base = _setting('CONTACT_MAIL_RETRY_DELAY', 60)
+    return timedelta(seconds=base * 2 ** max(attempts - 1, 0))
+
+
+def build_email(message, recipient):
+    subject = message.subject or 'Konusuz'
+    body = (
+        f"Ad Soyad: {message.name}\n"
+        f"E-posta: {message.email}\n"
+        f"Konu: {subject}\n"
+        f"\n"
+        f"Mesaj:\n"
+        f"{message.message}\n"
+    )
+    return EmailMessage(
+        subject=f"Yeni İletişim Mesajı: {subject}",
+        body=body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[recipient],
+        reply_to=[message.email],
+    )
+
+
+def claim_batch(batch_size):
+    """
+    Gönderim zamanı gelmiş mesajları sahiplenir. Her satır, deneme sayısı
+    üzerinden koşullu UPDATE ile alınır; böylece aynı anda çalışan iki
+    işçi aynı mesajı göndermez. Sahiplenilen satırın sonraki deneme zamanı
+    ileri alındığı için işçi çökerse mesaj kendiliğinden yeniden denenir.
+    """
+    now = timezone.now()
+    lease = now + timedelta(seconds=_setting('CONTACT_MAIL_LEASE', 300))
+    candidates = (
+        ContactMessage.objects
+        .filter(delivery_status=ContactMessage.DELIVERY_PENDING, next_attempt_at__lte=now)
+        .order_by('next_attempt_at')[:batch_size]
+    )
+    claimed = []
+    for message in candidates:
+        updated = ContactMessage.objects.filter(
+            pk=message.pk,
+            delivery_status=ContactMessage.DELIVERY_PENDING,
+            delivery_attempts=message.delivery_attempts,
+        ).update(delivery_attempts=message.delivery_attempts + 1, next_attempt_at=lease)
+        if updated:
+            message.delivery_attempts += 1
+            claimed.append(message)
+    return claimed
+
+
+def _mark_sent(message):
+    ContactMessage.objects.filter(pk=message.pk).update(
+        delivery_status=ContactMessage.DELIVERY_SENT,
+        sent_at=timezone.now(),
+        last_error='',
+    )
+
+
+def _mark_failed(message, error):
+    max_attempts = _setting('CONTACT_MAIL_MAX_ATTEMPTS', 5)
+    if message.delivery_attempts >= max_attempts:
+        status = ContactMessage.DELIVERY_FAILED
+    else:
+        status = ContactMessage.DELIVERY_PENDING
+    ContactMessage.objects.filter(pk=message.pk).update(
+        delivery_status=status,
+        next_attempt_at=timezone.now() + retry_delay(message.delivery_attempts),
+        last_error=str(error)[:1000],
+    )
+
+
+def dispatch_pending(batch_size=None):
+    """
+    Bekleyen mesajların bir grubunu gönderir ve gönderilen mesaj sayısını
+    döndürür.
+    """
+    batch_size = batch_size or _setting('CONTACT_MAIL_BATCH_SIZE', 50)
+    messages = claim_batch(batch_size)
+    if not messages:
+        return 0
+
+    personal_info = get_site_context()['personal_info']
+    recipient = personal_info.email if personal_info else ''
+    if not recipient:
+        for message in messages:
+            _mark_failed(message, 'Alıcı e-posta adresi tanımlı değil')
+        return 0
+
+    sent = 0
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as e:
+        logger.warning('SMTP bağlantısı açılamadı: %s', e)
+        for message in messages:
+            _mark_failed(message, e)
+        return 0
+
+    try:
+        for message in messages:
+            try:
+                connection.send_messages([build_email(message, recipient)])
+            except Exception as e:
+                logger.warning('E-posta gönderme hatası (mesaj %s): %s', message.pk, e)
+                _mark_failed(message, e)
+            else:
+                _mark_sent(message)
+                sent += 1
+    finally:
+        connection.close()
+    return sent
+
+
+def _dispatch_in_background():
+    try:
+        while dispatch_pending():
+            pass
+    except Exception:
+        logger.exception('E-posta giden kutusu işlenemedi')
+    finally:
+        close_old_connections()
+
+
+def schedule_dispatch():
+    """
+    İşlem tamamlandıktan sonra giden kutusunu arka planda işler.
+    CONTACT_MAIL_DISPATCH = 'worker' ise gönderim tamamen
+    `send_contact_mail` komutuna bırakılır.
+    """
+    if _setting('CONTACT_MAIL_DISPATCH', 'thread') != 'thread':
+        return
+    transaction.on_commit(lambda: _executor.submit(_dispatch_in_background))
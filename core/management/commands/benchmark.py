@@ -0,0 +1,205 @@
+import json
+import platform
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from core import benchmark
+
+# Ölçüm sırasında geçerli ayarlar: canlıya yakın (DEBUG kapalı), e-posta
+# gönderilmez ve iletişim formu hız sınırına takılmaz.
+OVERRIDES = {
+    'DEBUG': False,
+    'ALLOWED_HOSTS': ['testserver', '127.0.0.1', 'localhost'],
+    'CONTACT_MAIL_DISPATCH': 'worker',
+    'CONTACT_RATE_LIMIT_BURST': 10 ** 9,
+    'INSTRUMENTATION_ENABLED': True,
+    'INSTRUMENTATION_SERVER_TIMING': True,
+    'INSTRUMENTATION_LOG_SAMPLE_RATE': 0,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Sentetik veriyle her adresi test istemcisi ve gerçek bir WSGI sunucusu '
+        'üzerinden ölçer; sonuçları karşılaştırma için JSON olarak kaydeder.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', nargs='+', default=['10'], help='Veri ölçekleri (örn. 10 1k 100k)')
+        parser.add_argument('--requests', type=int, default=50, help='Adres başına istek sayısı')
+        parser.add_argument('--concurrency', type=int, default=4, help='WSGI ölçümünde eşzamanlı istek')
+        parser.add_argument('--mode', choices=('client', 'wsgi', 'contention', 'all'), default='all')
+        parser.add_argument('--writers', type=int, default=4, help='contention: iletişim formuna yazan iş parçacığı')
+        parser.add_argument('--only', nargs='+', help='Yalnızca bu adres adları')
+        parser.add_argument('--rebuild', action='store_true', help='Veri dosyasını baştan oluştur')
+        parser.add_argument('--data-dir', default=str(settings.BASE_DIR / 'build' / 'benchmark'))
+        parser.add_argument('--output', default=str(settings.BASE_DIR / 'build' / 'benchmarks'), help='Sonuç dizini')
+        parser.add_argument('--compare', help='Karşılaştırılacak önceki sonuç dosyası')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Ölçüm veritabanları yalnızca SQLite ile oluşturulabilir.')
+        try:
+            scales = [(label, benchmark.parse_scale(label)) for label in options['scale']]
+        except ValueError as error:
+            raise CommandError(error)
+        if options['requests'] < 2:
+            raise CommandError('--requests en az 2 olmalı')
+
+        previous = json.loads(Path(options['compare']).read_text()) if options['compare'] else None
+        data_dir = Path(options['data_dir'])
+        output = Path(options['output'])
+        data_dir.mkdir(parents=True, exist_ok=True)
+        output.mkdir(parents=True, exist_ok=True)
+
+        original = connection.settings_dict['NAME']
+        try:
+            for label, size in scales:
+                report = self.run_scale(label, size, data_dir / f'{label}.sqlite3', options)
+                path = output / f'{timezone.now():%Y%m%d-%H%M%S}-{label}.json'
+                path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+                self.stdout.write(self.style.SUCCESS(f'Sonuçlar: {path}'))
+                if previous:
+                    self.print_comparison(previous, report)
+        finally:
+            connections.close_all()
+            connection.settings_dict['NAME'] = original
+
+    def use_database(self, path, rebuild):
+        """Varsayılan bağlantıyı ölçek veritabanına yönlendirir; yeni oluşturulduysa True"""
+        connections.close_all()
+        if rebuild and path.exists():
+            path.unlink()
+        fresh = not path.exists()
+        # settings_dict bağlantılar arasında paylaşılır; sunucu iş parçacıkları da bu dosyayı açar
+        connection.settings_dict['NAME'] = str(path)
+        call_command('migrate', verbosity=0, interactive=False)
+        return fresh
+
+    def run_scale(self, label, size, path, options):
+        if self.use_database(path, options['rebuild']):
+            self.stdout.write(f'{label}: sentetik veri oluşturuluyor ({path})...')
+            benchmark.seed(size)
+        staff_user, _ = User.objects.get_or_create(
+            username=benchmark.STAFF_USERNAME, defaults={'is_staff': True},
+        )
+
+        report = {
+            'created': timezone.now().isoformat(),
+            'scale': label,
+            'counts': benchmark.counts(),
+            'requests': options['requests'],
+            'concurrency': options['concurrency'],
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'results': {},
+        }
+        modes = ('client', 'wsgi', 'contention') if options['mode'] == 'all' else (options['mode'],)
+        for mode in modes:
+            if mode == 'contention':
+                self.run_contention(label, report, options)
+                continue
+            with override_settings(CACHES=self.local_caches(f'{label}-{mode}'), **OVERRIDES):
+                targets = self.targets(options)
+                if mode == 'client':
+                    results = self.run_targets(benchmark.client_sender(staff_user), targets, options['requests'], 1)
+                else:
+                    with benchmark.wsgi_server(options['concurrency']) as base_url:
+                        send = benchmark.http_sender(base_url, staff_user)
+                        results = self.run_targets(send, targets, options['requests'], options['concurrency'])
+            report['results'][mode] = results
+            self.print_results(f'{label} / {mode}', results)
+        return report
+
+    def run_contention(self, label, report, options):
+        """Okumaları iletişim formu yazma yükü altında iki veritabanı profiliyle ölçer"""
+        profiles = (('default', benchmark.SQLITE_DEFAULT_PROFILE), ('tuned', {}))
+        for profile, overrides in profiles:
+            mode = f'contention-{profile}'
+            # Okumalar veritabanına gitsin; hız sınırı sayaçları yine de çalışmalı
+            caches = self.local_caches(f'{label}-{mode}', uncached=('default', settings.PAGE_CACHE_ALIAS))
+            with benchmark.database_profile(overrides), override_settings(CACHES=caches, **OVERRIDES):
+                writer = next(target for target in benchmark.targets() if target.name == 'contact_submit')
+                readers = [target for target in self.targets(options) if target.method == 'GET' and not target.staff]
+                workers = options['concurrency'] + options['writers']
+                with benchmark.wsgi_server(workers) as base_url:
+                    with benchmark.write_load(base_url, writer, options['writers']) as writes:
+                        results = self.run_targets(
+                            benchmark.http_sender(base_url), readers, options['requests'], options['concurrency'],
+                        )
+            report['results'][mode] = results
+            report.setdefault('writes', {})[mode] = writes
+            self.print_results(f'{label} / {mode}', results)
+            self.stdout.write(
+                f'  yazma: {writes["writes"]} istek, {writes["failed"]} başarısız, '
+                f'{_fmt(writes["writes_rps"])} istek/s, p50 {_fmt(writes["p50_ms"])} ms, '
+                f'p99 {_fmt(writes["p99_ms"])} ms'
+            )
+
+    def targets(self, options):
+        return [
+            target for target in benchmark.targets()
+            if not options['only'] or target.name.split(':')[0] in options['only']
+        ]
+
+    def local_caches(self, name, uncached=()):
+        """Her ölçüm boş, süreç içi önbelleklerle başlar; `uncached` takma adları kapalıdır"""
+        return {
+            alias: {
+                'BACKEND': 'core.instrumentation.LocMemCache',
+                'LOCATION': f'benchmark-{name}-{alias}',
+                'TIMEOUT': None,
+            } if alias not in uncached else {
+                'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+            }
+            for alias in settings.CACHES
+        }
+
+    def run_targets(self, send, targets, requests, concurrency):
+        return {
+            target.name: benchmark.measure(send, target, requests, concurrency)
+            for target in targets
+        }
+
+    def print_results(self, title, results):
+        self.stdout.write(self.style.MIGRATE_HEADING(title))
+        self.stdout.write(
+            f'  {"adres":<28} {"durum":>9} {"istek/s":>9} {"p50 ms":>8} {"p99 ms":>8} '
+            f'{"sorgu":>6} {"ilk ms":>8} {"ilk sorgu":>9}'
+        )
+        for name, result in results.items():
+            statuses = ','.join(str(status) for status in result['statuses'])
+            self.stdout.write(
+                f'  {name:<28} {statuses:>9} {_fmt(result["throughput_rps"]):>9} '
+                f'{_fmt(result["p50_ms"]):>8} {_fmt(result["p99_ms"]):>8} '
+                f'{_fmt(result["queries_per_request"]):>6} {_fmt(result["first_ms"]):>8} '
+                f'{_fmt(result["first_queries"]):>9}'
+            )
+
+    def print_comparison(self, previous, current):
+        self.stdout.write(self.style.MIGRATE_HEADING(
+            f'Karşılaştırma: {previous.get("scale")} ({previous.get("created")}) → {current["scale"]}'
+        ))
+        rows = benchmark.compare(previous, current)
+        if not rows:
+            self.stdout.write('  Ortak ölçüm yok (mod veya adresler farklı).')
+        for mode, name, before, after in rows:
+            change = ''
+            if before['p50_ms'] and after['p50_ms']:
+                change = f'{(after["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100:+.0f}%'
+            self.stdout.write(
+                f'  {mode:<6} {name:<28} p50 {_fmt(before["p50_ms"])} → {_fmt(after["p50_ms"])} ms {change:>6}  '
+                f'sorgu {_fmt(before["first_queries"])} → {_fmt(after["first_queries"])}'
+            )
+
+
+def _fmt(value):
+    return '-' if value is None else f'{value:g}'
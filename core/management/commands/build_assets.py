@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from core import assets
+
+
+class Command(BaseCommand):
+    help = (
+        'STATIC_BUNDLES paketlerini ve şablonlardaki {% asset %} bloklarını '
+        'küçültüp kaynak haritalarıyla birlikte oluşturur'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Kaynaklar değişmemiş olsa da yeniden oluştur')
+
+    def handle(self, *args, **options):
+        force = options['force']
+        for name in assets.get_bundles():
+            target = assets.build_bundle(name, force=force)
+            original = sum(source.stat().st_size for source in assets.source_paths(name))
+            self.report(name, original, target)
+        for name, asset in assets.template_assets().items():
+            target = asset.build(force=force)
+            self.report(f'{name} ({asset.template_name})', asset.size, target)
+            if asset.critical_css:
+                self.stdout.write(f'    satır içi kritik CSS: {len(asset.critical_css.encode())} bayt')
+        self.stdout.write(self.style.SUCCESS('Paketler oluşturuldu'))
+
+    def report(self, label, original, target):
+        self.stdout.write(f'{label}: {original} → {target.stat().st_size} bayt')
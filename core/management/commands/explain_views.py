@@ -0,0 +1,153 @@
+"""
+Her görünümün çalıştırdığı sorguların planını yazdırır.
+
+Sayfalar test istemcisiyle, veri önbellekleri kapalıyken çağrılır; böylece
+her sorgu gerçekten çalışır. Tüm istekler geri alınan bir işlemin içinde
+yapılır (yönetici sayfaları için geçici bir kullanıcı oluşturulur).
+
+SQLite planlarında şu satırlar işaretlenir:
+
+    SCAN <tablo>          WHERE'li sorguda indekssiz tam tarama
+    USE TEMP B-TREE FOR   tablo taramasından gelen satırlar ayrıca sıralanıyor
+                          (ORDER BY, GROUP BY, DISTINCT indeksten gelmiyor)
+
+Anahtarla aranan (SEARCH) veya tam metin eşleşmesinden gelen sınırlı
+satırların sıralanması ve alt sorgu (CO-ROUTINE) sonuçlarının taranması
+işaretlenmez. Aynı sorgu bir görünümde birden fazla
+çalışıyorsa bir kez, tekrar sayısıyla yazılır.
+
+--check ile işaretli satır varsa komut hata verir (CI'da kullanılabilir).
+"""
+import re
+from collections import Counter
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from core import benchmark
+
+# Adres listesine ek olarak filtreli listeler ve yönetim paneli: (ad, görünüm, sorgu dizgesi, yönetici)
+EXTRA_TARGETS = (
+    ('projects:category', 'core:projects', '?category=web', False),
+    ('projects:tech', 'core:projects', '?tech=django', False),
+    ('admin:contactmessage', 'admin:core_contactmessage_changelist', '', True),
+    ('admin:contactmessage:unread', 'admin:core_contactmessage_changelist', '?is_read__exact=0', True),
+    ('admin:contactmessage:search', 'admin:core_contactmessage_changelist', '?q=proje', True),
+)
+FULL_SCAN = re.compile(r'^SCAN (\S+)$')
+SUBQUERY = re.compile(r'^(?:CO-ROUTINE|MATERIALIZE) (\S+)$')
+TABLE_SCAN = re.compile(r'^SCAN (?!.*VIRTUAL TABLE)')
+TEMP_SORT = re.compile(r'^USE TEMP B-TREE FOR ')
+
+
+class Command(BaseCommand):
+    help = "Görünümlerin SQL sorgularını ve sorgu planlarını listeler; tam taramaları işaretler."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', nargs='+', help='Yalnızca bu adres adları')
+        parser.add_argument('--sql', action='store_true', help='Sorguları kısaltmadan yazdır')
+        parser.add_argument('--check', action='store_true', help='İşaretli plan varsa hata ver')
+
+    def handle(self, *args, **options):
+        flagged = 0
+        with transaction.atomic():
+            for name, path, queries in self.collect(options['only']):
+                self.stdout.write(self.style.MIGRATE_HEADING(f'{name}  {path}  ({len(queries)} sorgu)'))
+                repeats = Counter(sql for sql, params in queries)
+                shown = set()
+                for sql, params in queries:
+                    if sql in shown:
+                        continue
+                    shown.add(sql)
+                    times = f' (x{repeats[sql]})' if repeats[sql] > 1 else ''
+                    self.stdout.write(f'  [{len(shown)}]{times} {self.shorten(sql, options["sql"])}')
+                    plan = self.plan(sql, params)
+                    details = [detail for depth, detail in plan]
+                    for depth, detail in plan:
+                        warning = self.warning(sql, details, detail)
+                        line = f'      {"  " * depth}{detail}'
+                        if warning:
+                            flagged += 1
+                            line = self.style.WARNING(f'{line}  <- {warning}')
+                        self.stdout.write(line)
+            transaction.set_rollback(True)
+
+        if flagged:
+            message = f'{flagged} plan satırı indeks kullanmıyor'
+            if options['check']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS('Tüm sorgular indeks kullanıyor'))
+
+    def collect(self, only):
+        """(ad, adres, [(sql, parametreler)]) üçlüleri"""
+        staff = User.objects.create_user('explain-views', is_staff=True, is_superuser=True)
+        # 'default' ve sayfa önbellekleri kapalı; hız sınırı sayaçları çalışmaya devam eder
+        caches = {
+            alias: config if alias not in ('default', settings.PAGE_CACHE_ALIAS)
+            else {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+            for alias, config in settings.CACHES.items()
+        }
+        with override_settings(CACHES=caches, ALLOWED_HOSTS=['testserver']):
+            targets = [
+                (target.name, target.path, target.staff)
+                for target in benchmark.targets() if target.method == 'GET'
+            ]
+            targets += [(name, reverse(view) + query, staff) for name, view, query, staff in EXTRA_TARGETS]
+            anonymous, client = Client(), Client()
+            client.force_login(staff)
+            for name, path, is_staff in targets:
+                if only and name.split(':')[0] not in only:
+                    continue
+                queries = []
+
+                def capture(execute, sql, params, many, context):
+                    queries.append((sql, params))
+                    return execute(sql, params, many, context)
+
+                with connection.execute_wrapper(capture):
+                    response = (client if is_staff else anonymous).get(path)
+                if response.status_code != 200:
+                    raise CommandError(f'{name} ({path}) {response.status_code} döndü')
+                # Oturum ve kullanıcı sorguları görünüme ait değil
+                yield name, path, [
+                    (sql, params) for sql, params in queries
+                    if not re.search(r'FROM "(django_session|auth_user)"', sql)
+                ]
+
+    def plan(self, sql, params):
+        """(derinlik, açıklama) satırları"""
+        with connection.cursor() as cursor:
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+            rows = cursor.fetchall()
+        if connection.vendor != 'sqlite':
+            return [(0, ' '.join(str(value) for value in row)) for row in rows]
+        depths = {0: -1}
+        result = []
+        for node, parent, _, detail in rows:
+            depths[node] = depths.get(parent, -1) + 1
+            result.append((depths[node], detail))
+        return result
+
+    def warning(self, sql, details, detail):
+        if connection.vendor != 'sqlite':
+            return None
+        if TEMP_SORT.match(detail) and any(TABLE_SCAN.match(other) for other in details):
+            return 'geçici sıralama'
+        scan = FULL_SCAN.match(detail)
+        # Alt sorgu sonucunun taranması tablo taraması değildir (ör. LIMIT'li sayım)
+        subqueries = {match.group(1) for match in map(SUBQUERY.match, details) if match}
+        if scan and scan.group(1) not in subqueries and ' WHERE ' in sql:
+            return 'tam tarama'
+        return None
+
+    def shorten(self, sql, full):
+        if full or len(sql) <= 160:
+            return sql
+        return sql[:157] + '...'
@@ -0,0 +1,30 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core import cvdata
+
+
+class Command(BaseCommand):
+    help = 'CV verilerini JSON Lines (akış halinde) veya JSON Resume olarak dışa aktarır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Dosya yolu; varsayılan standart çıktı")
+        parser.add_argument('--format', choices=cvdata.FORMATS, help='Varsayılan: .json için resume, diğerleri için jsonl')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        format = options['format'] or ('resume' if path.endswith('.json') else 'jsonl')
+        stream = sys.stdout if path == '-' else open(path, 'w', encoding='utf-8')
+        try:
+            records = cvdata.export_records()
+            if format == 'jsonl':
+                cvdata.write_jsonl(records, stream)
+            else:
+                json.dump(cvdata.to_resume(records), stream, cls=DjangoJSONEncoder, ensure_ascii=False, indent=2)
+                stream.write('\n')
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
@@ -0,0 +1,54 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from core import exports, search
+from core.models import ContactMessage
+
+
+class Command(BaseCommand):
+    help = 'İletişim mesajlarını CSV veya JSON Lines olarak akış halinde dışa aktarır.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Dosya yolu; varsayılan standart çıktı")
+        parser.add_argument('--format', choices=exports.FORMATS, help='Varsayılan: .jsonl için jsonl, diğerleri için csv')
+        parser.add_argument('--unread', action='store_true', help='Yalnızca okunmamış mesajlar')
+        parser.add_argument('--since', help='Bu tarihten (YYYY-AA-GG) itibaren gönderilenler')
+        parser.add_argument('--search', help='Yönetim panelindeki aramayla eşleşenler')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Veritabanından tek seferde okunacak satır sayısı')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        format = options['format'] or ('jsonl' if path.endswith('.jsonl') else 'csv')
+        queryset = ContactMessage.objects.all()
+        if options['unread']:
+            queryset = queryset.filter(is_read=False)
+        if options['since']:
+            try:
+                since = parse_date(options['since'])
+            except ValueError:
+                since = None
+            if since is None:
+                raise CommandError(f'Geçersiz tarih: {options["since"]}')
+            # __date yerine aralık: created_at indeksi kullanılabilsin
+            queryset = queryset.filter(created_at__gte=timezone.make_aware(datetime.combine(since, time.min)))
+        if options['search']:
+            if not search.is_available():
+                raise CommandError('Mesaj araması bu veritabanında kullanılamıyor')
+            ids = search.message_ids(options['search'])
+            queryset = queryset.filter(pk__in=ids) if ids is not None else queryset.none()
+
+        # Satırlar zaten satır sonuyla biter; OutputWrapper ek satır sonu eklemez
+        stream = self.stdout if path == '-' else open(path, 'w', encoding='utf-8', newline='')
+        total = -1 if format == 'csv' else 0  # başlık satırı sayılmaz
+        try:
+            for line in exports.lines(queryset, format, options['batch_size']):
+                stream.write(line)
+                total += 1
+        finally:
+            if stream is not self.stdout:
+                stream.close()
+        if path != '-':
+            self.stderr.write(self.style.SUCCESS(f'{total} mesaj {path} dosyasına yazıldı'))
@@ -0,0 +1,230 @@
+"""
+Herkese açık sitenin statik kopyası.
+
+Sayfalar canlıdaki staticfiles depolamasıyla işlenir; bu yüzden önce
+collectstatic çalıştırılır ve statik dosyalar STATIC_ROOT'tan (özetli adlar
+ve manifest dahil) kopyalanır. Sayfalar static_export işaretli isteklerle
+üretilir: arama bağlantısı gizlenir, "daha fazla proje" bağlantısı önceden
+üretilmiş parçaya gider. Kategori/teknoloji filtreleri (?category=, ?tech=)
+ve arama sorgu dizgesi gerektirdiğinden dışa aktarımda yer almaz; iletişim
+formu /contact/submit/ için canlı sunucuya ihtiyaç duyar. 200 dışında
+yanıt veren bir sayfa dışa aktarımı durdurur; manifest yazılmadığından
+sonraki --incremental çalıştırma aynı sayfaları yeniden dener.
+
+--incremental kayıt değil model düzeyinde çalışır: değişen modele bağlı
+sayfaların hepsi yeniden işlenir (PAGE_DEPENDENCIES). Örneğin tek bir
+proje değiştiğinde tüm proje detay sayfaları işlenir, çünkü her biri
+"diğer projeler" listesini de gösterir. İçeriği değişmeyen sayfalar
+özetleri karşılaştırılarak diske yeniden yazılmaz.
+"""
+import fnmatch
+import gzip
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # isteğe bağlı bağımlılık
+    brotli = None
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from core.caching import get_content_stamps, get_project_page, static_manifest_hash
+from core.models import PersonalInfo, Project, SiteSettings
+from core.views import PAGE_DEPENDENCIES
+
+MANIFEST_NAME = '.export-manifest.json'
+COMPRESSIBLE = {'.html', '.css', '.js', '.map', '.json', '.svg', '.txt', '.xml', '.ico', '.ttf', '.otf', '.eot'}
+# Yönetim paneli statik dışa aktarımda yer almaz
+IGNORE_PATTERNS = ['CVS', '.*', '*~', 'admin']
+SITE_LABELS = {PersonalInfo._meta.label, SiteSettings._meta.label}
+# Statik dosya manifest'i değişince (yeni özetli adlar) tüm sayfalar yeniden üretilir
+STATIC_LABEL = 'staticfiles'
+
+
+def compress(path):
+    """Dosyanın yanına .gz (ve brotli kuruluysa .br) kopyasını yazar"""
+    if path.suffix not in COMPRESSIBLE:
+        return
+    data = path.read_bytes()
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, quality=11)))
+    for suffix, compressed in variants:
+        target = path.with_name(path.name + suffix)
+        if len(compressed) < len(data):
+            target.write_bytes(compressed)
+        elif target.exists():
+            target.unlink()
+
+
+class Command(BaseCommand):
+    help = (
+        'Herkese açık siteyi statik dosyalar olarak dışa aktarır. Her dosyanın '
+        'yanına .gz ve .br kopyaları yazılır; --incremental ile yalnızca '
+        'değişen modellere bağlı sayfalar yeniden üretilir.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Çıktı dizini')
+        parser.add_argument('--incremental', action='store_true', help='Yalnızca son dışa aktarımdan beri değişen sayfaları üret')
+        parser.add_argument('--no-static', action='store_true', help='collectstatic çalıştırma, statik dosyaları kopyalama')
+        parser.add_argument('--no-media', action='store_true', help='Yüklenen medya dosyalarını kopyalama')
+
+    def handle(self, *args, **options):
+        self.output = Path(options['output']).resolve()
+        self.output.mkdir(parents=True, exist_ok=True)
+        if brotli is None:
+            self.stderr.write('brotli modülü kurulu değil; yalnızca .gz kopyaları yazılacak.')
+
+        if not options['no_static']:
+            # Sayfalardaki özetli statik adları manifest'ten gelir
+            call_command('collectstatic', interactive=False, verbosity=0)
+
+        manifest = self.load_manifest() if options['incremental'] else {}
+        stamps = {
+            label: [last.isoformat() if last else None, total]
+            for label, (last, total) in get_content_stamps().items()
+        }
+        stamps[STATIC_LABEL] = self.static_stamp()
+        changed = self.changed_labels(manifest.get('stamps'), stamps)
+
+        hashes = manifest.get('pages', {})
+        written = unchanged = 0
+        for path in self.pages(changed):
+            if self.write_page(path, hashes):
+                written += 1
+            else:
+                unchanged += 1
+        removed = self.remove_stale_projects(manifest.get('projects', []), hashes)
+
+        copied = 0
+        if not options['no_static']:
+            copied += self.copy_tree(
+                Path(settings.STATIC_ROOT), self.output / settings.STATIC_URL.strip('/'), IGNORE_PATTERNS,
+            )
+        if not options['no_media']:
+            copied += self.copy_tree(Path(settings.MEDIA_ROOT), self.output / settings.MEDIA_URL.strip('/'))
+
+        self.save_manifest({
+            'stamps': stamps,
+            'pages': hashes,
+            'projects': list(Project.objects.values_list('slug', flat=True)),
+        })
+        self.stdout.write(self.style.SUCCESS(
+            f'{written} sayfa yazıldı, {unchanged} sayfa değişmedi, '
+            f'{removed} sayfa silindi, {copied} dosya kopyalandı → {self.output}'
+        ))
+
+    # Artımlı dışa aktarım
+
+    def load_manifest(self):
+        try:
+            return json.loads((self.output / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest):
+        (self.output / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+    def changed_labels(self, previous, current):
+        """Değişen modellerin etiketleri; önceki dışa aktarım yoksa None (hepsi)"""
+        if previous is None:
+            return None
+        return {label for label, stamp in current.items() if previous.get(label) != stamp}
+
+    def static_stamp(self):
+        """staticfiles manifest'inin özeti; manifest yoksa None"""
+        return static_manifest_hash()
+
+    def pages(self, changed):
+        """Yeniden üretilmesi gereken sayfaların URL yolları"""
+        everything = changed is None or bool(changed & (SITE_LABELS | {STATIC_LABEL}))
+        for name, models in PAGE_DEPENDENCIES.items():
+            if not everything and not {model._meta.label for model in models} & changed:
+                continue
+            if name == 'project_detail':
+                for slug in Project.objects.values_list('slug', flat=True):
+                    yield reverse('core:project_detail', kwargs={'slug': slug})
+            elif name == 'projects_more':
+                yield from self.project_fragments()
+            else:
+                yield reverse(f'core:{name}')
+
+    def project_fragments(self):
+        """
+        Projeler sayfasının kaydırdıkça yüklenen parçaları. Cursor yolun
+        parçası olduğundan her biri ayrı bir dosya olarak yazılabilir; eski
+        cursor'lara ait parçalar önce silinir.
+        """
+        more = self.page_file(reverse('core:projects')).parent / 'more'
+        shutil.rmtree(more, ignore_errors=True)
+        limit = getattr(settings, 'PROJECTS_PAGE_SIZE', 12)
+        cursor = get_project_page(limit=limit)[1]
+        while cursor:
+            yield reverse('core:projects_more', kwargs={'cursor': cursor})
+            cursor = get_project_page(cursor=cursor, limit=limit)[1]
+
+    def page_file(self, path):
+        return self.output / path.strip('/') / 'index.html'
+
+    def write_page(self, path, hashes):
+        """Sayfayı işler; içerik değiştiyse yazar ve True döner"""
+        request = RequestFactory().get(path)
+        request.static_export = True
+        match = resolve(path)
+        response = match.func(request, *match.args, **match.kwargs)
+        if hasattr(response, 'render'):
+            response.render()
+        if response.status_code != 200:
+            raise CommandError(f'{path} sayfası {response.status_code} döndü; dışa aktarım durduruldu.')
+        content = response.content
+
+        digest = hashlib.sha256(content).hexdigest()
+        target = self.page_file(path)
+        if hashes.get(path) == digest and target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        compress(target)
+        hashes[path] = digest
+        return True
+
+    def remove_stale_projects(self, previous_slugs, hashes):
+        current = set(Project.objects.values_list('slug', flat=True))
+        removed = 0
+        for slug in set(previous_slugs) - current:
+            path = reverse('core:project_detail', kwargs={'slug': slug})
+            shutil.rmtree(self.page_file(path).parent, ignore_errors=True)
+            hashes.pop(path, None)
+            removed += 1
+        return removed
+
+    # Statik ve medya dosyaları
+
+    def copy_file(self, source, target):
+        """Hedef yoksa veya kaynak daha yeniyse kopyalar"""
+        if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, target)
+        compress(target)
+        return True
+
+    def copy_tree(self, source_root, target_root, ignore_patterns=()):
+        if not source_root.is_dir():
+            return 0
+        copied = 0
+        for source in source_root.rglob('*'):
+            relative = source.relative_to(source_root)
+            if any(fnmatch.fnmatch(part, pattern) for part in relative.parts for pattern in ignore_patterns):
+                continue
+            if source.is_file():
+                copied += self.copy_file(source, target_root / relative)
+        return copied
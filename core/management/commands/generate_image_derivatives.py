@@ -0,0 +1,33 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from core import caching
+from core.images import IMAGE_FIELDS, generate_derivatives
+
+
+class Command(BaseCommand):
+    help = 'Mevcut görseller için eksik duyarlı türevleri (AVIF/WebP/JPEG) üretir'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Mevcut türevleri de yeniden üret')
+
+    def handle(self, *args, **options):
+        total = 0
+        for model_name, fields in IMAGE_FIELDS.items():
+            model = apps.get_model('core', model_name)
+            for field in fields:
+                names = (
+                    model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+                    .values_list(field, flat=True)
+                )
+                for name in names.iterator():
+                    try:
+                        generate_derivatives(name, force=options['force'])
+                    except (OSError, ValueError) as e:
+                        self.stderr.write(f'{name}: {e}')
+                        continue
+                    total += 1
+                    self.stdout.write(f'  {name}')
+        if total:
+            caching.bump_version(caching.CONTENT)
+        self.stdout.write(self.style.SUCCESS(f'{total} görsel işlendi'))
@@ -0,0 +1,40 @@
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import cvdata
+
+
+class Command(BaseCommand):
+    help = (
+        'CV verilerini JSON Lines veya JSON Resume dosyasından tek işlemde, '
+        'doğal anahtarlarla eşleştirerek toplu olarak içe aktarır.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Dosya yolu; '-' standart girdi")
+        parser.add_argument('--format', choices=cvdata.FORMATS, help='Varsayılan: .jsonl için jsonl, diğerleri için resume')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Tek sorguda yazılacak kayıt sayısı')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        format = options['format'] or ('jsonl' if path == '-' or path.endswith('.jsonl') else 'resume')
+        stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+        start = time.perf_counter()
+        try:
+            with stream:
+                if format == 'jsonl':
+                    records = cvdata.read_jsonl(stream)
+                else:
+                    records = cvdata.from_resume(json.load(stream))
+                counts = cvdata.import_records(records, options['batch_size'])
+        except (OSError, ValueError, cvdata.CvDataError) as error:
+            raise CommandError(f'İçe aktarma iptal edildi, değişiklik yapılmadı: {error}')
+
+        for name, total in counts.items():
+            self.stdout.write(f'  {name}: {total}')
+        self.stdout.write(self.style.SUCCESS(
+            f'{sum(counts.values())} kayıt {time.perf_counter() - start:.1f} sn içinde içe aktarıldı'
+        ))
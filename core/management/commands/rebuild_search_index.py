@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = 'Arama indeksini (SQLite FTS5) baştan oluşturur'
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError('Arama indeksi yalnızca SQLite veritabanında kullanılabilir.')
+        search.create_table()
+        total = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'{total} kayıt indekslendi'))
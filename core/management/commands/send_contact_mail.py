@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.mail import dispatch_pending
+
+
+class Command(BaseCommand):
+    help = 'Bekleyen iletişim mesajlarını e-posta ile gönderir'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Kuyruğu bir kez boşalt ve çık')
+        parser.add_argument('--interval', type=float, default=10, help='Kontroller arası bekleme (saniye)')
+        parser.add_argument('--batch-size', type=int, default=None, help='Tek bağlantıda gönderilecek mesaj sayısı')
+
+    def handle(self, *args, **options):
+        while True:
+            total = 0
+            while True:
+                sent = dispatch_pending(options['batch_size'])
+                if not sent:
+                    break
+                total += sent
+            if total:
+                self.stdout.write(self.style.SUCCESS(f'{total} e-posta gönderildi'))
+            if options['once']:
+                return
+            time.sleep(options['interval'])
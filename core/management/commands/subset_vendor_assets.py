@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core import vendor
+
+
+class Command(BaseCommand):
+    help = (
+        'Font Awesome ve Poppins yazı tiplerini şablonlarda kullanılan ikon, '
+        'karakter ve kalınlıklara göre alt kümeleyip static/vendor/ altına yazar'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fetch', action='store_true', help='Eksik Poppins, AOS ve three.js dosyalarını indir')
+        parser.add_argument('--check', action='store_true', help='Alt kümeler güncel değilse hata ile çık')
+        parser.add_argument('--force', action='store_true', help='Kullanım değişmemiş olsa da yeniden üret')
+
+    def handle(self, *args, **options):
+        classes = vendor.used_icon_classes()
+        weights = vendor.used_weights()
+        characters = vendor.used_characters()
+        manifest = vendor.subset_manifest(classes, weights, characters)
+        current = vendor.read_manifest()
+
+        if options['check']:
+            if current != manifest:
+                raise CommandError('Alt kümeler güncel değil; subset_vendor_assets komutunu çalıştırın.')
+            missing = vendor.missing_files()
+            if missing:
+                self.stderr.write(f'CDN\'den yüklenen dosyalar: {", ".join(missing)}; --fetch ile indirin.')
+            self.stdout.write(self.style.SUCCESS('Alt kümeler güncel'))
+            return
+
+        if options['fetch']:
+            vendor.fetch_sources(weights, stdout=self.stdout)
+            manifest = vendor.subset_manifest(classes, weights, characters)
+        if current == manifest and not options['force']:
+            self.stdout.write('Kullanılan ikon ve karakterler değişmemiş; alt kümeler güncel.')
+            return
+        if vendor.subset is None:
+            raise CommandError('fontTools ve brotli kurulu olmalı: pip install fonttools brotli')
+
+        codepoints = vendor.build_font_awesome(classes)
+        icons = sorted(name for name in classes if name.startswith('fa-'))
+        self.stdout.write(f'Font Awesome: {len(icons)} sınıf, {len(codepoints)} ikon')
+
+        missing = vendor.build_poppins(weights, characters)
+        if missing:
+            self.stderr.write(
+                f'Poppins kaynakları eksik ({", ".join(missing)}); --fetch ile indirin. '
+                f'Şablonlar bu sürede CDN adresini kullanır.'
+            )
+        else:
+            self.stdout.write(f'Poppins: {", ".join(map(str, weights))} kalınlıkları, {len(characters)} karakter')
+
+        vendor.write_manifest(manifest)
+        self.stdout.write(self.style.SUCCESS('Alt kümeler oluşturuldu'))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:54
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contactmessage',
+            name='delivery_attempts',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Gönderim Denemesi'),
+        ),
+        # Mevcut mesajlar eski akışta zaten e-postalanmıştı; tekrar
+        # gönderilmemeleri için 'sent' olarak eklenir.
+        migrations.AddField(
+            model_name='contactmessage',
+            name='delivery_status',
+            field=models.CharField(choices=[('pending', 'Gönderilecek'), ('sent', 'Gönderildi'), ('failed', 'Başarısız')], default='sent', max_length=10, verbose_name='E-posta Durumu'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='contactmessage',
+            name='delivery_status',
+            field=models.CharField(choices=[('pending', 'Gönderilecek'), ('sent', 'Gönderildi'), ('failed', 'Başarısız')], default='pending', max_length=10, verbose_name='E-posta Durumu'),
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='last_error',
+            field=models.TextField(blank=True, verbose_name='Son Hata'),
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Sonraki Deneme'),
+        ),
+        migrations.AddField(
+            model_name='contactmessage',
+            name='sent_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='E-posta Gönderilme Tarihi'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['delivery_status', 'next_attempt_at'], name='contact_outbox_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:56
+
+from django.db import migrations, models
+
+
+def fill_lists(apps, schema_editor):
+    Project = apps.get_model('core', 'Project')
+    projects = list(Project.objects.all())
+    for project in projects:
+        project.tech_items = [t.strip() for t in project.technologies.split(',') if t.strip()]
+        project.feature_items = [f.strip() for f in project.features.split('\n') if f.strip()]
+    Project.objects.bulk_update(projects, ['tech_items', 'feature_items'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_contactmessage_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='feature_items',
+            field=models.JSONField(default=list, editable=False, verbose_name='Özellik Listesi'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tech_items',
+            field=models.JSONField(default=list, editable=False, verbose_name='Teknoloji Listesi'),
+        ),
+        migrations.RunPython(fill_lists, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:57
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+TURKISH_ASCII = str.maketrans('çğıİöşüÇĞÖŞÜ', 'cgiIosuCGOSU')
+
+
+def technology_slug(name):
+    value = name.translate(TURKISH_ASCII).replace('#', ' sharp').replace('+', ' plus')
+    return slugify(value, allow_unicode=True)
+
+
+def build_index(apps, schema_editor):
+    """Mevcut virgülle ayrılmış teknoloji metinlerini Technology kayıtlarına böler"""
+    Project = apps.get_model('core', 'Project')
+    Technology = apps.get_model('core', 'Technology')
+    Through = Project.tech_tags.through
+
+    links = {}
+    names = {}
+    for project_id, technologies in Project.objects.values_list('pk', 'technologies'):
+        for name in technologies.split(','):
+            name = name.strip()
+            slug = technology_slug(name)
+            if slug:
+                names.setdefault(slug, name)
+                links.setdefault(project_id, set()).add(slug)
+
+    Technology.objects.bulk_create(
+        [Technology(name=name, slug=slug) for slug, name in names.items()],
+        ignore_conflicts=True,
+    )
+    ids = dict(Technology.objects.values_list('slug', 'pk'))
+    Through.objects.bulk_create(
+        [
+            Through(project_id=project_id, technology_id=ids[slug])
+            for project_id, slugs in links.items()
+            for slug in slugs
+        ],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_project_precomputed_lists'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Teknoloji')),
+                ('slug', models.SlugField(allow_unicode=True, max_length=100, unique=True, verbose_name='URL Slug')),
+            ],
+            options={
+                'verbose_name': 'Teknoloji',
+                'verbose_name_plural': 'Teknolojiler',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tech_tags',
+            field=models.ManyToManyField(blank=True, editable=False, related_name='projects', to='core.technology', verbose_name='Teknoloji Etiketleri'),
+        ),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
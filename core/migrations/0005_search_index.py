@@ -0,0 +1,55 @@
+from django.db import migrations
+
+# Tablo tanımı ve belge biçimi bu migration'ın yazıldığı andaki core.search
+# ile aynıdır; sonraki değişiklikler yeni migration ile yapılmalıdır.
+TABLE = 'core_search_index'
+TURKISH_FOLD = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+
+# (kod, model, başlık alanları, gövde alanları); rowid = pk * 4 + kod
+SOURCES = (
+    (0, 'Project', ('title',), ('short_description', 'description', 'technologies', 'features')),
+    (1, 'Experience', ('position', 'company'), ('location', 'description')),
+    (2, 'Skill', ('name',), ('description',)),
+    (3, 'Certificate', ('name', 'organization'), ('description',)),
+)
+
+
+def fold(values, names):
+    return ' '.join(str(values[name] or '') for name in names).translate(TURKISH_FOLD).casefold()
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5('
+            f"title, body, tokenize='unicode61 remove_diacritics 2')"
+        )
+        rows = []
+        for code, model_name, title_fields, body_fields in SOURCES:
+            values = apps.get_model('core', model_name).objects.values('pk', *title_fields, *body_fields)
+            for item in values.iterator(chunk_size=2000):
+                rows.append((item['pk'] * len(SOURCES) + code, fold(item, title_fields), fold(item, body_fields)))
+                if len(rows) >= 2000:
+                    cursor.executemany(f'INSERT INTO {TABLE} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+                    rows = []
+        if rows:
+            cursor.executemany(f'INSERT INTO {TABLE} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_technology_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
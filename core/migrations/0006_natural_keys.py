@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:27
+
+from django.db import migrations, models
+from django.db.models import Count
+
+NATURAL_KEYS = {
+    'Certificate': ('name', 'organization'),
+    'Education': ('school', 'department'),
+    'Experience': ('company', 'position', 'start_date'),
+}
+
+
+def check_duplicates(apps, schema_editor):
+    """
+    Kısıtlar eklenmeden önce aynı doğal anahtarı taşıyan kayıtlar aranır.
+    Kayıtlar silinmez; çakışmalar listelenir ve migration durur.
+    """
+    conflicts = []
+    for model_name, key in NATURAL_KEYS.items():
+        model = apps.get_model('core', model_name)
+        duplicates = (
+            model.objects.values(*key)
+            .annotate(count=Count('pk'))
+            .filter(count__gt=1)
+            .order_by(*key)
+        )
+        for row in duplicates:
+            pks = model.objects.filter(**{field: row[field] for field in key}).order_by('pk')
+            values = ' / '.join(str(row[field]) for field in key)
+            conflicts.append(f'{model_name} ({values}): pk {", ".join(str(pk) for pk in pks.values_list("pk", flat=True))}')
+    if conflicts:
+        raise ValueError(
+            'Doğal anahtarı aynı olan kayıtlar var; birleştirip ya da düzeltip '
+            'migrate komutunu yeniden çalıştırın:\n  ' + '\n  '.join(conflicts)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='certificate',
+            constraint=models.UniqueConstraint(fields=('name', 'organization'), name='certificate_natural_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='education',
+            constraint=models.UniqueConstraint(fields=('school', 'department'), name='education_natural_key'),
+        ),
+        migrations.AddConstraint(
+            model_name='experience',
+            constraint=models.UniqueConstraint(
+                fields=('company', 'position', 'start_date'), name='experience_natural_key',
+            ),
+        ),
+    ]
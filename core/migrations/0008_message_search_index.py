@@ -0,0 +1,49 @@
+from django.db import migrations
+
+# Tablo tanımı ve belge biçimi bu migration'ın yazıldığı andaki core.search
+# ile aynıdır; sonraki değişiklikler yeni migration ile yapılmalıdır.
+TABLE = 'core_message_index'
+TURKISH_FOLD = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+TITLE_FIELDS = ('name', 'email', 'subject')
+
+
+def fold(text):
+    return (text or '').translate(TURKISH_FOLD).casefold()
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    ContactMessage = apps.get_model('core', 'ContactMessage')
+    values = ContactMessage.objects.order_by().values('pk', *TITLE_FIELDS, 'message')
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {TABLE} USING fts5('
+            f"title, body, tokenize='unicode61 remove_diacritics 2')"
+        )
+        rows = []
+        for item in values.iterator(chunk_size=2000):
+            title = fold(' '.join(item[name] or '' for name in TITLE_FIELDS))
+            rows.append((item['pk'], title, fold(item['message'])))
+            if len(rows) >= 2000:
+                cursor.executemany(f'INSERT INTO {TABLE} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+                rows = []
+        if rows:
+            cursor.executemany(f'INSERT INTO {TABLE} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+# Mesaj silindiğinde indeks satırını SQLite siler; Python tarafında
+# post_delete alıcısı olmadığı için toplu silme tek DELETE ile yapılır.
+TRIGGER = 'core_message_index_delete'
+
+
+def create_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS {TRIGGER} AFTER DELETE ON core_contactmessage '
+            'BEGIN DELETE FROM core_message_index WHERE rowid = old.id; END'
+        )
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(f'DROP TRIGGER IF EXISTS {TRIGGER}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_message_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
@@ -1,6 +1,10 @@
 from django.db import models
+from django.db.models import Q
 from django.urls import reverse
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils import timezone
+from django.utils.text import slugify
 
 class PersonalInfo(models.Model):
     """Kişisel bilgiler - sadece tek bir kayıt olacak"""
@@ -57,6 +61,12 @@ class Education(models.Model):
         verbose_name = "Eğitim"
         verbose_name_plural = "Eğitimler"
         ordering = ['-start_year', '-order']
+        indexes = [
+            models.Index(fields=['-start_year', '-order'], name='education_order_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['school', 'department'], name='education_natural_key'),
+        ]
     
     def __str__(self):
         return f"{self.degree} - {self.school}"
@@ -84,6 +94,13 @@ class Experience(models.Model):
         verbose_name = "Deneyim"
         verbose_name_plural = "Deneyimler"
         ordering = ['-start_date', '-order']
+        indexes = [
+            models.Index(fields=['-start_date', '-order'], name='experience_order_idx'),
+        ]
+        constraints = [
+            # Aynı şirkette aynı pozisyonda birden fazla dönem olabilir
+            models.UniqueConstraint(fields=['company', 'position', 'start_date'], name='experience_natural_key'),
+        ]
     
     def __str__(self):
         return f"{self.position} - {self.company}"
@@ -124,10 +141,60 @@ class Skill(models.Model):
         verbose_name = "Yetenek"
         verbose_name_plural = "Yetenekler"
         ordering = ['category', '-level', 'order']
+        indexes = [
+            # Kategoriye göre gruplanan liste; kategori filtresi de bu indeksi kullanır
+            models.Index(fields=['category', '-level', 'order'], name='skill_order_idx'),
+            models.Index(
+                fields=['category', '-level', 'order'], condition=Q(is_featured=True),
+                name='skill_featured_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.level}%)"
 
+    def clean(self):
+        # Font Awesome alt kümesinde olmayan ikonlar sitede boş görünür
+        from .vendor import unavailable_icons
+
+        missing = unavailable_icons(self.icon_class)
+        if missing:
+            raise ValidationError({'icon_class': (
+                f'Sitede sunulmayan ikon: {", ".join(missing)}. '
+                f'core.vendor.SKILL_ICONS listesine ekleyip subset_vendor_assets komutunu çalıştırın.'
+            )})
+
+def split_technologies(value):
+    """Virgülle ayrılmış teknolojileri listeye çevirir"""
+    return [tech.strip() for tech in (value or '').split(',') if tech.strip()]
+
+def split_features(value):
+    """Satır satır yazılmış özellikleri listeye çevirir"""
+    return [feature.strip() for feature in (value or '').split('\n') if feature.strip()]
+
+TURKISH_ASCII = str.maketrans('çğıİöşüÇĞÖŞÜ', 'cgiIosuCGOSU')
+
+def technology_slug(name):
+    """'C#' -> 'c-sharp', 'C++' -> 'c-plus-plus', 'Node.js' -> 'nodejs'"""
+    value = name.translate(TURKISH_ASCII).replace('#', ' sharp').replace('+', ' plus')
+    return slugify(value, allow_unicode=True)
+
+class Technology(models.Model):
+    """Projelerde kullanılan teknolojiler - teknolojiden projelere ters indeks"""
+    name = models.CharField(max_length=100, verbose_name="Teknoloji")
+    slug = models.SlugField(max_length=100, unique=True, allow_unicode=True, verbose_name="URL Slug")
+    
+    class Meta:
+        verbose_name = "Teknoloji"
+        verbose_name_plural = "Teknolojiler"
+        ordering = ['name']
+        indexes = [
+            models.Index(fields=['name'], name='technology_name_idx'),
+        ]
+    
+    def __str__(self):
+        return self.name
+
 class Project(models.Model):
     CATEGORY_CHOICES = [
         ('web', 'Web Uygulaması'),
@@ -159,6 +226,11 @@ class Project(models.Model):
     order = models.IntegerField(default=0, verbose_name="Sıralama")
     created_date = models.DateField(verbose_name="Oluşturma Tarihi", auto_now_add=True)
     
+    # technologies ve features alanlarından kayıt sırasında üretilir
+    tech_items = models.JSONField(default=list, editable=False, verbose_name="Teknoloji Listesi")
+    feature_items = models.JSONField(default=list, editable=False, verbose_name="Özellik Listesi")
+    tech_tags = models.ManyToManyField(Technology, related_name='projects', blank=True, editable=False, verbose_name="Teknoloji Etiketleri")
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -166,20 +238,59 @@ class Project(models.Model):
         verbose_name = "Proje"
         verbose_name_plural = "Projeler"
         ordering = ['-created_date', '-order']
+        # Sondaki id, keyset sayfalamanın eşitlik kırıcısıdır (bkz. caching.PROJECT_ORDERING)
+        indexes = [
+            models.Index(fields=['-created_date', '-order', 'id'], name='project_order_idx'),
+            models.Index(fields=['category', '-created_date', '-order', 'id'], name='project_category_idx'),
+            models.Index(
+                fields=['-created_date', '-order'], condition=Q(is_featured=True),
+                name='project_featured_idx',
+            ),
+        ]
     
     def __str__(self):
         return self.title
     
+    def save(self, *args, **kwargs):
+        self.tech_items = split_technologies(self.technologies)
+        self.feature_items = split_features(self.features)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'technologies' in update_fields:
+                update_fields.add('tech_items')
+            if 'features' in update_fields:
+                update_fields.add('feature_items')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+        if update_fields is None or 'technologies' in update_fields:
+            self.sync_technologies()
+    
+    def sync_technologies(self):
+        """tech_items listesini Technology tablosuyla eşitler"""
+        names = {}
+        for name in self.tech_items:
+            slug = technology_slug(name)
+            if slug:
+                names.setdefault(slug, name)
+        
+        technologies = {t.slug: t for t in Technology.objects.filter(slug__in=names)}
+        missing = [Technology(name=name, slug=slug) for slug, name in names.items() if slug not in technologies]
+        if missing:
+            Technology.objects.bulk_create(missing, ignore_conflicts=True)
+            technologies = {t.slug: t for t in Technology.objects.filter(slug__in=names)}
+        self.tech_tags.set(technologies.values())
+    
     def get_absolute_url(self):
         return reverse('core:project_detail', kwargs={'slug': self.slug})
     
     @property
     def tech_list(self):
-        return [tech.strip() for tech in self.technologies.split(',') if tech.strip()]
+        return self.tech_items
     
     @property
     def features_list(self):
-        return [feature.strip() for feature in self.features.split('\n') if feature.strip()]
+        return self.feature_items
 
 class Certificate(models.Model):
     name = models.CharField(max_length=200, verbose_name="Sertifika Adı")
@@ -198,11 +309,26 @@ class Certificate(models.Model):
         verbose_name = "Sertifika"
         verbose_name_plural = "Sertifikalar"
         ordering = ['-date_received', 'order']
+        indexes = [
+            models.Index(fields=['-date_received', 'order'], name='certificate_order_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'organization'], name='certificate_natural_key'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.organization}"
 
 class ContactMessage(models.Model):
+    DELIVERY_PENDING = 'pending'
+    DELIVERY_SENT = 'sent'
+    DELIVERY_FAILED = 'failed'
+    DELIVERY_CHOICES = [
+        (DELIVERY_PENDING, 'Gönderilecek'),
+        (DELIVERY_SENT, 'Gönderildi'),
+        (DELIVERY_FAILED, 'Başarısız'),
+    ]
+    
     name = models.CharField(max_length=100, verbose_name="Ad Soyad")
     email = models.EmailField(verbose_name="E-posta")
     subject = models.CharField(max_length=200, verbose_name="Konu", blank=True)
@@ -210,10 +336,24 @@ class ContactMessage(models.Model):
     is_read = models.BooleanField(default=False, verbose_name="Okundu")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Gönderim Tarihi")
     
+    # E-posta giden kutusu (bkz. core/mail.py)
+    delivery_status = models.CharField(max_length=10, choices=DELIVERY_CHOICES, default=DELIVERY_PENDING, verbose_name="E-posta Durumu")
+    delivery_attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Gönderim Denemesi")
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name="Sonraki Deneme")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="E-posta Gönderilme Tarihi")
+    last_error = models.TextField(blank=True, verbose_name="Son Hata")
+    
     class Meta:
         verbose_name = "İletişim Mesajı"
         verbose_name_plural = "İletişim Mesajları"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['delivery_status', 'next_attempt_at'], name='contact_outbox_idx'),
+            # Yönetim listesi sıralamayı -pk ile tamamlar
+            models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+            # Okunmamış mesajlar toplamın küçük bir kısmıdır
+            models.Index(fields=['-created_at', '-id'], condition=Q(is_read=False), name='contact_unread_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.subject or 'Konusuz'}"
@@ -0,0 +1,154 @@
+"""
+Anahtar kümesi (keyset) sayfalama.
+
+OFFSET yerine son görülen kaydın sıralama değerlerinden sonrası istenir:
+
+    WHERE (created_date < %s) OR (created_date = %s AND "order" < %s) OR ...
+
+Böylece derin sayfalar da önceki satırları saymadan indeksten okunur ve
+sayfalar arasında eklenen/silinen kayıtlar kaymaya yol açmaz. Sıralama
+alanlarının NULL olmaması gerekir; tekillik için sona pk eklenir.
+
+Sayfa numarası olmadığından toplam sayı da gerekmez; gösterim için
+estimate_count COUNT(*) yerine tahmin veya üst sınırlı sayım kullanır.
+"""
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Max, Min, Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def supports_ordering(model, ordering):
+    """
+    Sıralama yalnızca modelin NULL olamayan kendi alanlarından oluşuyorsa
+    True. NULL değerler < ve > karşılaştırmalarında eşleşmez, ifadeler ve
+    ilişki alanları cursor'a yazılamaz; bunlarda satırlar atlanırdı.
+    """
+    for item in ordering:
+        if not isinstance(item, str):
+            return False
+        name = item.lstrip('-')
+        if name == 'pk':
+            continue
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        if field.null or field.is_relation or not field.concrete:
+            return False
+    return True
+
+
+class Keyset:
+    def __init__(self, model, ordering=None):
+        self.model = model
+        ordering = list(ordering or model._meta.ordering)
+        self.fields = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        if not any(name in ('pk', 'id') for name, _ in self.fields):
+            self.fields.append(('pk', False))
+
+    @property
+    def order_by(self):
+        return [f'-{name}' if descending else name for name, descending in self.fields]
+
+    @property
+    def names(self):
+        return [name for name, _ in self.fields]
+
+    def values_of(self, row):
+        if isinstance(row, dict):
+            return [row[name] for name in self.names]
+        return [getattr(row, name) for name in self.names]
+
+    def encode(self, row):
+        """Satırın (model örneği veya values() sözlüğü) sıralama değerlerinden cursor üretir"""
+        data = json.dumps(self.values_of(row), cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode(self, cursor):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            if not isinstance(values, list) or len(values) != len(self.fields):
+                raise ValueError
+            return [
+                self.model._meta.pk.to_python(value) if name == 'pk'
+                else self.model._meta.get_field(name).to_python(value)
+                for name, value in zip(self.names, values)
+            ]
+        except (ValueError, TypeError, ValidationError) as error:
+            raise InvalidCursor(cursor) from error
+
+    def after(self, values):
+        """Sıralamada verilen değerlerden sonra gelen kayıtlar için koşul"""
+        condition = Q()
+        for index, (name, descending) in enumerate(self.fields):
+            step = Q(**{f'{name}__{"lt" if descending else "gt"}': values[index]})
+            for previous, value in zip(self.names[:index], values):
+                step &= Q(**{previous: value})
+            condition |= step
+        return condition
+
+    def page(self, queryset, limit, cursor=None, values=None):
+        """
+        (satırlar, sonraki cursor) döndürür; tek sorgu çalışır. values
+        verilirse satırlar values() sözlükleridir ve sıralama alanları eklenir.
+        """
+        queryset = queryset.order_by(*self.order_by)
+        if cursor:
+            queryset = queryset.filter(self.after(self.decode(cursor)))
+        if values is not None:
+            queryset = queryset.values(*set(values) | set(self.names))
+        rows = list(queryset[:limit + 1])
+        next_cursor = self.encode(rows[limit - 1]) if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+
+# Sayım
+
+ESTIMATE = 'estimate'
+EXACT = 'exact'
+MORE = 'more'
+AUTO_FIELDS = ('AutoField', 'BigAutoField', 'SmallAutoField')
+
+
+def estimate_count(queryset, limit=1000):
+    """
+    (sayı, tür) döndürür. Filtresiz sorgularda tablo büyüklüğü tahmin edilir
+    (ESTIMATE); filtreli sorgular en fazla limit satıra kadar sayılır (EXACT,
+    limit aşılırsa MORE).
+    """
+    if not queryset.query.where:
+        estimate = table_estimate(queryset.model, queryset.db)
+        if estimate is not None:
+            return estimate, ESTIMATE
+    total = queryset.order_by()[:limit + 1].count()
+    return (total, EXACT) if total <= limit else (limit, MORE)
+
+
+def table_estimate(model, using='default'):
+    """
+    Tablodaki yaklaşık satır sayısı: PostgreSQL'de planlayıcı istatistiği,
+    diğerlerinde otomatik artan pk aralığı (silinen satırlar sayılır). İkisi
+    de tabloyu taramaz; tahmin yapılamazsa None.
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+    if model._meta.pk.get_internal_type() not in AUTO_FIELDS:
+        return None
+    # MIN ve MAX ayrı sorgularda indeksten tek adımda okunur; birlikte tarama yapar
+    manager = model._default_manager.using(using).order_by()
+    last = manager.aggregate(value=Max('pk'))['value']
+    if last is None:
+        return 0
+    return last - manager.aggregate(value=Min('pk'))['value'] + 1
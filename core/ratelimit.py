@@ -0,0 +1,182 @@
+"""
+İletişim formu için hız sınırlama ve tekrar eden gönderim engelleme.
+
+Kayan pencere sayaçları IP adresi ve e-posta adresi için ayrı ayrı
+tutulur; bir gönderimin kabul edilmesi için iki sınırın da aşılmamış
+olması gerekir. Aynı içerik belirli bir süre içinde tekrar gönderilirse
+veritabanına yazılmadan reddedilir; her tekrar bu süreyi baştan başlatır.
+Kabul edilen gönderim kaydedilemezse tekrar anahtarı silinir ve kabul
+sayacı yalnızca işlem tamamlandığında artırılır.
+
+Durum CONTACT_RATE_LIMIT_STORE ile seçilen önbellek takma adında saklanır
+ve yalnızca add/incr ile güncellenir; eşzamanlı istekler sınırı aşamaz.
+Varsayılan süreç içi LocMemCache'tir; birden fazla sunucu süreci için
+Redis/Memcached gibi paylaşılan bir arka uç tanımlanabilir.
+
+Site bir vekil sunucunun (nginx, yük dengeleyici) arkasındaysa
+REMOTE_ADDR tüm ziyaretçiler için vekilin adresidir. CONTACT_CLIENT_IP_HEADER
+(örn. 'HTTP_X_FORWARDED_FOR') ve CONTACT_TRUSTED_PROXIES (başlığa adres
+ekleyen vekil sayısı) ile istemci adresi başlıktan okunur.
+"""
+import hashlib
+import math
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+ACCEPTED = 'accepted'
+RATE_LIMITED = 'rate_limited'
+DUPLICATE = 'duplicate'
+OUTCOMES = (ACCEPTED, RATE_LIMITED, DUPLICATE)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def get_store():
+    return caches[_setting('CONTACT_RATE_LIMIT_STORE', 'ratelimit')]
+
+
+def _digest(value):
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+class SlidingWindow:
+    """
+    `period` saniyede en fazla `limit` istek. Her pencerenin sayacı ayrı bir
+    anahtarda tutulur; önceki pencerenin sayısı, pencereden geçen süre
+    oranında azaltılarak hesaba katılır. Reddedilen istekler de sayılır.
+    """
+
+    def __init__(self, limit, period, store=None):
+        self.limit = limit
+        self.period = period
+        self.store = store
+
+    def consume(self, key):
+        store = self.store or get_store()
+        position = time.time() / self.period
+        window = int(position)
+        current = f'{key}:{window}'
+        timeout = math.ceil(self.period * 2)
+        store.add(current, 0, timeout=timeout)
+        try:
+            count = store.incr(current)
+        except ValueError:
+            # Anahtar add ile incr arasında silindi (LRU temizliği)
+            store.add(current, 1, timeout=timeout)
+            count = 1
+        previous = store.get(f'{key}:{window - 1}', 0)
+        return previous * (1 - (position - window)) + count <= self.limit
+
+
+def client_ip(request):
+    """
+    İstemci adresi. CONTACT_CLIENT_IP_HEADER tanımlıysa başlıktaki listenin
+    sağından CONTACT_TRUSTED_PROXIES'inci adres kullanılır (soldaki değerleri
+    istemci kendisi yazabilir); başlık eksikse REMOTE_ADDR.
+    """
+    header = _setting('CONTACT_CLIENT_IP_HEADER', None)
+    if header:
+        proxies = max(1, _setting('CONTACT_TRUSTED_PROXIES', 1))
+        addresses = [part.strip() for part in request.META.get(header, '').split(',') if part.strip()]
+        if len(addresses) >= proxies:
+            return addresses[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def content_hash(data):
+    """Gönderimin e-posta, konu ve mesajından tekrar kontrolü için özet üretir"""
+    parts = [
+        str(data.get(field) or '').strip().casefold()
+        for field in ('email', 'subject', 'message')
+    ]
+    return _digest('\x1f'.join(parts))
+
+
+def _duplicate_key(digest):
+    return f'contact:dup:{digest}'
+
+
+def is_duplicate(digest, window=None, store=None):
+    """Aynı içerik son `window` saniye içinde görüldüyse True döner"""
+    store = store or get_store()
+    window = window or _setting('CONTACT_DUPLICATE_WINDOW', 600)
+    key = _duplicate_key(digest)
+    if store.add(key, 1, timeout=window):
+        return False
+    store.touch(key, timeout=window)
+    return True
+
+
+def release(digest, store=None):
+    """Kaydedilemeyen gönderimin tekrar anahtarını siler"""
+    (store or get_store()).delete(_duplicate_key(digest))
+
+
+def record(outcome, store=None):
+    store = store or get_store()
+    key = f'contact:counter:{outcome}'
+    store.add(key, 0, timeout=None)
+    try:
+        store.incr(key)
+    except ValueError:
+        store.set(key, 1, timeout=None)
+
+
+def counters(store=None):
+    """Kabul edilen ve reddedilen gönderim sayıları"""
+    store = store or get_store()
+    values = store.get_many([f'contact:counter:{outcome}' for outcome in OUTCOMES])
+    return {
+        outcome: values.get(f'contact:counter:{outcome}', 0)
+        for outcome in OUTCOMES
+    }
+
+
+def check_submission(request, data):
+    """
+    Gönderimi değerlendirir ve ACCEPTED, RATE_LIMITED veya DUPLICATE
+    döndürür. Reddedilen gönderimler sayaçlara hemen işlenir; kabul edilenler
+    için bkz. submission().
+    """
+    window = SlidingWindow(
+        limit=_setting('CONTACT_RATE_LIMIT_BURST', 5),
+        period=_setting('CONTACT_RATE_LIMIT_PERIOD', 3600),
+    )
+    email = str(data.get('email') or '').strip().casefold()
+    if not (window.consume(f'contact:ip:{_digest(client_ip(request))}')
+            and window.consume(f'contact:email:{_digest(email)}')):
+        outcome = RATE_LIMITED
+    elif is_duplicate(content_hash(data)):
+        outcome = DUPLICATE
+    else:
+        return ACCEPTED
+    record(outcome)
+    return outcome
+
+
+@contextmanager
+def submission(request, data):
+    """
+    check_submission sonucunu verir. Kabul edilen gönderim blok içinde hata
+    verirse tekrar anahtarı silinir (ziyaretçi yeniden deneyebilir); blok
+    başarıyla biterse kabul sayacı işlem tamamlandığında artırılır.
+
+        with ratelimit.submission(request, data) as outcome:
+            if outcome == ratelimit.ACCEPTED:
+                ContactMessage.objects.create(...)
+    """
+    outcome = check_submission(request, data)
+    try:
+        yield outcome
+    except BaseException:
+        if outcome == ACCEPTED:
+            release(content_hash(data))
+        raise
+    if outcome == ACCEPTED:
+        transaction.on_commit(lambda: record(ACCEPTED))
@@ -0,0 +1,270 @@
+"""
+Site içi arama.
+
+Project, Experience, Skill ve Certificate kayıtları SQLite FTS5 sanal
+tablosunda (core_search_index) indekslenir ve sinyallerle güncel tutulur.
+Metin indekslenmeden önce Türkçe'ye uygun biçimde katlanır: İ/I/ı harfleri
+'i' olur, böylece "ılık" ile "ILIK" ve "İstanbul" ile "istanbul" eşleşir.
+Diğer aksanlar (ç, ş, ğ, ö, ü) tokenizer tarafından kaldırılır.
+
+Her belgenin rowid değeri kayıt id'si ve kaynak numarasından üretilir;
+güncelleme ve silme tam tablo taraması olmadan rowid ile yapılır.
+
+İletişim mesajları herkese açık aramaya karışmasın diye ayrı bir tabloda
+(core_message_index, rowid = mesaj id'si) indekslenir; yönetim panelindeki
+mesaj araması bu tabloyu kullanır. Silinen mesajları indeksten bir SQLite
+tetikleyicisi çıkarır, böylece toplu silme Django'nun hızlı silmesiyle tek
+DELETE olarak çalışır.
+"""
+import re
+
+from django.apps import apps as global_apps
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.urls import reverse
+
+SEARCH_TABLE = 'core_search_index'
+MESSAGE_TABLE = 'core_message_index'
+
+TURKISH_FOLD = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+
+
+def fold(text):
+    """Türkçe i harflerini birleştirip küçük harfe çevirir"""
+    return (text or '').translate(TURKISH_FOLD).casefold()
+
+
+class SearchSource:
+    def __init__(self, code, model_name, label, title_fields, body_fields):
+        self.code = code
+        self.model_name = model_name
+        self.label = label
+        self.title_fields = title_fields
+        self.body_fields = body_fields
+
+    def get_model(self, apps=global_apps):
+        return apps.get_model('core', self.model_name)
+
+    @property
+    def fields(self):
+        return self.title_fields + self.body_fields
+
+    def document(self, values):
+        """Alan değerlerinden (title, body) çifti üretir"""
+        def join(names):
+            return fold(' '.join(str(values[name] or '') for name in names))
+        return join(self.title_fields), join(self.body_fields)
+
+    def rowid(self, pk):
+        return pk * len(SOURCES) + self.code
+
+    def url(self, obj):
+        if self.model_name == 'Project':
+            return obj.get_absolute_url()
+        if self.model_name == 'Skill':
+            return reverse('core:skills')
+        if self.model_name == 'Certificate' and obj.credential_url:
+            return obj.credential_url
+        return reverse('core:about')
+
+
+SOURCES = (
+    SearchSource(0, 'Project', 'Proje', ('title',), ('short_description', 'description', 'technologies', 'features')),
+    SearchSource(1, 'Experience', 'Deneyim', ('position', 'company'), ('location', 'description')),
+    SearchSource(2, 'Skill', 'Yetenek', ('name',), ('description',)),
+    SearchSource(3, 'Certificate', 'Sertifika', ('name', 'organization'), ('description',)),
+)
+SOURCES_BY_MODEL = {source.model_name: source for source in SOURCES}
+
+
+class SearchResult:
+    def __init__(self, source, obj, rank=None):
+        self.kind = source.label
+        self.object = obj
+        self.title = str(obj)
+        self.url = source.url(obj)
+        self.rank = rank
+
+
+def is_available(db=connection):
+    """FTS5 tablosu yalnızca SQLite üzerinde oluşturulur"""
+    return db.vendor == 'sqlite'
+
+
+def create_table(db=connection, table=SEARCH_TABLE):
+    with db.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5('
+            f"title, body, tokenize='unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_table(db=connection, table=SEARCH_TABLE):
+    with db.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+
+def index_instance(instance):
+    source = SOURCES_BY_MODEL.get(type(instance).__name__)
+    if source is None or not is_available():
+        return
+    title, body = source.document({name: getattr(instance, name) for name in source.fields})
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, body) VALUES (%s, %s, %s)',
+            [source.rowid(instance.pk), title, body],
+        )
+
+
+def remove_instance(instance):
+    source = SOURCES_BY_MODEL.get(type(instance).__name__)
+    if source is None or not is_available():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [source.rowid(instance.pk)]
+        )
+
+
+def _insert(cursor, table, documents, chunk_size):
+    """(rowid, title, body) satırlarını parça parça yazar; yazılan sayıyı döndürür"""
+    total = 0
+    rows = []
+    for row in documents:
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            cursor.executemany(f'INSERT INTO {table} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+            total += len(rows)
+            rows = []
+    if rows:
+        cursor.executemany(f'INSERT INTO {table} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+        total += len(rows)
+    return total
+
+
+def rebuild(apps=global_apps, db=connection, chunk_size=2000):
+    """
+    İndeksi baştan oluşturur ve indekslenen belge sayısını döndürür. Tek
+    işlemde çalışır; otomatik commit ile her satır ayrı yazılırdı.
+    """
+    total = 0
+    with transaction.atomic(using=db.alias), db.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        for source in SOURCES:
+            values = source.get_model(apps).objects.values('pk', *source.fields)
+            total += _insert(cursor, SEARCH_TABLE, (
+                (source.rowid(item['pk']), *source.document(item))
+                for item in values.iterator(chunk_size=chunk_size)
+            ), chunk_size)
+    return total
+
+
+# İletişim mesajları
+
+MESSAGE_TITLE_FIELDS = ('name', 'email', 'subject')
+
+
+def message_document(values):
+    title = fold(' '.join(values[name] or '' for name in MESSAGE_TITLE_FIELDS))
+    return title, fold(values['message'])
+
+
+def index_message(message):
+    if not is_available():
+        return
+    values = {name: getattr(message, name) for name in (*MESSAGE_TITLE_FIELDS, 'message')}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT OR REPLACE INTO {MESSAGE_TABLE} (rowid, title, body) VALUES (%s, %s, %s)',
+            [message.pk, *message_document(values)],
+        )
+
+
+def rebuild_messages(apps=global_apps, db=connection, chunk_size=2000):
+    with transaction.atomic(using=db.alias), db.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {MESSAGE_TABLE}')
+        values = apps.get_model('core', 'ContactMessage').objects.order_by().values(
+            'pk', *MESSAGE_TITLE_FIELDS, 'message',
+        )
+        return _insert(cursor, MESSAGE_TABLE, (
+            (item['pk'], *message_document(item))
+            for item in values.iterator(chunk_size=chunk_size)
+        ), chunk_size)
+
+
+def message_ids(query):
+    """
+    Sorguyla eşleşen mesaj id'leri için alt sorgu; queryset.filter(pk__in=...)
+    ile kullanılır. Sorguda kelime yoksa None.
+    """
+    expression = match_expression(query)
+    if not expression:
+        return None
+    return RawSQL(f'SELECT rowid FROM {MESSAGE_TABLE} WHERE {MESSAGE_TABLE} MATCH %s', [expression])
+
+
+def match_expression(query):
+    """Her kelimeyi önek araması yapan bir FTS5 sorgusuna çevirir"""
+    terms = re.findall(r'\w+', fold(query))
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _load(hits):
+    """(source, pk, rank) listesini sırayı koruyarak nesnelere çevirir"""
+    ids = {}
+    for source, pk, rank in hits:
+        ids.setdefault(source, []).append(pk)
+    # Sıra bm25'ten gelir; in_bulk sözlük döndürdüğünden varsayılan sıralama gereksiz
+    objects = {
+        source: source.get_model().objects.order_by().in_bulk(pks)
+        for source, pks in ids.items()
+    }
+    return [
+        SearchResult(source, objects[source][pk], rank)
+        for source, pk, rank in hits
+        if pk in objects[source]
+    ]
+
+
+def search(query, limit=20):
+    """Sorguya en uygun kayıtları sıralı SearchResult listesi olarak döndürür"""
+    expression = match_expression(query)
+    if not expression:
+        return []
+    if not is_available():
+        return _fallback_search(query, limit)
+
+    # Başlık eşleşmeleri gövdeye göre daha yüksek puan alır
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid, bm25({SEARCH_TABLE}, 10.0, 1.0) AS rank '
+                f'FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s '
+                f'ORDER BY rank LIMIT %s',
+                [expression, limit],
+            )
+            rows = cursor.fetchall()
+    except DatabaseError:
+        return []
+    hits = [
+        (SOURCES[rowid % len(SOURCES)], rowid // len(SOURCES), rank)
+        for rowid, rank in rows
+    ]
+    return _load(hits)
+
+
+def _fallback_search(query, limit):
+    """FTS5 olmayan veritabanlarında basit icontains araması"""
+    terms = query.split()
+    results = []
+    for source in SOURCES:
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for name in source.fields:
+                term_condition |= Q(**{f'{name}__icontains': term})
+            condition &= term_condition
+        for obj in source.get_model().objects.filter(condition)[:limit]:
+            results.append(SearchResult(source, obj))
+    return results[:limit]
@@ -0,0 +1,140 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import caching, images, search
+from .models import (
+    PersonalInfo, Education, Experience, Skill, Technology, Project,
+    Certificate, ContactMessage, SiteSettings
+)
+
+# Herkese açık sayfalarda gösterilen modeller. ContactMessage sayfalarda
+# görünmediği için sayfa önbelleğini geçersiz kılmaz.
+CONTENT_MODELS = (
+    PersonalInfo, Education, Experience, Skill, Technology, Project,
+    Certificate, SiteSettings,
+)
+
+
+@receiver(post_save, sender=PersonalInfo)
+@receiver(post_delete, sender=PersonalInfo)
+@receiver(post_save, sender=SiteSettings)
+@receiver(post_delete, sender=SiteSettings)
+def invalidate_site_context(sender, **kwargs):
+    """Tekil kayıtlar değiştiğinde ortak context önbelleğini temizle"""
+    caching.invalidate_site_context()
+
+
+def invalidate_content(sender, **kwargs):
+    """İçerik modellerinden biri değiştiğinde sayfa önbelleğini geçersiz kıl"""
+    caching.invalidate(caching.CONTENT)
+
+
+# Göndericisiz alıcı her modelde (Session, LogEntry) Django'nun hızlı
+# silmesini kapatırdı; alıcı yalnızca içerik modellerine bağlanır
+for model in CONTENT_MODELS:
+    post_save.connect(invalidate_content, sender=model)
+    post_delete.connect(invalidate_content, sender=model)
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def invalidate_skill_groups(sender, **kwargs):
+    caching.invalidate(caching.SKILLS)
+
+
+@receiver(pre_save, sender=Project)
+def remember_project_category(sender, instance, raw=False, **kwargs):
+    """Kategori sayılarını güncelleyebilmek için eski kategoriyi sakla"""
+    instance._previous_category = None
+    if instance.pk and not raw:
+        instance._previous_category = (
+            Project.objects.filter(pk=instance.pk)
+            .values_list('category', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Project)
+def update_project_cache(sender, instance, created, **kwargs):
+    """Proje listesini geçersiz kıl, kategori sayılarını artır/azalt"""
+    caching.invalidate(caching.PROJECTS)
+
+    previous = getattr(instance, '_previous_category', None)
+    current = instance.category
+    if not created and (previous is None or previous == current):
+        return
+
+    def adjust():
+        if previous is not None:
+            caching.adjust_project_category_count(previous, -1)
+        caching.adjust_project_category_count(current, 1)
+    transaction.on_commit(adjust)
+
+
+@receiver(post_delete, sender=Project)
+def remove_project_from_cache(sender, instance, **kwargs):
+    caching.invalidate(caching.PROJECTS)
+    category = instance.category
+    transaction.on_commit(
+        lambda: caching.adjust_project_category_count(category, -1)
+    )
+
+
+@receiver(m2m_changed, sender=Project.tech_tags.through)
+def invalidate_technology_index(sender, action, **kwargs):
+    """Teknoloji etiketleri değiştiğinde filtrelenmiş listeleri geçersiz kıl"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        caching.invalidate(caching.PROJECTS)
+        caching.invalidate(caching.CONTENT)
+
+
+def update_search_index(sender, instance, **kwargs):
+    """Aranabilir modeller kaydedildiğinde FTS indeksini güncelle"""
+    search.index_instance(instance)
+
+
+def remove_from_search_index(sender, instance, **kwargs):
+    search.remove_instance(instance)
+
+
+for source in search.SOURCES:
+    post_save.connect(update_search_index, sender=source.get_model())
+    post_delete.connect(remove_from_search_index, sender=source.get_model())
+
+
+@receiver(pre_save, sender=Project)
+@receiver(pre_save, sender=Certificate)
+@receiver(pre_save, sender=PersonalInfo)
+def remember_images(sender, instance, raw=False, **kwargs):
+    """Değiştirilen görsellerin türevlerini silebilmek için eski yolları sakla"""
+    instance._previous_images = [] if raw else images.stored_image_names(instance)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Certificate)
+@receiver(post_save, sender=PersonalInfo)
+def generate_image_derivatives(sender, instance, raw=False, **kwargs):
+    """Yeni yüklenen görseller için boyutlandırılmış kopyaları üret"""
+    if not raw:
+        current = images.image_names(instance)
+        images.schedule_cleanup([
+            name for name in getattr(instance, '_previous_images', ()) if name not in current
+        ])
+        images.schedule_derivatives(instance)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Certificate)
+@receiver(post_delete, sender=PersonalInfo)
+def remove_image_derivatives(sender, instance, **kwargs):
+    images.schedule_cleanup(images.image_names(instance))
+
+
+@receiver(post_save, sender=ContactMessage)
+def update_message_index(sender, instance, **kwargs):
+    """Yönetim panelindeki mesaj araması için ayrı FTS indeksi"""
+    search.index_message(instance)
+
+# Silinen mesajlar indeksten veritabanı tetikleyicisiyle çıkarılır (0009);
+# post_delete alıcısı milyonlarca satırlık toplu silmede hızlı silmeyi kapatırdı
@@ -0,0 +1,99 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.template.base import TextNode
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+
+from core.assets import TemplateAsset
+from core.vendor import CDN_FALLBACKS
+
+register = template.Library()
+
+
+class AssetNode(template.Node):
+    def __init__(self, asset):
+        self.asset = asset
+
+    def render(self, context):
+        url = static(self.asset.name)
+        if self.asset.name.endswith('.js'):
+            return format_html('<script src="{}"></script>', url)
+        if not self.asset.critical_css:
+            return format_html('<link href="{}" rel="stylesheet">', url)
+        # Kritik kurallar satır içinde, geri kalanı sayfa çizildikten sonra yüklenir
+        return format_html(
+            '<style>{}</style>\n'
+            '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+            '<noscript><link href="{}" rel="stylesheet"></noscript>',
+            mark_safe(self.asset.critical_css), url, url,
+        )
+
+
+def _literal(parser, bit, tag_name):
+    value = parser.compile_filter(bit)
+    if value.filters or not isinstance(value.var, str):
+        raise template.TemplateSyntaxError(f'{tag_name} yalnızca sabit dizgi argüman alır: {bit}')
+    return value.var
+
+
+@register.tag
+def asset(parser, token):
+    """
+    Sayfaya özel <style> veya <script> bloğunu ayrı bir statik dosyaya
+    taşır; HTML'de yalnızca bağlantısı kalır. Dosya `build_assets` ve
+    `collectstatic` sırasında üretilir.
+
+        {% asset "pages/about.css" critical=".page-hero" %}
+        <style>...</style>
+        {% endasset %}
+
+    critical verilirse seçicisinde bu sınıflar geçen kurallar satır içinde
+    bırakılır ve stil dosyası sayfayı bloklamadan yüklenir. Blok içinde
+    şablon etiketi veya değişken kullanılamaz.
+    """
+    bits = token.split_contents()
+    tag_name = bits[0]
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f'{tag_name} bir dosya adı bekler')
+    name = _literal(parser, bits[1], tag_name)
+    critical = ()
+    for bit in bits[2:]:
+        key, _, value = bit.partition('=')
+        if key != 'critical' or not value:
+            raise template.TemplateSyntaxError(f'{tag_name} için bilinmeyen argüman: {bit}')
+        critical = _literal(parser, value, tag_name).replace(',', ' ').split()
+
+    nodelist = parser.parse((f'end{tag_name}',))
+    parser.delete_first_token()
+    if any(not isinstance(node, TextNode) for node in nodelist):
+        raise template.TemplateSyntaxError(f'{tag_name} bloğunda şablon etiketi kullanılamaz')
+
+    origin = parser.origin
+    return AssetNode(TemplateAsset(
+        name,
+        ''.join(node.s for node in nodelist),
+        critical=critical,
+        template_name=origin.template_name if origin else None,
+        lineno=token.lineno,
+    ))
+
+
+@lru_cache(maxsize=None)
+def _is_vendored(path):
+    return finders.find(path) is not None
+
+
+@register.simple_tag
+def vendor_static(path):
+    """
+    static/vendor/ altındaki üçüncü taraf dosyanın adresi. Dosya henüz
+    indirilmemişse (bkz. subset_vendor_assets --fetch) CDN adresine döner.
+
+        <script src="{% vendor_static 'vendor/aos/aos.js' %}"></script>
+    """
+    if path in CDN_FALLBACKS and not _is_vendored(path):
+        return CDN_FALLBACKS[path]
+    return static(path)
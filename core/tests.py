@@ -1,3 +1,1137 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+from pathlib import Path
+from smtplib import SMTPException
+import unittest
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.staticfiles import finders
+from django.core import mail
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import CommandError, call_command
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models.signals import post_delete
+from django.template import Context, Template
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from .admin import ContactMessageAdmin
+from .caching import get_project_category_counts
+from .management.commands import export_site
+from .mail import dispatch_pending
+from .models import Certificate, ContactMessage, Education, Experience, PersonalInfo, Project, Skill
+from .views import PAGE_DEPENDENCIES
+from . import assets, benchmark, caching, cvdata, exports, images, instrumentation, pagination, ratelimit, search, vendor
+
+
+def setUpModule():
+    # Paylaşılan önbellek geliştirme sunucusunun build/cache dizini yerine
+    # geçici bir dizinde tutulur; clear_caches() onu silmesin
+    directory = tempfile.TemporaryDirectory()
+    unittest.addModuleCleanup(directory.cleanup)
+    shared = {**settings.CACHES['shared'], 'LOCATION': directory.name}
+    override = override_settings(CACHES={**settings.CACHES, 'shared': shared})
+    override.enable()
+    unittest.addModuleCleanup(override.disable)
+
+
+def clear_caches():
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+def make_project(slug, category='web', **kwargs):
+    defaults = {
+        'title': slug.title(),
+        'short_description': 'Kısa açıklama',
+        'description': 'Detaylı açıklama',
+        'technologies': 'Python, Django',
+        'features': 'Birinci\nİkinci',
+    }
+    defaults.update(kwargs)
+    return Project.objects.create(slug=slug, category=category, **defaults)
+
+
+class ProjectCategoryCountTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_project('alpha', 'web')
+            make_project('beta', 'web')
+            make_project('gamma', 'api')
+
+    def test_projects_page_query_count(self):
+        """Kategori sayısı ne olursa olsun /projects/ sabit sayıda sorgu yapar"""
+        # ETag damgaları + PersonalInfo + SiteSettings + proje listesi + kategori sayıları
+        with self.assertNumQueries(5):
+            response = self.client.get('/projects/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['category_counts']['web'], 2)
+
+        with self.assertNumQueries(0):
+            self.client.get('/projects/')
+
+    def test_technology_filter(self):
+        make_project('delta', 'api', technologies='C#, ASP.NET Core')
+        response = self.client.get('/projects/?tech=c-sharp')
+        self.assertEqual([p.slug for p in response.context['projects']], ['delta'])
+        response = self.client.get('/projects/?tech=django&category=web')
+        self.assertEqual(
+            sorted(p.slug for p in response.context['projects']), ['alpha', 'beta']
+        )
+
+    @override_settings(PROJECTS_PAGE_SIZE=2)
+    def test_keyset_pages_and_fragments(self):
+        for index in range(4):
+            make_project(f'web-{index}', 'web', order=index)
+        response = self.client.get('/projects/?category=web')
+        slugs = [p.slug for p in response.context['projects']]
+        self.assertEqual(len(slugs), 2)
+        self.assertContains(response, 'class="btn btn-secondary projects-more"')
+
+        # Parçalar aynı filtreyle kalan kartları sırayla getirir
+        cursor = first = response.context['next_cursor']
+        while cursor:
+            response = self.client.get(f'/projects/more/{cursor}/?category=web')
+            self.assertNotContains(response, '<html')
+            slugs += [p.slug for p in response.context['projects']]
+            cursor = response.context['next_cursor']
+        expected = Project.objects.filter(category='web').order_by('-created_date', '-order', 'id')
+        self.assertEqual(slugs, [p.slug for p in expected])
+
+        # JavaScript olmadan ?cursor= tam sayfayı açar; bozuk cursor 400 döner
+        response = self.client.get(f'/projects/?category=web&cursor={first}')
+        self.assertEqual([p.slug for p in response.context['projects']], slugs[2:4])
+        self.assertEqual(self.client.get('/projects/more/bozuk/').status_code, 400)
+        self.assertEqual(self.client.get('/projects/?cursor=bozuk').status_code, 400)
+
+    def test_counts_follow_saves_and_deletes(self):
+        self.assertEqual(get_project_category_counts()['web'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Project.objects.get(slug='alpha')
+            project.category = 'mobile'
+            project.save()
+        with self.assertNumQueries(0):
+            counts = get_project_category_counts()
+        self.assertEqual(counts['web'], 1)
+        self.assertEqual(counts['mobile'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.get(slug='gamma').delete()
+        self.assertEqual(get_project_category_counts()['api'], 0)
+
+    def test_counts_expire_after_unsignalled_writes(self):
+        get_project_category_counts()
+        Project.objects.filter(slug='gamma').update(category='web')
+        self.assertEqual(get_project_category_counts()['web'], 2)
+        # Süre dolunca sayılar yeniden hesaplanır
+        with mock.patch('time.time', return_value=time.time() + settings.PROJECT_CATEGORY_COUNT_TIMEOUT + 1):
+            self.assertEqual(get_project_category_counts()['web'], 3)
+
+    def test_filters_show_counts(self):
+        response = self.client.get('/projects/?category=web')
+        self.assertContains(response, 'Tümü <span class="filter-count">3</span>', html=False)
+        self.assertContains(response, 'class="project-filter active">Web Uygulaması <span class="filter-count">2</span>')
+        self.assertNotContains(response, '?category=mobile')
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise SMTPException('SMTP zaman aşımı')
+
+
+@override_settings(CONTACT_MAIL_DISPATCH='worker')
+class ContactMailOutboxTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        PersonalInfo.objects.create(bio='Bio', about_text='Hakkımda', email='sahip@example.com')
+
+    def submit(self, **data):
+        payload = {'name': 'Ayşe', 'email': 'ayse@example.com', 'subject': 'Merhaba', 'message': 'Selam'}
+        payload.update(data)
+        return self.client.post('/contact/submit/', json.dumps(payload), content_type='application/json')
+
+    def test_submit_queues_without_sending(self):
+        response = self.submit()
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(len(mail.outbox), 0)
+        message = ContactMessage.objects.get()
+        self.assertEqual(message.delivery_status, ContactMessage.DELIVERY_PENDING)
+
+    def test_dispatch_sends_batch(self):
+        self.submit(subject='Bir')
+        self.submit(subject='İki')
+        self.assertEqual(dispatch_pending(), 2)
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, ['sahip@example.com'])
+        self.assertFalse(
+            ContactMessage.objects.exclude(delivery_status=ContactMessage.DELIVERY_SENT).exists()
+        )
+        self.assertEqual(dispatch_pending(), 0)
+
+    @override_settings(
+        EMAIL_BACKEND='core.tests.FailingEmailBackend',
+        CONTACT_MAIL_MAX_ATTEMPTS=2,
+        CONTACT_MAIL_RETRY_DELAY=0,
+    )
+    def test_failed_delivery_is_retried_then_given_up(self):
+        self.submit()
+        with self.assertLogs('core.mail', 'WARNING'):
+            self.assertEqual(dispatch_pending(), 0)
+        message = ContactMessage.objects.get()
+        self.assertEqual(message.delivery_status, ContactMessage.DELIVERY_PENDING)
+        self.assertEqual(message.delivery_attempts, 1)
+        self.assertIn('SMTP', message.last_error)
+
+        with self.assertLogs('core.mail', 'WARNING'):
+            dispatch_pending()
+        message.refresh_from_db()
+        self.assertEqual(message.delivery_status, ContactMessage.DELIVERY_FAILED)
+        self.assertEqual(message.delivery_attempts, 2)
+
+
+@override_settings(
+    CONTACT_MAIL_DISPATCH='worker',
+    CONTACT_RATE_LIMIT_BURST=2,
+    CONTACT_RATE_LIMIT_PERIOD=3600,
+)
+class ContactThrottleTests(TestCase):
+    def setUp(self):
+        clear_caches()
+
+    def submit(self, message, email='ayse@example.com', ip='10.0.0.1'):
+        payload = {'name': 'Ayşe', 'email': email, 'subject': 'Merhaba', 'message': message}
+        return self.client.post(
+            '/contact/submit/', json.dumps(payload),
+            content_type='application/json', REMOTE_ADDR=ip,
+        )
+
+    def test_rate_limit_per_ip_and_email(self):
+        self.assertEqual(self.submit('Bir').status_code, 200)
+        self.assertEqual(self.submit('İki').status_code, 200)
+        self.assertEqual(self.submit('Üç').status_code, 429)
+        # Aynı e-posta başka IP'den de sınırlıdır
+        self.assertEqual(self.submit('Dört', ip='10.0.0.2').status_code, 429)
+        self.assertEqual(self.submit('Beş', email='ali@example.com', ip='10.0.0.3').status_code, 200)
+        self.assertEqual(ContactMessage.objects.count(), 3)
+
+    def test_duplicate_rejected_before_write(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.submit('Aynı mesaj').status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.submit('  aynı MESAJ ', ip='10.0.0.9')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(ContactMessage.objects.count(), 1)
+        self.assertEqual(
+            ratelimit.counters(),
+            {ratelimit.ACCEPTED: 1, ratelimit.RATE_LIMITED: 0, ratelimit.DUPLICATE: 1},
+        )
+
+    def test_failed_write_can_be_retried(self):
+        with mock.patch.object(ContactMessage.objects, 'create', side_effect=DatabaseError('disk I/O error')):
+            self.assertFalse(self.submit('Tekrar dene').json()['success'])
+        self.assertEqual(ratelimit.counters()[ratelimit.ACCEPTED], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.submit('Tekrar dene').status_code, 200)
+        self.assertEqual(ratelimit.counters()[ratelimit.ACCEPTED], 1)
+
+    @override_settings(CONTACT_CLIENT_IP_HEADER='HTTP_X_FORWARDED_FOR', CONTACT_RATE_LIMIT_BURST=1)
+    def test_client_ip_from_trusted_proxy_header(self):
+        def submit(message, forwarded):
+            return self.client.post(
+                '/contact/submit/', json.dumps({'name': 'A', 'email': f'{message}@example.com', 'message': message}),
+                content_type='application/json', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=forwarded,
+            )
+
+        self.assertEqual(submit('bir', '203.0.113.1').status_code, 200)
+        self.assertEqual(submit('iki', '203.0.113.2').status_code, 200)
+        # İstemcinin yazdığı soldaki adres dikkate alınmaz
+        self.assertEqual(submit('uc', '198.51.100.7, 203.0.113.1').status_code, 429)
+
+    def test_window_is_atomic_under_concurrency(self):
+        window = ratelimit.SlidingWindow(limit=10, period=3600)
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(lambda _: window.consume('contact:test'), range(100)))
+        self.assertEqual(results.count(True), 10)
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        make_project('portfolio', title='Kişisel Portfolio', technologies='Django, Three.js')
+        Experience.objects.create(
+            position='Yazılım Takım Lideri', company='IŞIK Bilişim', location='Ankara',
+            start_date='2020-01-01', description='Django ile kurumsal uygulamalar',
+        )
+        Certificate.objects.create(name='Azure Fundamentals', organization='Microsoft', date_received='2023-05-01')
+
+    def test_prefix_and_turkish_folding(self):
+        self.assertEqual([r.title for r in search.search('portf')], ['Kişisel Portfolio'])
+        # İ/I/ı ve diğer Türkçe harfler katlanır
+        self.assertEqual(len(search.search('isik bilisim')), 1)
+        self.assertEqual(len(search.search('ANKARA')), 1)
+
+    def test_ranking_and_sync(self):
+        results = search.search('django')
+        self.assertEqual(len(results), 2)
+        # Başlık eşleşmesi gövde eşleşmelerinden önce gelir
+        certificate = Certificate.objects.get()
+        certificate.name = 'Django Sertifikası'
+        certificate.save()
+        self.assertEqual(search.search('django')[0].object, certificate)
+        certificate.delete()
+        self.assertEqual(len(search.search('django')), 2)
+
+    def test_search_page(self):
+        response = self.client.get('/search/', {'q': 'azure'})
+        self.assertContains(response, 'Azure Fundamentals')
+
+
+class SiteCacheTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.info = PersonalInfo.objects.create(name='Okan Kantar', bio='Bio', about_text='Hakkımda')
+
+    def test_cached_page_until_save(self):
+        self.client.get('/skills/')
+        with self.assertNumQueries(0):
+            self.assertContains(self.client.get('/skills/'), 'Okan Kantar')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.info.name = 'Yeni Ad'
+            self.info.save()
+        self.assertContains(self.client.get('/skills/'), 'Yeni Ad')
+
+    def test_concurrent_bumps_are_atomic(self):
+        self.assertNotEqual(Path(caching.shared_cache()._dir), settings.BASE_DIR / 'build' / 'cache')
+        start = caching.get_version(caching.SKILLS)
+
+        def bump(_):
+            for _ in range(10):
+                caching.bump_version(caching.SKILLS)
+            caches.close_all()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(bump, range(8)))
+        self.assertEqual(caching.get_version(caching.SKILLS), start + 80)
+
+    def test_shared_cache_must_be_atomic(self):
+        self.assertEqual(caching.check_shared_cache(), [])
+        local = {**settings.CACHES, 'shared': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        with self.settings(CACHES=local):
+            self.assertEqual([error.id for error in caching.check_shared_cache()], ['core.E001'])
+
+    def test_only_content_models_invalidate(self):
+        from django.contrib.sessions.models import Session
+
+        with mock.patch.object(caching, 'invalidate') as invalidate:
+            Session.objects.create(session_key='x', session_data='', expire_date='2030-01-01T00:00Z')
+            Session.objects.all().delete()
+            invalidate.assert_not_called()
+            Education.objects.create(school='Okul', department='Bölüm', degree='lisans', start_year=2010)
+        invalidate.assert_any_call(caching.CONTENT)
+
+    def test_version_bump_from_another_process(self):
+        self.assertNotIsInstance(caching.shared_cache(), LocMemCache)
+        self.client.get('/skills/')
+        # Başka bir süreç (ör. import_cv) veriyi değiştirip sürümü artırır
+        PersonalInfo.objects.update(name='Komuttan')
+        other = caches.create_connection(settings.SHARED_CACHE_ALIAS)
+        for name in (caching.SITE_CONTEXT, caching.CONTENT):
+            other.incr(caching._version_key(name))
+        self.assertContains(self.client.get('/skills/'), 'Komuttan')
+
+    def test_skills_page_lists_every_category(self):
+        response = self.client.get('/skills/')
+        self.assertContains(response, 'fab fa-js')  # boş veritabanında varsayılanlar
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name='Django', category='framework', level=80)
+            Skill.objects.create(name='Sunum', category='soft', level=70)
+        response = self.client.get('/skills/')
+        for text in ('Framework ve Kütüphaneler', 'Django', 'Kişisel Beceriler', 'Sunum'):
+            self.assertContains(response, text)
+        self.assertNotContains(response, 'Veritabanları')
+        self.assertNotContains(response, 'fab fa-js')
+
+
+@override_settings(PROJECTS_PAGE_SIZE=1)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        PersonalInfo.objects.create(bio='Bio', about_text='Hakkımda')
+        make_project('alpha', is_featured=True)
+        make_project('beta')
+        Skill.objects.create(name='Python', category='backend', level=90, is_featured=True)
+        Experience.objects.create(position='Geliştirici', company='Firma', location='Ankara', start_date='2020-01-01')
+        Education.objects.create(degree='lisans', school='Okul', department='Bölüm', start_year=2008, location='Ankara')
+        Certificate.objects.create(name='Sertifika', organization='Kurum', date_received='2023-05-01')
+
+    def url(self, name):
+        if name == 'project_detail':
+            return reverse('core:project_detail', kwargs={'slug': 'alpha'})
+        if name == 'projects_more':
+            cursor = caching.get_project_page(limit=1)[1]
+            return reverse('core:projects_more', kwargs={'cursor': cursor})
+        return reverse(f'core:{name}')
+
+    def get_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200, url)
+        return len(queries)
+
+    def test_hit_miss_and_invalidate_for_every_page(self):
+        for name, models in PAGE_DEPENDENCIES.items():
+            # Tüm sayfalar PersonalInfo ve SiteSettings'e de bağlıdır
+            for model in (PersonalInfo, *models):
+                with self.subTest(page=name, model=model.__name__):
+                    url = self.url(name)
+                    self.get_queries(url)
+                    self.assertEqual(self.get_queries(url), 0)
+                    with self.captureOnCommitCallbacks(execute=True):
+                        model.objects.first().save()
+                    self.assertGreater(self.get_queries(url), 0)
+                    self.assertEqual(self.get_queries(url), 0)
+
+    def test_key_ignores_unrelated_parameters(self):
+        self.get_queries('/projects/?category=web')
+        self.assertEqual(self.get_queries('/projects/?category=web&utm_source=x'), 0)
+        self.assertGreater(self.get_queries('/projects/?category=api'), 0)
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        make_project('alpha')
+
+    def test_not_modified_without_rendering(self):
+        response = self.client.get('/projects/alpha/')
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        with self.assertNumQueries(0), self.assertTemplateNotUsed('core/project_detail.html'):
+            response = self.client.get('/projects/alpha/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        make_project('beta')
+        response = self.client.get('/projects/alpha/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_delete_changes_validator(self):
+        etag = self.client.get('/about/')['ETag']
+        self.assertEqual(self.client.get('/about/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        etag = self.client.get('/projects/')['ETag']
+        Project.objects.get().delete()
+        self.assertEqual(self.client.get('/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_new_build_changes_validator(self):
+        with self.settings(SITE_BUILD_ID='eski'):
+            etag = self.client.get('/about/')['ETag']
+            self.assertEqual(self.client.get('/about/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.settings(SITE_BUILD_ID='yeni'), self.assertTemplateUsed('core/about.html'):
+            response = self.client.get('/about/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(IMAGE_DERIVATIVES_ENABLED=False)
+class ImageDerivativeTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.enterContext(override_settings(MEDIA_ROOT=media.name))
+
+    def save_image(self, name, size=(800, 400)):
+        buffer = BytesIO()
+        Image.new('RGB', size, (37, 99, 235)).save(buffer, format='PNG')
+        return default_storage.save(f'projects/{name}', ContentFile(buffer.getvalue()))
+
+    def derivatives(self, name):
+        base = Path(name).stem
+        return sorted(f for f in default_storage.listdir('projects')[1] if f.startswith(f'{base}.') and f != Path(name).name)
+
+    def render(self, project):
+        template = Template('{% load images %}{% responsive_image project.image alt="Proje" sizes="400px" %}')
+        return template.render(Context({'project': project}))
+
+    def test_generate_and_picture_output(self):
+        name = self.save_image('ekran.png')
+        manifest = images.generate_derivatives(name)
+        formats = images.derivative_formats()
+        self.assertEqual(manifest['widths'], [320, 640, 800])
+        self.assertEqual(len(self.derivatives(name)), 3 * len(formats))
+
+        html = self.render(make_project('alpha', image=name))
+        self.assertTrue(html.startswith('<picture>'))
+        self.assertIn('srcset="/media/projects/ekran.320w.jpg 320w, /media/projects/ekran.640w.jpg 640w, '
+                      '/media/projects/ekran.800w.jpg 800w"', html)
+        self.assertIn('src="/media/projects/ekran.800w.jpg"', html)
+        self.assertIn('width="800" height="400"', html)
+        for fmt in formats:
+            if fmt != 'jpeg':
+                self.assertIn(f'<source type="{images.MIME_TYPES[fmt]}"', html)
+
+    def test_manifest_fallback(self):
+        name = self.save_image('ekran.png')
+        project = make_project('alpha', image=name)
+        self.assertIsNone(images.get_manifest(name))
+        self.assertEqual(self.render(project), '<img src="/media/projects/ekran.png" alt="Proje" loading="lazy" decoding="async">')
+
+        # Başka bir süreçte üretilen türevler paylaşılan manifestten hemen görülür
+        images.generate_derivatives(name)
+        self.assertEqual(images.get_manifest(name)['widths'], [320, 640, 800])
+        # Manifest yoksa depolamadaki JPEG türevlerinden çıkarılır (yapılandırılmış genişlikler)
+        caching.shared_cache().clear()
+        manifest = images.get_manifest(name)
+        self.assertEqual(manifest['widths'], [320, 640])
+        self.assertIsNone(manifest['width'])
+
+    def test_replaced_and_deleted_images_lose_derivatives(self):
+        old = self.save_image('eski.png')
+        project = make_project('alpha', image=old)
+        images.generate_derivatives(old)
+        new = self.save_image('yeni.png', size=(500, 300))
+        images.generate_derivatives(new)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.image = new
+            project.save()
+        self.assertEqual(self.derivatives(old), [])
+        self.assertTrue(default_storage.exists(old))
+        self.assertNotEqual(self.derivatives(new), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertEqual(self.derivatives(new), [])
+        self.assertIsNone(images.get_manifest(new))
+
+
+class StaticBundleTests(TestCase):
+    def test_minifiers_keep_line_structure(self):
+        css = ['/* başlık', 'yorum */', 'a :hover ,b > c {', '    color: red;', '}']
+        self.assertEqual(list(assets.minify_css_lines(css)), [(2, 'a :hover,b>c{'), (3, 'color:red;'), (4, '}')])
+
+        js = ['// yorum', 'const html = `', '    <p>', '`;', '    run();']
+        self.assertEqual(
+            list(assets.minify_js_lines(js)),
+            [(1, 'const html = `'), (2, '    <p>'), (3, '`;'), (4, 'run();')],
+        )
+
+    def test_finder_builds_bundle_with_source_map(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_BUNDLE_ROOT=root):
+            path = finders.find('bundles/base.css')
+            self.assertEqual(path, str(Path(root) / 'bundles' / 'base.css'))
+            content = Path(path).read_text()
+            self.assertTrue(content.rstrip().endswith('/*# sourceMappingURL=base.css.map */'))
+            self.assertLess(len(content), sum(p.stat().st_size for p in assets.source_paths('bundles/base.css')))
+
+            source_map = json.loads((Path(root) / 'bundles' / 'base.css.map').read_text())
+            self.assertEqual(source_map['sources'], ['../css/style.css', '../css/animations.css'])
+            self.assertEqual(len(source_map['mappings'].split(';')), len(content.splitlines()) - 1)
+
+    def test_template_asset_replaces_inline_block(self):
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_BUNDLE_ROOT=root):
+            html = self.client.get('/about/').content.decode()
+            self.assertNotIn('.about-grid', html)
+            self.assertIn('<style>.page-hero{', html)
+            self.assertIn('href="/static/pages/about.css"', html)
+
+            path = finders.find('pages/about.css')
+            self.assertIn('.about-grid{', Path(path).read_text())
+            source_map = json.loads(Path(path + '.map').read_text())
+            self.assertEqual(source_map['sources'], ['core/about.html'])
+
+    def test_critical_css_keeps_media_queries(self):
+        css = '.hero { color: red; }\n.card { margin: 0; }\n@media (max-width: 768px) { .hero h1 { font-size: 2rem; } .card { margin: 1rem; } }'
+        self.assertEqual(
+            assets.critical_css(css, ['.hero']),
+            '.hero{color:red}\n@media (max-width:768px){\n.hero h1{font-size:2rem}\n}',
+        )
+
+    def test_pages_render_with_manifest_storage(self):
+        make_project('alpha', is_featured=True)
+        storages = {
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'},
+        }
+        with tempfile.TemporaryDirectory() as root, override_settings(
+            STATIC_ROOT=root, STATIC_BUNDLE_ROOT=Path(root) / 'build', STORAGES=storages,
+        ):
+            call_command('collectstatic', interactive=False, verbosity=0, ignore_patterns=['admin'])
+            for target in benchmark.targets():
+                if target.method != 'GET' or target.staff:
+                    continue
+                clear_caches()
+                response = self.client.get(target.path)
+                self.assertEqual(response.status_code, 200, target.path)
+            html = self.client.get('/').content.decode()
+            self.assertRegex(html, r'/static/bundles/base\.[0-9a-f]{12}\.css')
+
+
+class ExportSiteTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = Path(root.name)
+        self.output = self.root / 'site'
+        storages = {
+            **settings.STORAGES,
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'},
+        }
+        self.enterContext(override_settings(
+            STATIC_ROOT=self.root / 'static', STATIC_BUNDLE_ROOT=self.root / 'build',
+            MEDIA_ROOT=self.root / 'media', STORAGES=storages, PROJECTS_PAGE_SIZE=1,
+        ))
+        make_project('alpha', is_featured=True)
+        make_project('beta')
+
+    def export(self, *args):
+        out = StringIO()
+        call_command('export_site', str(self.output), *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+
+    def test_full_export_links_resolve(self):
+        self.export()
+        for page in ('index.html', 'about/index.html', 'projects/alpha/index.html', 'projects/index.html'):
+            self.assertTrue((self.output / page).exists(), page)
+        more = list((self.output / 'projects' / 'more').glob('*/index.html'))
+        self.assertEqual(len(more), 1)
+
+        html = (self.output / 'index.html').read_text()
+        self.assertNotIn('/search/', html)
+        links = re.findall(r'(?:href|src)="(/static/[^"]+)"', html)
+        self.assertTrue(any(re.search(r'\.[0-9a-f]{12}\.css$', link) for link in links))
+        for link in links:
+            self.assertTrue((self.output / link.lstrip('/')).exists(), link)
+        self.assertFalse((self.output / 'static' / 'admin').exists())
+
+        # Sonsuz kaydırma bağlantısı sorgu dizgesi yerine üretilmiş parçaya gider
+        projects = (self.output / 'projects' / 'index.html').read_text()
+        self.assertRegex(projects, r'<a href="/projects/more/[^"?]+/" class="btn btn-secondary projects-more"')
+
+        page = self.output / 'index.html'
+        self.assertEqual(gzip.decompress((self.output / 'index.html.gz').read_bytes()), page.read_bytes())
+        if export_site.brotli is not None:
+            self.assertEqual(export_site.brotli.decompress(page.with_name('index.html.br').read_bytes()), page.read_bytes())
+
+    def test_incremental_export(self):
+        self.export()
+        about = self.output / 'about' / 'index.html'
+        written = about.stat().st_mtime_ns
+        self.assertIn('0 sayfa yazıldı', self.export('--incremental', '--no-media'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.filter(slug='beta').delete()
+        output = self.export('--incremental', '--no-media')
+        self.assertIn('1 sayfa silindi', output)
+        self.assertFalse((self.output / 'projects' / 'beta').exists())
+        self.assertEqual(about.stat().st_mtime_ns, written)
+        self.assertFalse(list((self.output / 'projects' / 'more').glob('*/index.html')))
+
+    def test_error_page_stops_export(self):
+        from django.http import HttpResponseServerError
+        from django.urls import resolve as resolve_url
+
+        def resolve(path):
+            match = resolve_url(path)
+            if path == '/about/':
+                match.func = lambda request: HttpResponseServerError()
+            return match
+
+        with mock.patch.object(export_site, 'resolve', side_effect=resolve):
+            with self.assertRaisesMessage(CommandError, '/about/ sayfası 500'):
+                self.export('--no-media')
+        self.assertFalse((self.output / 'about' / 'index.html').exists())
+        self.assertFalse((self.output / export_site.MANIFEST_NAME).exists())
+
+
+class VendorAssetTests(TestCase):
+    def test_font_awesome_css_keeps_used_icons(self):
+        css = """
+        .fas, .fab, .fa-stack { display: inline-block; }
+        .fa-spin { animation-name: fa-spin; }
+        .fa-beat { animation-name: fa-beat; }
+        .fa-github:before { content: "\\f09b"; }
+        .fa-gitlab:before { content: "\\f296"; }
+        @font-face { font-family: 'Font Awesome 6 Brands'; font-weight: 400; src: url("../webfonts/fa-brands-400.woff2") format("woff2"), url("../webfonts/fa-brands-400.ttf") format("truetype"); }
+        @font-face { font-family: 'FontAwesome'; src: url("../webfonts/fa-v4compatibility.woff2"); }
+        @keyframes fa-spin { 0% { transform: rotate(0deg); } }
+        @keyframes fa-beat { 0% { transform: scale(1); } }
+        """
+        subset, codepoints = vendor.subset_font_awesome_css(css, {'fab', 'fa-github', 'fa-spin'})
+        self.assertEqual(codepoints, {0xf09b})
+        self.assertIn('.fab{', subset)
+        self.assertIn('@keyframes fa-spin', subset)
+        self.assertIn('src:url("../webfonts/fa-brands-400.woff2") format("woff2")}', subset)
+        for unused in ('fa-gitlab', 'fa-stack', 'fa-beat', '.fas', 'ttf', 'FontAwesome'):
+            self.assertNotIn(unused, subset)
+
+    def test_vendor_static_falls_back_to_cdn(self):
+        from .templatetags.assets import _is_vendored, vendor_static
+
+        _is_vendored.cache_clear()
+        with self.settings(STATICFILES_DIRS=[]):
+            self.assertEqual(vendor_static('vendor/three/three.min.js'), vendor.CDN_FALLBACKS['vendor/three/three.min.js'])
+        _is_vendored.cache_clear()
+        self.assertEqual(vendor_static('vendor/fontawesome/css/all.css'), '/static/vendor/fontawesome/css/all.css')
+
+    def test_deploy_check_warns_about_cdn_files(self):
+        with self.settings(STATICFILES_DIRS=[]):
+            warnings = vendor.check_vendored()
+        self.assertEqual([warning.id for warning in warnings], ['core.W001'])
+        for path in vendor.CDN_FALLBACKS:
+            self.assertIn(path, warnings[0].msg)
+        with mock.patch.object(vendor, 'missing_files', return_value=[]):
+            self.assertEqual(vendor.check_vendored(), [])
+
+    def test_skill_icons_must_be_in_subset(self):
+        # Alt küme veritabanına bağlı değil; güncel olup olmadığı yalnızca dosyalara bakar
+        Skill.objects.create(name='Ejderha', category='tool', level=50, icon_class='fas fa-dragon')
+        call_command('subset_vendor_assets', '--check', stdout=StringIO(), stderr=StringIO())
+        self.assertNotIn('fa-dragon', vendor.used_icon_classes())
+
+        skill = Skill(name='Linux', category='tool', level=50, icon_class='fab fa-linux')
+        skill.full_clean()
+        skill.icon_class = 'fas fa-dragon'
+        with self.assertRaisesMessage(ValidationError, 'fa-dragon'):
+            skill.full_clean()
+
+
+class ApiTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        for index in range(5):
+            make_project(f'proje-{index}', order=index % 2)
+
+    def test_keyset_pagination_covers_all_rows(self):
+        url = '/api/projects/?fields=slug&limit=2'
+        slugs = []
+        while url:
+            data = self.client.get(url).json()
+            self.assertLessEqual(len(data['results']), 2)
+            self.assertEqual([set(item) for item in data['results']], [{'slug'}] * len(data['results']))
+            slugs += [item['slug'] for item in data['results']]
+            url = data['next']
+        expected = list(Project.objects.order_by('-created_date', '-order', 'pk').values_list('slug', flat=True))
+        self.assertEqual(slugs, expected)
+
+    def test_cached_until_model_changes(self):
+        response = self.client.get('/api/projects/')
+        etag = response['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/api/projects/').content, response.content)
+            self.assertEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # Başka bir modelin değişmesi projeler yanıtını etkilemez
+        Experience.objects.create(position='Geliştirici', company='Firma', location='Ankara', start_date='2020-01-01')
+        self.assertEqual(self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        make_project('yeni')
+        response = self.client.get('/api/projects/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('yeni', [item['slug'] for item in response.json()['results']])
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.client.get('/api/projects/?fields=title,secret').status_code, 400)
+        self.assertEqual(self.client.get('/api/projects/?cursor=bozuk').status_code, 400)
+        self.assertEqual(self.client.get('/api/unknown/').status_code, 404)
+
+
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        instrumentation.reset()
+        make_project('alpha')
+
+    @override_settings(INSTRUMENTATION_SERVER_TIMING=True)
+    def test_server_timing_and_histograms(self):
+        response = self.client.get('/projects/')
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="[1-9]\d* sorgu"')
+        self.assertRegex(timing, r'tpl;dur=[\d.]+')
+        # Önbellekten sunulan sayfa sorgu yapmaz, şablon işlemez
+        timing = self.client.get('/projects/')['Server-Timing']
+        self.assertIn('desc="0 sorgu"', timing)
+        self.assertIn('tpl;dur=0.0', timing)
+        self.assertRegex(timing, r'hit=[1-9]')
+
+        stats = instrumentation.snapshot()['core:projects']
+        self.assertEqual(stats['total_ms']['count'], 2)
+        self.assertEqual(stats['queries']['buckets']['0'], 1)
+
+    def test_server_timing_off_by_default(self):
+        response = self.client.get('/projects/')
+        self.assertNotIn('Server-Timing', response)
+        self.assertEqual(instrumentation.snapshot()['core:projects']['total_ms']['count'], 1)
+        # Ölçüm Django sınıflarını değiştirmez
+        self.assertFalse(hasattr(Template.render, '__wrapped__'))
+        self.assertFalse(hasattr(LocMemCache.get, '__wrapped__'))
+
+    def test_metrics_endpoint_is_staff_only(self):
+        self.client.get('/')
+        self.assertEqual(self.client.get('/metrics/').status_code, 302)
+        User.objects.create_user('yonetici', password='parola', is_staff=True)
+        self.client.login(username='yonetici', password='parola')
+        self.assertIn('core:home', self.client.get('/metrics/').json())
+        self.client.post('/metrics/')
+        self.assertNotIn('core:home', instrumentation.snapshot())
+
+
+@override_settings(CONTACT_MAIL_DISPATCH='worker', INSTRUMENTATION_SERVER_TIMING=True)
+class BenchmarkTests(TestCase):
+    def setUp(self):
+        clear_caches()
+
+    def test_seed_and_measure_every_url(self):
+        self.assertEqual(benchmark.parse_scale('1k'), 1000)
+        counts = benchmark.seed(15)
+        self.assertEqual(counts['core.Project'], 15)
+        self.assertEqual(Project.objects.get(slug='proje-0').tech_tags.count(), 4)
+
+        staff = User.objects.create_user(benchmark.STAFF_USERNAME, is_staff=True)
+        targets = benchmark.targets()
+        self.assertIn('projects_more', [target.name for target in targets])
+        send = benchmark.client_sender(staff)
+        for target in targets:
+            result = benchmark.measure(send, target, requests=3)
+            self.assertEqual(result['statuses'], [200], target.name)
+            self.assertIsNotNone(result['first_queries'], target.name)
+
+    def test_all_modes_switch_database_profiles(self):
+        # Komut varsayılan bağlantıyı kendi veritabanına yönlendirip kapattığından
+        # test işleminin dışında, ayrı bir süreçte çalıştırılır
+        with tempfile.TemporaryDirectory() as root:
+            result = subprocess.run(
+                [sys.executable, 'manage.py', 'benchmark', '--mode', 'all', '--scale', '10',
+                 '--requests', '2', '--concurrency', '2', '--writers', '1',
+                 '--data-dir', f'{root}/data', '--output', f'{root}/out'],
+                cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=300,
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            report = json.loads(next(Path(root, 'out').glob('*.json')).read_text())
+        self.assertEqual(set(report['results']), {'client', 'wsgi', 'contention-default', 'contention-tuned'})
+        self.assertEqual(report['writes']['contention-tuned']['failed'], 0)
+
+
+class DatabaseProfileTests(TestCase):
+    def test_connection_pragmas(self):
+        """Üretim profili her yeni bağlantıda uygulanır"""
+        with connection.cursor() as cursor:
+            values = {
+                pragma: cursor.execute(f'PRAGMA {pragma}').fetchone()[0]
+                for pragma in ('synchronous', 'busy_timeout', 'cache_size')
+            }
+        self.assertEqual(values, {'synchronous': 1, 'busy_timeout': 20000, 'cache_size': -32000})
+        self.assertEqual(connection.transaction_mode, 'IMMEDIATE')
+
+
+class QueryPlanTests(TestCase):
+    def test_public_views_use_indexes(self):
+        make_project('alpha', is_featured=True)
+        out = StringIO()
+        call_command('explain_views', '--check', '--only', 'home', 'about', 'skills', 'projects', stdout=out)
+        output = out.getvalue()
+        for index in ('project_order_idx', 'project_category_idx', 'project_featured_idx', 'skill_order_idx'):
+            self.assertIn(index, output)
+        self.assertFalse(User.objects.filter(username='explain-views').exists())
+
+
+class ContactMessageAdminTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        for index in range(25):
+            ContactMessage.objects.create(
+                name=f'Gönderen {index}', email=f'kisi{index}@example.com',
+                subject='Proje teklifi' if index % 5 == 0 else 'Merhaba', message=f'Mesaj {index}',
+            )
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'x'))
+        self.url = '/admin/core/contactmessage/'
+
+    def test_keyset_pages_cover_all_rows(self):
+        seen = []
+        response = self.client.get(self.url)
+        while True:
+            cl = response.context['cl']
+            self.assertIsNone(cl.paginator)
+            seen += [message.pk for message in cl.result_list]
+            if not cl.next_page_url:
+                break
+            self.assertContains(response, 'Sonraki sayfa')
+            response = self.client.get(self.url + cl.next_page_url)
+        self.assertEqual(seen, list(ContactMessage.objects.order_by('-created_at', '-pk').values_list('pk', flat=True)))
+        self.assertEqual(self.client.get(self.url, {'p': 'bozuk'}).status_code, 302)
+
+    def test_nullable_ordering_uses_numbered_pages(self):
+        self.assertFalse(pagination.supports_ordering(ContactMessage, ['-sent_at', '-pk']))
+        with mock.patch.multiple(ContactMessageAdmin, ordering=['sent_at'], list_per_page=20):
+            response = self.client.get(self.url)
+            cl = response.context['cl']
+            self.assertFalse(cl.keyset)
+            self.assertEqual((cl.result_count, len(cl.result_list)), (25, 20))
+            self.assertContains(response, '?p=2')
+            second = self.client.get(self.url, {'p': '2'}).context['cl'].result_list
+        seen = [message.pk for message in [*cl.result_list, *second]]
+        self.assertEqual(sorted(seen), sorted(ContactMessage.objects.values_list('pk', flat=True)))
+
+    def test_admin_actions_follow_full_result_count(self):
+        self.assertTrue(self.client.get(self.url).context['cl'].show_admin_actions)
+        with mock.patch.object(ContactMessageAdmin, 'show_full_result_count', True):
+            cl = self.client.get(self.url, {'q': 'teklif'}).context['cl']
+            self.assertEqual(cl.full_result_count, 25)
+            self.assertTrue(cl.show_admin_actions)
+            ContactMessage.objects.all().delete()
+            self.assertFalse(self.client.get(self.url).context['cl'].show_admin_actions)
+
+    def test_search_uses_message_index(self):
+        response = self.client.get(self.url, {'q': 'teklif'})
+        self.assertEqual(len(response.context['cl'].result_list), 5)
+        self.assertEqual(response.context['cl'].count_display, '5')
+        self.assertEqual(len(self.client.get(self.url, {'q': 'kisi7'}).context['cl'].result_list), 1)
+        ContactMessage.objects.get(email='kisi7@example.com').delete()
+        self.assertEqual(len(self.client.get(self.url, {'q': 'kisi7'}).context['cl'].result_list), 0)
+
+    def test_bulk_delete_is_single_query(self):
+        from django.contrib.admin.models import LogEntry
+        from django.contrib.sessions.models import Session
+
+        for model in (ContactMessage, LogEntry, Session):
+            self.assertFalse(post_delete.has_listeners(model), model)
+        with CaptureQueriesContext(connection) as queries:
+            ContactMessage.objects.filter(email__startswith='kisi').delete()
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(len(self.client.get(self.url, {'q': 'teklif'}).context['cl'].result_list), 0)
+
+    def test_mark_read_is_single_update(self):
+        ids = list(ContactMessage.objects.values_list('pk', flat=True))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, {
+                'action': 'mark_read', '_selected_action': ids, 'select_across': '1',
+            })
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(ContactMessage.objects.filter(is_read=False).exists())
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE "core_contactmessage"')]
+        self.assertEqual(len(updates), 1)
+
+    def test_export_action_streams_csv(self):
+        ContactMessage.objects.filter(email='kisi3@example.com').update(subject='=HYPERLINK("x")')
+        response = self.client.post(self.url + '?is_read__exact=0', {
+            'action': 'export_csv', '_selected_action': [0], 'select_across': '1',
+        })
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        content = b''.join(response.streaming_content).decode()
+        lines = content.splitlines()
+        self.assertEqual(lines[0], ','.join(exports.FIELDS))
+        self.assertEqual(len(lines), 26)
+        self.assertIn('"\'=HYPERLINK(""x"")"', content)
+
+    def test_export_command_jsonl(self):
+        ContactMessage.objects.filter(email='kisi5@example.com').update(is_read=True)
+        out = StringIO()
+        call_command('export_messages', '--format', 'jsonl', '--unread', '--search', 'teklif', stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(records), 4)
+        self.assertEqual([r['id'] for r in records], sorted(r['id'] for r in records))
+        self.assertFalse(any(r['is_read'] for r in records))
+
+
+class MigrationTests(TransactionTestCase):
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def migrate(self, targets):
+        """Hedef migration'lara gider ve o andaki model durumunu döndürür"""
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def index_rows(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT rowid, title, body FROM {table} ORDER BY rowid')
+            return cursor.fetchall()
+
+    def test_duplicates_stop_natural_key_migration(self):
+        old_apps = self.migrate([('core', '0005_search_index')])
+        Certificate = old_apps.get_model('core', 'Certificate')
+        Experience = old_apps.get_model('core', 'Experience')
+        first, second = Certificate.objects.bulk_create([
+            Certificate(name='Python', organization='Kurum', date_received='2023-01-01') for _ in range(2)
+        ])
+        # Aynı pozisyonda iki ayrı dönem çakışma sayılmaz
+        Experience.objects.bulk_create([
+            Experience(company='Şirket', position='Geliştirici', location='Ankara', start_date=start)
+            for start in ('2019-01-01', '2023-01-01')
+        ])
+        with self.assertRaisesMessage(ValueError, f'Certificate (Python / Kurum): pk {first.pk}, {second.pk}'):
+            self.migrate([('core', '0006_natural_keys')])
+        self.assertEqual(Certificate.objects.count(), 2)
+
+        Certificate.objects.filter(pk=second.pk).delete()
+        Experience = self.migrate([('core', '0006_natural_keys')]).get_model('core', 'Experience')
+        self.assertEqual(Experience.objects.count(), 2)
+
+    def test_search_indexes_match_rebuild(self):
+        # bulk_create: kayıt sinyalleri henüz olmayan indeks tablosuna yazmasın
+        old_apps = self.migrate([('core', '0004_technology_index')])
+        Skill, Project, ContactMessage = (
+            old_apps.get_model('core', name) for name in ('Skill', 'Project', 'ContactMessage')
+        )
+        Skill.objects.bulk_create([Skill(name='İleri Python', category='programming', level=90)])
+        Project.objects.bulk_create([Project(
+            slug='alfa', title='Alfa', short_description='Kısa', description='Işık', category='web',
+            technologies='Python', features='Birinci',
+        )])
+        ContactMessage.objects.bulk_create([ContactMessage(
+            name='Ayşe', email='ayse@example.com', subject='Teklif', message='İş birliği',
+        )])
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+        indexed = self.index_rows(search.SEARCH_TABLE), self.index_rows(search.MESSAGE_TABLE)
+        self.assertEqual([len(rows) for rows in indexed], [2, 1])
+
+        search.rebuild()
+        search.rebuild_messages()
+        self.assertEqual(indexed, (self.index_rows(search.SEARCH_TABLE), self.index_rows(search.MESSAGE_TABLE)))
+
+
+class CvDataTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.data = Path(__file__).resolve().parent.parent / 'data' / 'cv.jsonl'
+
+    def test_import_matches_natural_keys(self):
+        make_project('e-ticaret-platformu', title='Eski başlık', technologies='Eski')
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('import_cv', str(self.data), stdout=out)
+        self.assertIn('project: 3', out.getvalue())
+        project = Project.objects.get(slug='e-ticaret-platformu')
+        self.assertEqual(project.title, 'E-Ticaret Platformu')
+        self.assertEqual(
+            sorted(project.tech_tags.values_list('name', flat=True)),
+            sorted(project.tech_items),
+        )
+
+        # Aynı dosya tekrar yüklenince kayıt çoğalmaz; kısmi kayıt yalnızca verilen alanları değiştirir
+        call_command('import_cv', str(self.data), stdout=StringIO())
+        records = [(1, {'type': 'certificate', 'name': 'React.js Developer Certification',
+                        'organization': 'Frontend Masters', 'order': 9})]
+        cvdata.import_records(records)
+        self.assertEqual(Project.objects.count(), 3)
+        self.assertEqual(Experience.objects.count(), 3)
+        certificate = Certificate.objects.get(name='React.js Developer Certification')
+        self.assertEqual((certificate.order, certificate.date_received.year), (9, 2023))
+
+    def test_keys_without_unique_constraint(self):
+        records = [
+            (1, {'type': 'experience', 'company': 'Şirket', 'position': 'Geliştirici',
+                 'location': 'Ankara', 'start_date': start})
+            for start in ('2019-01-01', '2023-01-01')
+        ] + [(3, {'type': 'skill', 'name': 'Python', 'category': 'programming', 'level': 80})]
+        cvdata.import_records(records)
+        cvdata.import_records([
+            (1, {'type': 'experience', 'company': 'Şirket', 'position': 'Geliştirici',
+                 'start_date': '2023-01-01', 'order': 5}),
+            (2, {'type': 'skill', 'name': 'Python', 'category': 'programming', 'level': 90}),
+        ])
+        self.assertEqual(
+            list(Experience.objects.order_by('start_date').values_list('order', flat=True)), [0, 5],
+        )
+        self.assertEqual(list(Skill.objects.values_list('level', flat=True)), [90])
+
+    def test_invalid_record_rolls_back(self):
+        records = [
+            (1, {'type': 'project', 'slug': 'alfa', 'title': 'Alfa', 'category': 'web'}),
+            (2, {'type': 'skill', 'name': 'Python', 'seviye': 3}),
+        ]
+        with self.assertRaisesMessage(cvdata.CvDataError, '2. satır'):
+            cvdata.import_records(records)
+        self.assertFalse(Project.objects.exists())
+
+        # Zorunlu alanı olmayan kısmi kayıt yeni satır ekleyemez
+        records[1] = (2, {'type': 'certificate', 'name': 'Yeni', 'organization': 'Kurum'})
+        with self.assertRaisesMessage(cvdata.CvDataError, 'eksik alan: date_received'):
+            cvdata.import_records(records)
+        self.assertFalse(Project.objects.exists())
+
+    def test_resume_roundtrip(self):
+        call_command('import_cv', str(self.data), stdout=StringIO())
+        exported = list(cvdata.export_records())
+        document = cvdata.to_resume([dict(record) for record in exported])
+        self.assertEqual(len(document['work']), 3)
+
+        Project.objects.all().delete()
+        cvdata.import_records(cvdata.from_resume(json.loads(json.dumps(document, cls=DjangoJSONEncoder))))
+        self.assertEqual(list(cvdata.export_records()), exported)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    Herkese açık sayfaların soğuk önbellekle sorgu bütçeleri. Sorgu sayısı
+    veri boyutundan bağımsız olmalı; şablonda döngü içinde sorgu (N+1)
+    eklenirse büyük ölçekte bütçe aşılır ve sorgular listelenir.
+
+    Süre makineye göre değiştiğinden varsayılan olarak denetlenmez;
+    RENDER_BUDGET_MS ortam değişkeni verilirse (ör. 500) her sayfa için
+    ayrıca süre bütçesi uygulanır.
+    """
+    SIZES = (5, 50, 300)
+    BUDGETS = {
+        '/': 5,
+        '/about/': 5,
+        '/skills/': 4,
+        '/projects/': 5,
+        '/projects/proje-1/': 5,
+        '/contact/': 2,
+    }
+    RENDER_BUDGET_MS = int(os.environ.get('RENDER_BUDGET_MS') or 0) or None
+
+    def assertWithinBudget(self, url, max_queries, max_ms=None):
+        clear_caches()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = self.client.get(url)
+            elapsed = (time.perf_counter() - start) * 1000
+        self.assertEqual(response.status_code, 200, url)
+
+        if len(captured) > max_queries:
+            # Parametreleri farklı aynı sorgular N+1 belirtisidir
+            shapes = [re.sub(r'\b\d+\b', '?', query['sql']) for query in captured]
+            repeated = Counter(shapes)
+            lines = [
+                f'{index}. {"[tekrar] " if repeated[shape] > 1 else ""}{query["sql"]}'
+                for index, (shape, query) in enumerate(zip(shapes, captured), 1)
+            ]
+            self.fail(f'{url}: {len(captured)} sorgu (bütçe {max_queries})\n' + '\n'.join(lines))
+        if max_ms is not None and elapsed > max_ms:
+            self.fail(f'{url}: {elapsed:.0f} ms (bütçe {max_ms} ms)')
+
+    def test_budgets_hold_at_every_size(self):
+        for size in self.SIZES:
+            with self.subTest(size=size), transaction.atomic():
+                benchmark.seed(size)
+                for url, max_queries in self.BUDGETS.items():
+                    self.assertWithinBudget(url, max_queries, self.RENDER_BUDGET_MS)
+                transaction.set_rollback(True)
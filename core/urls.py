@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, instrumentation, views
 
 app_name = 'core'
 
@@ -7,8 +7,14 @@ urlpatterns = [
     path('', views.home, name='home'),
     path('about/', views.about, name='about'),
     path('projects/', views.projects, name='projects'),
+    path('projects/more/<slug:cursor>/', views.projects_more, name='projects_more'),
     path('projects/<slug:slug>/', views.project_detail, name='project_detail'),
     path('skills/', views.skills, name='skills'),
+    path('search/', views.search_view, name='search'),
     path('contact/', views.contact, name='contact'),
     path('contact/submit/', views.contact_submit, name='contact_submit'),
+    path('contact/stats/', views.contact_stats, name='contact_stats'),
+    path('metrics/', instrumentation.metrics_view, name='metrics'),
+    path('api/', api.index, name='api_index'),
+    path('api/<slug:resource>/', api.resource_list, name='api_list'),
 ]
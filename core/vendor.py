@@ -0,0 +1,333 @@
+"""
+Üçüncü taraf CSS/JS ve yazı tipleri.
+
+Font Awesome, Poppins, AOS ve three.js CDN yerine static/vendor/ altından
+sunulur. Kaynaklar depoda vendor/ dizininde tutulur; yazı tipleri
+şablonlarda ve JS dosyalarında geçen ikonlar ile SKILL_ICONS listesine,
+karakterlere ve Poppins için stil dosyalarında geçen kalınlıklara göre
+alt kümelenir. Alt küme veritabanına bakmaz; Skill.icon_class yalnızca
+alt kümedeki ikonları kabul eder:
+
+    python manage.py subset_vendor_assets
+
+Şablonlar değiştiğinde komut yeniden çalıştırılmalıdır; --check seçeneği
+alt kümelerin güncel olup olmadığını denetler. Hangi ikon ve karakterlerin
+dahil edildiği static/vendor/subsets.json dosyasında tutulur.
+
+Kaynağı depoda olmayan dosyalar (Poppins, AOS, three.js) --fetch ile
+sabitlenmiş sürümlerinden indirilir. Dosya static/ altında yoksa
+`{% vendor_static %}` etiketi CDN adresine döner; `check --deploy` bu
+durumda core.W001 uyarısı verir. Sunulan dosyalar ManifestStaticFilesStorage
+ile içerik özetli adlar alır.
+"""
+import json
+import re
+import shutil
+import urllib.request
+from pathlib import Path
+
+try:
+    from fontTools import subset
+except ImportError:  # isteğe bağlı bağımlılık (brotli ile birlikte WOFF2 için gerekir)
+    subset = None
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.core import checks
+
+from .assets import _css_blocks, _strip_block_comments, minify_css_lines, template_dirs
+
+FONT_AWESOME_SOURCE = 'fontawesome-free'
+FONT_AWESOME_FONTS = {
+    'Font Awesome 6 Free:900': 'fa-solid-900.woff2',
+    'Font Awesome 6 Free:400': 'fa-regular-400.woff2',
+    'Font Awesome 6 Brands:400': 'fa-brands-400.woff2',
+}
+
+POPPINS_SOURCE = 'poppins'
+POPPINS_WEIGHTS = {
+    300: 'Light', 400: 'Regular', 500: 'Medium', 600: 'SemiBold',
+    700: 'Bold', 800: 'ExtraBold', 900: 'Black',
+}
+POPPINS_URL = 'https://github.com/google/fonts/raw/main/ofl/poppins/Poppins-{}.ttf'
+
+# Yönetim panelinden yeteneklere seçilebilen ikonlar; şablonlarda geçmeseler
+# de alt kümeye her zaman dahil edilir
+SKILL_ICONS = (
+    'fab', 'fas',
+    'fa-python', 'fa-js', 'fa-react', 'fa-vuejs', 'fa-angular', 'fa-node-js', 'fa-php',
+    'fa-java', 'fa-rust', 'fa-golang', 'fa-docker', 'fa-git-alt', 'fa-github', 'fa-gitlab',
+    'fa-linux', 'fa-ubuntu', 'fa-windows', 'fa-apple', 'fa-android', 'fa-html5', 'fa-css3-alt',
+    'fa-sass', 'fa-bootstrap', 'fa-laravel', 'fa-wordpress', 'fa-aws', 'fa-figma', 'fa-npm',
+    'fa-code', 'fa-database', 'fa-server', 'fa-terminal', 'fa-users', 'fa-comments',
+    'fa-lightbulb', 'fa-project-diagram', 'fa-cloud', 'fa-mobile-alt', 'fa-cogs',
+    'fa-chart-line', 'fa-brain', 'fa-tasks',
+)
+
+# Veritabanından gelen metinler için her zaman dahil edilen karakterler
+BASE_CHARACTERS = (
+    ''.join(chr(code) for code in range(0x20, 0x7f))
+    + 'çÇğĞıİöÖşŞüÜâÂîÎûÛ'
+    + '–—‘’“”•…€₺©®™°·×'
+)
+
+# static/vendor/ altındaki dosya -> indirme adresi (--fetch) ve yedek CDN adresi
+DOWNLOADS = {
+    'vendor/aos/aos.css': 'https://cdnjs.cloudflare.com/ajax/libs/aos/2.3.4/aos.css',
+    'vendor/aos/aos.js': 'https://cdnjs.cloudflare.com/ajax/libs/aos/2.3.4/aos.js',
+    'vendor/three/three.min.js': 'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js',
+}
+CDN_FALLBACKS = {
+    **DOWNLOADS,
+    'vendor/fontawesome/css/all.css': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css',
+    'vendor/poppins/poppins.css': (
+        'https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700;800;900&display=swap'
+    ),
+}
+
+ICON_CLASS = re.compile(r'(?<![\w-])(fa[srb]?|fa-[a-z0-9-]+)(?![\w-])')
+ICON_RULE = re.compile(r'^\.(fa-[a-z0-9-]+)::?before$')
+CSS_ESCAPE = re.compile(r'\\([0-9a-fA-F]{1,6})')
+FONT_WEIGHT = re.compile(r'font-weight\s*:\s*(\d00|bold|normal)')
+TEMPLATE_SYNTAX = re.compile(r'{[{%#].*?[}%#]}', re.S)
+HTML_TAG = re.compile(r'<(style|script)\b.*?</\1>|<[^>]+>', re.S | re.I)
+
+
+def missing_files():
+    """static/ altında bulunmayan, bu yüzden CDN'den yüklenen dosyalar"""
+    return sorted(path for path in CDN_FALLBACKS if finders.find(path) is None)
+
+
+def check_vendored(app_configs=None, **kwargs):
+    missing = missing_files()
+    if not missing:
+        return []
+    return [checks.Warning(
+        f'Üçüncü taraf dosyalar CDN\'den yükleniyor: {", ".join(missing)}',
+        hint='python manage.py subset_vendor_assets --fetch ile static/vendor/ altına indirin.',
+        id='core.W001',
+    )]
+
+
+def vendor_root():
+    return Path(getattr(settings, 'VENDOR_SOURCE_ROOT', Path(settings.BASE_DIR) / 'vendor'))
+
+
+def static_root():
+    """Alt kümelerin yazıldığı STATICFILES_DIRS dizini"""
+    return Path(settings.STATICFILES_DIRS[0])
+
+
+def project_templates():
+    """Projeye ait şablonlar (Django'nun kendi uygulamaları hariç)"""
+    base = Path(settings.BASE_DIR).resolve()
+    for directory in template_dirs():
+        if base in directory.resolve().parents:
+            yield from sorted(directory.rglob('*.html'))
+
+
+def project_sources():
+    """İkon ve yazı tipi kullanımının arandığı şablon, JS ve CSS dosyaları"""
+    yield from project_templates()
+    for pattern in ('js/**/*.js', 'css/**/*.css'):
+        yield from sorted(static_root().glob(pattern))
+
+
+def used_icon_classes():
+    """Şablonlarda ve JS dosyalarında geçen fa sınıfları ile SKILL_ICONS"""
+    classes = set(SKILL_ICONS)
+    for path in project_sources():
+        classes.update(ICON_CLASS.findall(path.read_text(encoding='utf-8')))
+    return classes
+
+
+def unavailable_icons(value):
+    """
+    Değerdeki, sunulan Font Awesome alt kümesinde bulunmayan ikon sınıfları.
+    Alt küme henüz üretilmemişse (CSS CDN'den yükleniyorsa) hepsi geçerlidir.
+    """
+    manifest = read_manifest()
+    if manifest is None:
+        return []
+    icons = set(manifest['icons'])
+    return [name for name in ICON_CLASS.findall(value) if name.startswith('fa-') and name not in icons]
+
+
+def used_characters():
+    """Şablonların görünen metnindeki karakterler ve BASE_CHARACTERS"""
+    characters = set(BASE_CHARACTERS)
+    for path in project_templates():
+        text = TEMPLATE_SYNTAX.sub(' ', path.read_text(encoding='utf-8'))
+        characters.update(HTML_TAG.sub(' ', text))
+    return {char for char in characters if char.isprintable()}
+
+
+def used_weights():
+    """Stil dosyalarında geçen Poppins kalınlıkları; 400 ve 700 her zaman dahildir"""
+    weights = {400, 700}
+    for path in project_sources():
+        for value in FONT_WEIGHT.findall(path.read_text(encoding='utf-8')):
+            weights.add({'bold': 700, 'normal': 400}.get(value) or int(value))
+    return sorted(weight for weight in weights if weight in POPPINS_WEIGHTS)
+
+
+def _selector_classes(selector):
+    return set(re.findall(r'\.([\w-]+)', selector))
+
+
+def _fa_classes(selector):
+    return {name for name in _selector_classes(selector) if name == 'fa' or name.startswith('fa')}
+
+
+def subset_font_awesome_css(css, classes):
+    """
+    Font Awesome CSS'inden yalnızca kullanılan sınıflara ait kuralları
+    bırakır. Döndürülen ikinci değer kullanılan ikonların kod noktalarıdır.
+    """
+    css, _ = _strip_block_comments(css, False)
+    rules = []
+    codepoints = set()
+    keyframes = {}
+    for prelude, body in _css_blocks(css):
+        if prelude.startswith('@keyframes'):
+            keyframes[prelude.split()[1]] = f'{prelude}{{{body}}}'
+            continue
+        if prelude.startswith('@font-face'):
+            # Eski sürüm uyumluluk yazı tipleri atılır
+            family = re.search(r"font-family:\s*['\"]([^'\"]+)", body)
+            weight = re.search(r'font-weight:\s*(\d+)', body)
+            font = family and weight and FONT_AWESOME_FONTS.get(f'{family.group(1)}:{weight.group(1)}')
+            if font:
+                body = re.sub(r'src:[^;]+;', f'src: url("../webfonts/{font}") format("woff2");', body)
+                rules.append(f'{prelude}{{{body}}}')
+            continue
+        if prelude.startswith('@media'):
+            inner, inner_codepoints = subset_font_awesome_css(body, classes)
+            codepoints |= inner_codepoints
+            if inner.strip():
+                rules.append(f'{prelude}{{\n{inner}\n}}')
+            continue
+
+        selectors = [selector.strip() for selector in prelude.split(',')]
+        kept = [
+            selector for selector in selectors
+            if _fa_classes(selector) <= classes
+        ]
+        if not kept:
+            continue
+        icon = ICON_RULE.match(kept[0])
+        if icon:
+            codepoints.update(int(code, 16) for code in CSS_ESCAPE.findall(body))
+        rules.append(f'{", ".join(kept)}{{{body}}}')
+
+    # Yalnızca kalan kurallarda adı geçen animasyonlar
+    text = '\n'.join(rules)
+    rules += [rule for name, rule in keyframes.items() if re.search(rf'\b{re.escape(name)}\b', text)]
+    minified = '\n'.join(line for _, line in minify_css_lines('\n'.join(rules).split('\n')))
+    return minified, codepoints
+
+
+def subset_font(source, target, codepoints=None, text=None):
+    """Yazı tipini verilen kod noktalarına indirip WOFF2 olarak yazar"""
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['kern', 'liga', 'calt', 'ccmp', 'locl', 'mark', 'mkmk']
+    options.notdef_outline = True
+    font = subset.load_font(str(source), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints or [], text=text or '')
+    subsetter.subset(font)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    subset.save_font(font, str(target), options)
+    return target
+
+
+def build_font_awesome(classes):
+    source = vendor_root() / FONT_AWESOME_SOURCE
+    target = static_root() / 'vendor' / 'fontawesome'
+    css, codepoints = subset_font_awesome_css(
+        (source / 'css' / 'all.css').read_text(encoding='utf-8'), classes,
+    )
+    shutil.rmtree(target, ignore_errors=True)
+    (target / 'css').mkdir(parents=True)
+    (target / 'css' / 'all.css').write_text(css + '\n', encoding='utf-8')
+    for font in FONT_AWESOME_FONTS.values():
+        subset_font(source / 'webfonts' / font, target / 'webfonts' / font, codepoints=codepoints)
+    shutil.copy(source / 'LICENSE.txt', target / 'LICENSE.txt')
+    return codepoints
+
+
+def build_poppins(weights, characters):
+    """Poppins kaynakları mevcutsa alt kümeleri ve @font-face dosyasını yazar"""
+    source = vendor_root() / POPPINS_SOURCE
+    paths = poppins_paths(weights)
+    missing = [path.name for path in paths.values() if not path.exists()]
+    if missing:
+        return missing
+
+    target = static_root() / 'vendor' / 'poppins'
+    shutil.rmtree(target, ignore_errors=True)
+    faces = []
+    text = ''.join(sorted(characters))
+    for weight, path in paths.items():
+        name = f'poppins-{weight}.woff2'
+        subset_font(path, target / name, text=text)
+        faces.append(
+            f"@font-face{{font-family:'Poppins';font-style:normal;font-weight:{weight};"
+            f"font-display:swap;src:url({name}) format('woff2')}}"
+        )
+    (target / 'poppins.css').write_text('\n'.join(faces) + '\n', encoding='utf-8')
+    if (source / 'OFL.txt').exists():
+        shutil.copy(source / 'OFL.txt', target / 'OFL.txt')
+    return []
+
+
+def fetch_sources(weights, stdout=None):
+    """Eksik Poppins, AOS ve three.js dosyalarını sabit sürümlerinden indirir"""
+    downloads = {
+        path: POPPINS_URL.format(POPPINS_WEIGHTS[weight])
+        for weight, path in poppins_paths(weights).items()
+    }
+    downloads.update({static_root() / name: url for name, url in DOWNLOADS.items()})
+    for path, url in downloads.items():
+        if path.exists():
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(url, timeout=30) as response:
+            path.write_bytes(response.read())
+        if stdout:
+            stdout.write(f'İndirildi: {url}')
+
+
+def poppins_paths(weights):
+    source = vendor_root() / POPPINS_SOURCE
+    return {weight: source / f'Poppins-{POPPINS_WEIGHTS[weight]}.ttf' for weight in weights}
+
+
+def subset_manifest(classes, weights, characters):
+    """Alt kümelerin neye göre üretildiği; Poppins kaynakları yoksa kalınlıklar boş kalır"""
+    if not all(path.exists() for path in poppins_paths(weights).values()):
+        weights = []
+    return {
+        'icons': sorted(classes),
+        'poppins_weights': weights,
+        'characters': ''.join(sorted(characters)),
+    }
+
+
+def manifest_path():
+    return static_root() / 'vendor' / 'subsets.json'
+
+
+def read_manifest():
+    try:
+        return json.loads(manifest_path().read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(manifest):
+    manifest_path().parent.mkdir(parents=True, exist_ok=True)
+    manifest_path().write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + '\n', encoding='utf-8'
+    )
@@ -1,31 +1,40 @@
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
-from django.core.mail import send_mail
-from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
 from .models import (
-    PersonalInfo, Education, Experience, Skill, Project, 
-    Certificate, ContactMessage, SiteSettings
+    Education, Experience, Skill, Project,
+    Certificate, ContactMessage
+)
+from .caching import (
+    cache_page_by_version, conditional_page, get_project_category_counts,
+    get_project_page, get_skill_groups
 )
+from .mail import schedule_dispatch
+from .pagination import InvalidCursor
+from . import ratelimit, search
 import json
+from urllib.parse import urlencode
 
-def get_site_context():
-    """Tüm sayfalarda kullanılacak ortak context"""
-    try:
-        personal_info = PersonalInfo.objects.first()
-        site_settings = SiteSettings.objects.first()
-    except:
-        personal_info = None
-        site_settings = None
-    
-    return {
-        'personal_info': personal_info,
-        'site_settings': site_settings,
-    }
+# Her sayfanın içeriğini etkileyen modeller. Koşullu GET doğrulayıcıları ve
+# statik dışa aktarımdaki artımlı güncelleme bu tabloyu kullanır.
+# PersonalInfo ve SiteSettings tüm sayfalar için ayrıca hesaba katılır.
+PAGE_DEPENDENCIES = {
+    'home': (Skill, Project, Experience),
+    'about': (Education, Experience, Certificate),
+    'skills': (Skill,),
+    'projects': (Project,),
+    'projects_more': (Project,),
+    'project_detail': (Project,),
+    'contact': (),
+}
 
+@conditional_page(*PAGE_DEPENDENCIES['home'])
+@cache_page_by_version
 def home(request):
     """Ana sayfa - dağdan düşme animasyonu ile başlayan hero section"""
-    context = get_site_context()
+    context = {}
     
     # Featured skills
     featured_skills = Skill.objects.filter(is_featured=True)[:6]
@@ -44,9 +53,11 @@ def home(request):
     
     return render(request, 'core/home.html', context)
 
+@conditional_page(*PAGE_DEPENDENCIES['about'])
+@cache_page_by_version
 def about(request):
     """Hakkımda sayfası - detaylı bilgiler"""
-    context = get_site_context()
+    context = {}
     
     # Eğitim bilgileri
     educations = Education.objects.all()
@@ -65,57 +76,84 @@ def about(request):
     
     return render(request, 'core/about.html', context)
 
+@conditional_page(*PAGE_DEPENDENCIES['skills'])
+@cache_page_by_version
 def skills(request):
     """Yetenekler sayfası"""
-    context = get_site_context()
-    
-    # Kategorilere göre yetenekler
-    programming_skills = Skill.objects.filter(category='programming')
-    framework_skills = Skill.objects.filter(category='framework')
-    database_skills = Skill.objects.filter(category='database')
-    tool_skills = Skill.objects.filter(category='tool')
-    soft_skills = Skill.objects.filter(category='soft')
+    context = {}
     
-    context.update({
-        'programming_skills': programming_skills,
-        'framework_skills': framework_skills,
-        'database_skills': database_skills,
-        'tool_skills': tool_skills,
-        'soft_skills': soft_skills,
-    })
+    # Kategorilere göre yetenekler (tek sorgu, önbellekli); şablon boş
+    # kategorileri atlar
+    skill_groups = get_skill_groups()
+    context['skill_groups'] = skill_groups
+    context['has_skills'] = any(group['skills'] for group in skill_groups)
     
     return render(request, 'core/skills.html', context)
 
+def _project_page(request, cursor):
+    """Filtrelere göre proje sayfası ve bir sonraki parçanın bağlamı"""
+    category = request.GET.get('category', 'all')
+    tech = request.GET.get('tech', '')
+    limit = getattr(settings, 'PROJECTS_PAGE_SIZE', 12)
+    projects, next_cursor = get_project_page(category, tech, cursor, limit)
+    return {
+        'projects': projects,
+        'next_cursor': next_cursor,
+        'filter_query': urlencode([
+            (name, value) for name, value in (('category', category), ('tech', tech))
+            if value and value != 'all'
+        ]),
+        'current_category': category,
+        'current_tech': tech,
+    }
+
+@conditional_page(*PAGE_DEPENDENCIES['projects'])
+@cache_page_by_version
 def projects(request):
     """Projeler sayfası"""
-    context = get_site_context()
+    context = {}
     
-    # Tüm projeler
-    all_projects = Project.objects.all()
-    
-    # Kategorilere göre filtreleme
-    category = request.GET.get('category', 'all')
-    if category != 'all':
-        all_projects = all_projects.filter(category=category)
+    # Kategori ve teknoloji filtreleri (?category=web&tech=django); ilk sayfa
+    # burada, sonrakiler kaydırdıkça projects_more parçasıyla yüklenir.
+    # JavaScript kapalıysa ?cursor= bağlantısı sonraki sayfayı açar.
+    try:
+        context.update(_project_page(request, request.GET.get('cursor')))
+    except InvalidCursor:
+        return HttpResponseBadRequest('Geçersiz cursor')
     
-    # Kategorileri ve sayıları al
+    # Kategoriler ve sayıları (tek sorgu, önbellekli); filtre bağlantılarında
+    # yalnızca projesi olan kategoriler gösterilir
     categories = Project.CATEGORY_CHOICES
-    category_counts = {}
-    for cat_code, cat_name in categories:
-        category_counts[cat_code] = Project.objects.filter(category=cat_code).count()
+    category_counts = get_project_category_counts()
     
     context.update({
-        'projects': all_projects,
         'categories': categories,
         'category_counts': category_counts,
-        'current_category': category,
+        'category_total': sum(category_counts.values()),
+        'category_filters': [
+            {'code': code, 'name': name, 'count': category_counts.get(code, 0)}
+            for code, name in categories
+            if category_counts.get(code) or code == context['current_category']
+        ],
     })
     
     return render(request, 'core/projects.html', context)
 
+@conditional_page(*PAGE_DEPENDENCIES['projects_more'])
+@cache_page_by_version
+def projects_more(request, cursor):
+    """Sonsuz kaydırma için sonraki proje kartları (HTML parçası)"""
+    try:
+        context = _project_page(request, cursor)
+    except InvalidCursor:
+        return HttpResponseBadRequest('Geçersiz cursor')
+    return render(request, 'core/partials/project_cards.html', context)
+
+@conditional_page(*PAGE_DEPENDENCIES['project_detail'])
+@cache_page_by_version
 def project_detail(request, slug):
     """Proje detay sayfası"""
-    context = get_site_context()
+    context = {}
     project = get_object_or_404(Project, slug=slug)
     
     # Diğer projeler (öneriler)
@@ -128,10 +166,18 @@ def project_detail(request, slug):
     
     return render(request, 'core/project_detail.html', context)
 
+def search_view(request):
+    """Site içi arama sayfası"""
+    query = request.GET.get('q', '').strip()
+    results = search.search(query) if query else []
+    return render(request, 'core/search.html', {
+        'query': query,
+        'results': results,
+    })
+
 def contact(request):
     """İletişim sayfası"""
-    context = get_site_context()
-    return render(request, 'core/contact.html', context)
+    return render(request, 'core/contact.html')
 
 @csrf_exempt
 def contact_submit(request):
@@ -140,34 +186,29 @@ def contact_submit(request):
         try:
             data = json.loads(request.body)
             
-            # Mesajı veritabanına kaydet
-            message = ContactMessage.objects.create(
-                name=data.get('name'),
-                email=data.get('email'),
-                subject=data.get('subject', ''),
-                message=data.get('message')
-            )
+            # Hız sınırı ve tekrar kontrolü, veritabanına yazmadan önce
+            with ratelimit.submission(request, data) as outcome:
+                if outcome == ratelimit.RATE_LIMITED:
+                    return JsonResponse({
+                        'success': False,
+                        'message': 'Çok fazla mesaj gönderdiniz. Lütfen daha sonra tekrar deneyin.'
+                    }, status=429)
+                if outcome == ratelimit.DUPLICATE:
+                    return JsonResponse({
+                        'success': False,
+                        'message': 'Bu mesaj zaten gönderildi.'
+                    }, status=409)
+                
+                # Mesajı veritabanına kaydet
+                message = ContactMessage.objects.create(
+                    name=data.get('name'),
+                    email=data.get('email'),
+                    subject=data.get('subject', ''),
+                    message=data.get('message')
+                )
             
-            # E-posta gönder (isteğe bağlı)
-            try:
-                personal_info = PersonalInfo.objects.first()
-                if personal_info and personal_info.email:
-                    send_mail(
-                        subject=f"Yeni İletişim Mesajı: {data.get('subject', 'Konusuz')}",
-                        message=f"""
-                        Ad Soyad: {data.get('name')}
-                        E-posta: {data.get('email')}
-                        Konu: {data.get('subject', 'Konusuz')}
-                        
-                        Mesaj:
-                        {data.get('message')}
-                        """,
-                        from_email=settings.DEFAULT_FROM_EMAIL,
-                        recipient_list=[personal_info.email],
-                        fail_silently=True,
-                    )
-            except Exception as e:
-                print(f"E-posta gönderme hatası: {e}")
+            # E-posta arka planda gönderilir (bkz. core/mail.py)
+            schedule_dispatch()
             
             return JsonResponse({
                 'success': True,
@@ -184,3 +225,8 @@ def contact_submit(request):
         'success': False,
         'message': 'Geçersiz istek.'
     })
+
+@staff_member_required
+def contact_stats(request):
+    """İletişim formu sayaçları (yalnızca yöneticiler)"""
+    return JsonResponse(ratelimit.counters())
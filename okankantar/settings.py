@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,6 +42,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -54,7 +56,8 @@ ROOT_URLCONF = 'okankantar.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Şablon işleme süresini ölçer (core/instrumentation.py)
+        'BACKEND': 'core.instrumentation.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -62,6 +65,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'core.context_processors.site_context',
             ],
         },
     },
@@ -73,14 +77,129 @@ WSGI_APPLICATION = 'okankantar.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite üretim profili; PRAGMA'lar her yeni bağlantıda çalıştırılır.
+# WAL kipinde okuyucular yazarı, yazar da okuyucuları beklemez; aynı anda
+# yalnızca bir yazar olabilir ve diğerleri busy_timeout süresince sırada
+# bekler ("database is locked" yerine). IMMEDIATE işlemler yazma kilidini en başta
+# alır, böylece okuyan bir işlem sonradan yazmaya geçerken kilitlenmez.
+# Bağlantılar CONN_MAX_AGE saniye açık kalır ve her istek başında yoklanır.
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join((
+                'PRAGMA journal_mode=WAL',
+                # WAL ile güvenli; commit başına fsync yerine checkpoint'te fsync
+                'PRAGMA synchronous=NORMAL',
+                'PRAGMA mmap_size=268435456',  # 256 MB
+                'PRAGMA cache_size=-32000',  # bağlantı başına ~32 MB
+                'PRAGMA temp_store=MEMORY',
+                'PRAGMA busy_timeout=20000',
+            )),
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 'pages' takma adı tam sayfa önbelleğidir; LocMemCache MAX_ENTRIES dolduğunda
+# en az kullanılan kayıtları siler. Süreç içi önbelleklerdeki kayıtlar içerik
+# sürümüyle anahtarlanır; sürüm sayaçları 'shared' takma adında, tüm sunucu
+# süreçleri ve yönetim komutlarınca ortak görülen bir dosya önbelleğinde
+# tutulur (bkz. core/caching.py). Birden fazla sunucuda 'shared' Redis veya
+# Memcached ile değiştirilmelidir.
+
+# core.instrumentation arka uçları Django'nunkilerle aynıdır; yalnızca
+# istek başına isabet / ıskalama sayar
+CACHES = {
+    'default': {
+        'BACKEND': 'core.instrumentation.LocMemCache',
+        'LOCATION': 'okankantar-default',
+    },
+    'pages': {
+        'BACKEND': 'core.instrumentation.LocMemCache',
+        'LOCATION': 'okankantar-pages',
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    },
+    'shared': {
+        # Sürüm sayaçları: incr süreçler arasında atomik olmalı (core.E001)
+        'BACKEND': 'core.caching.SharedFileBasedCache',
+        'LOCATION': BASE_DIR / 'build' / 'cache',
+        'TIMEOUT': None,
+        'OPTIONS': {
+            'MAX_ENTRIES': 1000,
+        },
+    },
+    'ratelimit': {
+        'BACKEND': 'core.instrumentation.LocMemCache',
+        'LOCATION': 'okankantar-ratelimit',
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    },
+}
+
+PAGE_CACHE_ALIAS = 'pages'
+SHARED_CACHE_ALIAS = 'shared'
+
+# Sayfa önbelleği anahtarlarına ve ETag'lere eklenen derleme kimliği; boşsa
+# staticfiles manifest'inin özeti kullanılır. Şablonlar statik dosyalar
+# değişmeden güncellenebildiği için dağıtımda (ör. git commit özeti) verin.
+SITE_BUILD_ID = os.environ.get('SITE_BUILD_ID', '')
+
+
+# Contact mail outbox (core/mail.py)
+# 'thread': mesaj kaydedildikten sonra süreç içinde arka planda gönderilir.
+# 'worker': gönderim yalnızca `manage.py send_contact_mail` ile yapılır.
+
+CONTACT_MAIL_DISPATCH = 'thread'
+CONTACT_MAIL_BATCH_SIZE = 50
+CONTACT_MAIL_MAX_ATTEMPTS = 5
+CONTACT_MAIL_RETRY_DELAY = 60  # saniye, her denemede ikiye katlanır
+
+# Contact form throttling (core/ratelimit.py)
+# IP ve e-posta başına CONTACT_RATE_LIMIT_PERIOD saniyede en fazla
+# CONTACT_RATE_LIMIT_BURST gönderim kabul edilir.
+
+CONTACT_RATE_LIMIT_STORE = 'ratelimit'
+CONTACT_RATE_LIMIT_BURST = 5
+CONTACT_RATE_LIMIT_PERIOD = 3600
+CONTACT_DUPLICATE_WINDOW = 600
+# Vekil sunucu arkasında istemci adresi bu başlıktan okunur (örn.
+# 'HTTP_X_FORWARDED_FOR'); TRUSTED_PROXIES başlığa adres ekleyen vekil sayısı.
+CONTACT_CLIENT_IP_HEADER = None
+CONTACT_TRUSTED_PROXIES = 1
+
+# İstek ölçümü (core/instrumentation.py)
+# Sorgu, şablon ve önbellek ölçümleri /metrics/ histogramlarına işlenir;
+# isteklerin LOG_SAMPLE_RATE kadarı günlüğe yazılır. Server-Timing başlığı
+# ölçümleri herkese gösterir; yalnızca yerelde veya ölçüm için açın.
+INSTRUMENTATION_ENABLED = True
+INSTRUMENTATION_SERVER_TIMING = False
+INSTRUMENTATION_LOG_SAMPLE_RATE = 0.0
+
+# Projeler sayfasında ilk yüklenen ve her kaydırmada eklenen kart sayısı
+PROJECTS_PAGE_SIZE = 12
+
+# Kategori sayıları kayıtlarda artırılıp azaltılır; sinyal çalıştırmayan
+# toplu yazımlardan kalan hatalar en geç bu süre sonunda düzelir (saniye)
+PROJECT_CATEGORY_COUNT_TIMEOUT = 60 * 60
+
+# Salt okunur JSON API (core/api.py)
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+API_CACHE_TIMEOUT = 3600
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -119,11 +238,45 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_FINDERS = [
+    'django.contrib.staticfiles.finders.FileSystemFinder',
+    'django.contrib.staticfiles.finders.AppDirectoriesFinder',
+    'core.assets.BundleFinder',
+]
+
+# Küçültülmüş CSS/JS paketleri (core/assets.py)
+STATIC_BUNDLE_ROOT = BASE_DIR / 'build' / 'static'
+STATIC_BUNDLES = {
+    'bundles/base.css': ['css/style.css', 'css/animations.css'],
+    'bundles/base.js': ['js/main.js', 'js/animations.js'],
+    'bundles/home.css': ['css/home.css'],
+    'bundles/home.js': ['js/home.js', 'js/mountain-animation.js'],
+}
+
+# Canlıda collectstatic dosya adlarına içerik özeti ekler (base.3f2a9c1b7d4e.css)
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'django.contrib.staticfiles.storage.ManifestStaticFilesStorage'
+        ),
+    },
+}
 
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Responsive image derivatives (core/images.py)
+IMAGE_DERIVATIVES_ENABLED = True
+IMAGE_DERIVATIVE_WIDTHS = (320, 640, 960, 1280, 1920)
+IMAGE_DERIVATIVE_FORMATS = ('avif', 'webp', 'jpeg')
+IMAGE_MANIFEST_MISS_TIMEOUT = 60  # türevi olmayan görseller için, saniye
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 